@@ -2,6 +2,14 @@
 
 from __future__ import annotations
 
+import importlib
+from typing import TYPE_CHECKING
+
+from x_make_common_x.board_query import BoardPage, BoardQueryIndex, board_query_index
+from x_make_common_x.board_search import BoardSearchIndex
+from x_make_common_x.board_sync import BoardDiff as JsonBoardDiff
+from x_make_common_x.board_sync import BoardDiffConflictError, diff_boards
+from x_make_common_x.board_sync import apply_diff as apply_board_diff
 from x_make_common_x.copilot_normalizer import (
     DEFAULT_PERSONA_PROMPT,
     PersonaPromptError,
@@ -47,9 +55,65 @@ from x_make_common_x.json_board import (
 from x_make_common_x.json_board import (
     save_board as save_json_board,
 )
-from x_make_common_x.json_contracts import validate_payload, validate_schema
-from x_make_common_x.ledger import LedgerEvent, LedgerWriter
+from x_make_common_x.json_contracts import (
+    CompiledContract,
+    ContractViolation,
+    SchemaRegistry,
+    ValidationMemo,
+    ValidatorCache,
+    compile_contract,
+    compile_validator,
+    schema_fingerprint,
+    validate_jsonl,
+    validate_many,
+    validate_payload,
+    validate_schema,
+)
+from x_make_common_x.ledger import (
+    BufferedLedgerWriter,
+    LedgerEvent,
+    LedgerFlushPolicy,
+    LedgerWriter,
+)
 from x_make_common_x.ledger import append_event as ledger_append_event
+from x_make_common_x.ledger_compression import (
+    CompressedLedgerReader,
+    LedgerBlock,
+    compress_ledger,
+)
+from x_make_common_x.ledger_follow import LedgerCursor, LedgerFollower
+from x_make_common_x.ledger_index import (
+    EventTypeIndex,
+    LedgerIndexPoint,
+    SparseLedgerIndex,
+)
+from x_make_common_x.ledger_merkle import (
+    LedgerConsistencyProof,
+    LedgerInclusionProof,
+    LedgerMerkleCheckpoint,
+    LedgerMerkleLog,
+    verify_consistency,
+    verify_inclusion,
+)
+from x_make_common_x.ledger_reader import (
+    LedgerAudit,
+    LedgerReader,
+    LedgerRecord,
+    verify_ledger,
+)
+from x_make_common_x.ledger_segments import (
+    LedgerManifest,
+    LedgerRotationPolicy,
+    LedgerSegment,
+    SegmentedLedgerReader,
+    SegmentedLedgerWriter,
+    compress_sealed_segments,
+)
+from x_make_common_x.ledger_verify import (
+    LedgerCheckpoint,
+    LedgerVerificationError,
+    LedgerVerifier,
+)
 from x_make_common_x.persona_vetting import (
     PersonaEvidence,
     PersonaVettingError,
@@ -66,10 +130,16 @@ from x_make_common_x.progress_snapshot import (
 from x_make_common_x.run_reports import (
     REPORTS_DIR_NAME,
     TIMESTAMP_FILENAME_FORMAT,
+    RunReportCatalog,
+    RunReportEntry,
     ensure_reports_dir,
     isoformat_timestamp,
+    latest_run_report,
+    run_report_catalog,
+    run_reports_between,
     write_run_report,
 )
+from x_make_common_x.sqlite_board import SqliteBoardState
 from x_make_common_x.stage_progress import (
     RepoProgressReporter,
     StageProgressEntry,
@@ -84,23 +154,59 @@ from x_make_common_x.x_http_client_x import HttpClient, HttpError, HttpResponse
 from x_make_common_x.x_logging_utils_x import get_logger, log_debug, log_error, log_info
 from x_make_common_x.x_subprocess_utils_x import CommandError, run_command
 
+if TYPE_CHECKING:
+    from x_make_common_x.ledger_async import AsyncLedgerWriter
+
+# Exports whose modules pull in heavy stdlib packages (asyncio) that most
+# callers never use; they are imported on first attribute access.
+_LAZY_EXPORTS = {"AsyncLedgerWriter": "x_make_common_x.ledger_async"}
+
 __all__ = [
     "DEFAULT_PERSONA_PROMPT",
     "DETECT_DEFAULT_EXCLUDE_DIRS",
     "DETECT_DEFAULT_NAME_PATTERNS",
     "REPORTS_DIR_NAME",
     "TIMESTAMP_FILENAME_FORMAT",
+    "AsyncLedgerWriter",
+    "BoardDiffConflictError",
+    "BoardPage",
+    "BoardQueryIndex",
+    "BoardSearchIndex",
+    "BufferedLedgerWriter",
     "CommandError",
     "CommandRunner",
+    "CompiledContract",
+    "CompressedLedgerReader",
+    "ContractViolation",
     "EntryPointCandidate",
     "EntryPointDiscovery",
+    "EventTypeIndex",
     "ExportResult",
     "HttpClient",
     "HttpError",
     "HttpResponse",
+    "JsonBoardDiff",
     "JsonBoardState",
     "JsonCardRecord",
+    "LedgerAudit",
+    "LedgerBlock",
+    "LedgerCheckpoint",
+    "LedgerConsistencyProof",
+    "LedgerCursor",
     "LedgerEvent",
+    "LedgerFlushPolicy",
+    "LedgerFollower",
+    "LedgerInclusionProof",
+    "LedgerIndexPoint",
+    "LedgerManifest",
+    "LedgerMerkleCheckpoint",
+    "LedgerMerkleLog",
+    "LedgerReader",
+    "LedgerRecord",
+    "LedgerRotationPolicy",
+    "LedgerSegment",
+    "LedgerVerificationError",
+    "LedgerVerifier",
     "LedgerWriter",
     "PersonaEvidence",
     "PersonaPromptError",
@@ -110,10 +216,26 @@ __all__ = [
     "ProgressStage",
     "ProgressStatus",
     "RepoProgressReporter",
+    "RunReportCatalog",
+    "RunReportEntry",
+    "SchemaRegistry",
+    "SegmentedLedgerReader",
+    "SegmentedLedgerWriter",
+    "SparseLedgerIndex",
+    "SqliteBoardState",
     "StageProgressEntry",
     "StageProgressWriter",
+    "ValidationMemo",
+    "ValidatorCache",
+    "apply_board_diff",
     "board_from_records",
+    "board_query_index",
+    "compile_contract",
+    "compile_validator",
+    "compress_ledger",
+    "compress_sealed_segments",
     "create_progress_snapshot",
+    "diff_boards",
     "dump_board",
     "ensure_reports_dir",
     "ensure_workspace_on_syspath",
@@ -128,6 +250,7 @@ __all__ = [
     "get_env_str",
     "get_logger",
     "isoformat_timestamp",
+    "latest_run_report",
     "ledger_append_event",
     "load_json_board",
     "load_progress_snapshot",
@@ -135,13 +258,31 @@ __all__ = [
     "log_error",
     "log_info",
     "run_command",
+    "run_report_catalog",
+    "run_reports_between",
     "save_json_board",
     "scan_python_entrypoints",
+    "schema_fingerprint",
     "score_from_answer",
     "source_from_response",
     "synopsis_from_answer",
+    "validate_jsonl",
+    "validate_many",
     "validate_payload",
     "validate_schema",
+    "verify_consistency",
+    "verify_inclusion",
+    "verify_ledger",
     "write_progress_snapshot",
     "write_run_report",
 ]
+
+
+def __getattr__(name: str) -> object:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,279 @@
+"""Paginated, filtered queries over a ``BoardState`` without per-request sorts."""
+
+from __future__ import annotations
+
+import bisect
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Literal
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator, Mapping, Sequence
+    from datetime import datetime
+
+    from x_make_common_x.json_board import BoardState, CardRecord
+
+__all__ = ["BoardPage", "BoardQueryIndex", "SortKey", "board_query_index"]
+
+SortKey = Literal["updated_at", "created_at"]
+_SORT_KEYS: tuple[SortKey, ...] = ("updated_at", "created_at")
+_CURSOR_SEPARATOR = "|"
+# Below this many cards a batch is cheaper to bisect in than to re-sort.
+_BATCH_RESORT_THRESHOLD = 16
+
+_OrderKey = tuple[float, str]
+
+
+@dataclass(slots=True, frozen=True)
+class BoardPage:
+    cards: tuple[CardRecord, ...]
+    next_cursor: str | None
+
+
+@dataclass(slots=True, frozen=True)
+class _CardKeys:
+    status: str
+    updated_at: float
+    created_at: float
+
+    def order_key(self, sort: SortKey, card_id: str) -> _OrderKey:
+        return (getattr(self, sort), card_id)
+
+
+def _encode_cursor(key: _OrderKey) -> str:
+    return f"{key[0]!r}{_CURSOR_SEPARATOR}{key[1]}"
+
+
+def _decode_cursor(cursor: str) -> _OrderKey:
+    stamp, separator, card_id = cursor.partition(_CURSOR_SEPARATOR)
+    msg = f"invalid board cursor: {cursor!r}"
+    if not separator:
+        raise ValueError(msg)
+    try:
+        return (float(stamp), card_id)
+    except ValueError as exc:
+        raise ValueError(msg) from exc
+
+
+class BoardQueryIndex:
+    """Sorted ``(timestamp, card_id)`` orderings maintained as a board observer.
+
+    One ordering per sort key is kept for the whole board and for each status,
+    so a page is served by bisecting to the cursor and scanning forward.
+    """
+
+    def __init__(self, board: BoardState) -> None:
+        self._board = board
+        self._keys: dict[str, _CardKeys] = {}
+        self._orders: dict[SortKey, list[_OrderKey]] = {key: [] for key in _SORT_KEYS}
+        self._status_orders: dict[str, dict[SortKey, list[_OrderKey]]] = {}
+        self.cards_stored(list(board.cards.values()))
+        board.observers.append(self)
+
+    def _status_order(self, status: str) -> dict[SortKey, list[_OrderKey]]:
+        orders = self._status_orders.get(status)
+        if orders is None:
+            orders = self._status_orders[status] = {key: [] for key in _SORT_KEYS}
+        return orders
+
+    def card_stored(self, record: CardRecord) -> None:
+        keys = _CardKeys(
+            status=record.status,
+            updated_at=record.updated_at.timestamp(),
+            created_at=record.created_at.timestamp(),
+        )
+        previous = self._keys.get(record.card_id)
+        if previous == keys:
+            return
+        if previous is not None:
+            self._unindex(record.card_id, previous)
+        self._keys[record.card_id] = keys
+        status_orders = self._status_order(keys.status)
+        for sort in _SORT_KEYS:
+            order_key = keys.order_key(sort, record.card_id)
+            bisect.insort(self._orders[sort], order_key)
+            bisect.insort(status_orders[sort], order_key)
+
+    def card_removed(self, record: CardRecord) -> None:
+        previous = self._keys.pop(record.card_id, None)
+        if previous is not None:
+            self._unindex(record.card_id, previous)
+
+    def cards_stored(self, records: Sequence[CardRecord]) -> None:
+        """Index a bulk write with one filter-and-sort pass per ordering."""
+
+        if len(records) < _BATCH_RESORT_THRESHOLD:
+            for record in records:
+                self.card_stored(record)
+            return
+        latest = {
+            record.card_id: _CardKeys(
+                status=record.status,
+                updated_at=record.updated_at.timestamp(),
+                created_at=record.created_at.timestamp(),
+            )
+            for record in records
+        }
+        changed: dict[str, _CardKeys] = {}
+        stale: dict[str, _CardKeys] = {}
+        for card_id, keys in latest.items():
+            previous = self._keys.get(card_id)
+            if previous == keys:
+                continue
+            if previous is not None:
+                stale[card_id] = previous
+            changed[card_id] = keys
+        if not changed:
+            return
+        self._rebuild(stale, changed)
+        self._keys.update(changed)
+
+    def cards_removed(self, records: Sequence[CardRecord]) -> None:
+        if len(records) < _BATCH_RESORT_THRESHOLD:
+            for record in records:
+                self.card_removed(record)
+            return
+        stale = {
+            record.card_id: previous
+            for record in records
+            if (previous := self._keys.pop(record.card_id, None)) is not None
+        }
+        if stale:
+            self._rebuild(stale, {})
+
+    def _rebuild(
+        self, stale: Mapping[str, _CardKeys], fresh: Mapping[str, _CardKeys]
+    ) -> None:
+        """Drop *stale* entries and merge *fresh* ones into every touched order."""
+
+        statuses = {keys.status for keys in stale.values()}
+        statuses.update(keys.status for keys in fresh.values())
+        scopes: list[tuple[str | None, dict[SortKey, list[_OrderKey]]]] = [
+            (None, self._orders)
+        ]
+        scopes.extend((status, self._status_order(status)) for status in statuses)
+        for status, orders in scopes:
+            dropped = {
+                card_id
+                for card_id, keys in stale.items()
+                if status is None or keys.status == status
+            }
+            added = [
+                (card_id, keys)
+                for card_id, keys in fresh.items()
+                if status is None or keys.status == status
+            ]
+            for sort in _SORT_KEYS:
+                order = orders[sort]
+                if dropped:
+                    order[:] = [key for key in order if key[1] not in dropped]
+                order.extend(keys.order_key(sort, card_id) for card_id, keys in added)
+                order.sort()
+        for status in statuses:
+            if not self._status_orders[status]["updated_at"]:
+                del self._status_orders[status]
+
+    def _unindex(self, card_id: str, keys: _CardKeys) -> None:
+        status_orders = self._status_orders[keys.status]
+        for sort in _SORT_KEYS:
+            order_key = keys.order_key(sort, card_id)
+            for order in (self._orders[sort], status_orders[sort]):
+                position = bisect.bisect_left(order, order_key)
+                del order[position]
+        if not status_orders["updated_at"]:
+            del self._status_orders[keys.status]
+
+    def _scan(
+        self,
+        order: list[_OrderKey],
+        *,
+        lower: float | None,
+        upper: float | None,
+        after: _OrderKey | None,
+        descending: bool,
+    ) -> Iterator[_OrderKey]:
+        if descending:
+            end = len(order) if after is None else bisect.bisect_left(order, after)
+            if upper is not None:
+                end = min(end, bisect.bisect_left(order, (upper, "")))
+            for position in range(end - 1, -1, -1):
+                key = order[position]
+                if lower is not None and key[0] < lower:
+                    return
+                yield key
+            return
+        start = 0 if after is None else bisect.bisect_right(order, after)
+        if lower is not None:
+            start = max(start, bisect.bisect_left(order, (lower, "")))
+        for position in range(start, len(order)):
+            key = order[position]
+            if upper is not None and key[0] >= upper:
+                return
+            yield key
+
+    def query(  # noqa: PLR0913 - explicit keyword filters aid callsites
+        self,
+        *,
+        status: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        text: str | None = None,
+        predicate: Callable[[CardRecord], bool] | None = None,
+        sort: SortKey = "updated_at",
+        descending: bool = False,
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> BoardPage:
+        """Return one page of cards ordered by *sort*.
+
+        ``since``/``until`` bound the sort timestamp (inclusive/exclusive),
+        ``text`` is a case-insensitive substring of title or description, and
+        ``cursor`` is the ``next_cursor`` of the previous page.
+        """
+
+        if sort not in _SORT_KEYS:
+            msg = f"unsupported board sort key: {sort}"
+            raise ValueError(msg)
+        if limit <= 0:
+            msg = "board page limit must be positive"
+            raise ValueError(msg)
+        if status is None:
+            order = self._orders[sort]
+        else:
+            order = self._status_orders.get(status, {}).get(sort, [])
+        needle = text.casefold() if text else None
+        cards = self._board.cards
+        page: list[CardRecord] = []
+        page_keys: list[_OrderKey] = []
+        for key in self._scan(
+            order,
+            lower=since.timestamp() if since is not None else None,
+            upper=until.timestamp() if until is not None else None,
+            after=_decode_cursor(cursor) if cursor else None,
+            descending=descending,
+        ):
+            record = cards[key[1]]
+            if needle is not None and not _matches_text(record, needle):
+                continue
+            if predicate is not None and not predicate(record):
+                continue
+            if len(page) == limit:
+                cursor_out = _encode_cursor(page_keys[-1])
+                return BoardPage(cards=tuple(page), next_cursor=cursor_out)
+            page.append(record)
+            page_keys.append(key)
+        return BoardPage(cards=tuple(page), next_cursor=None)
+
+
+def _matches_text(record: CardRecord, needle: str) -> bool:
+    if needle in record.title.casefold():
+        return True
+    return record.description is not None and needle in record.description.casefold()
+
+
+def board_query_index(board: BoardState) -> BoardQueryIndex:
+    """Return the query index attached to *board*, creating it on first use."""
+
+    for observer in board.observers:
+        if isinstance(observer, BoardQueryIndex):
+            return observer
+    return BoardQueryIndex(board)
@@ -0,0 +1,150 @@
+"""Inverted full-text index over JSON board card titles and descriptions."""
+
+from __future__ import annotations
+
+import bisect
+import heapq
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from x_make_common_x.json_board import BoardState, CardRecord
+
+__all__ = ["BoardSearchIndex", "SearchHit", "tokenize"]
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+_TITLE_WEIGHT = 2
+
+
+def tokenize(text: str | None) -> list[str]:
+    """Split *text* into lowercase word tokens."""
+
+    if not text:
+        return []
+    return _TOKEN_PATTERN.findall(text.casefold())
+
+
+@dataclass(slots=True, frozen=True)
+class SearchHit:
+    card_id: str
+    score: float
+
+
+class BoardSearchIndex:
+    """Token and prefix search kept current by the attached ``BoardState``.
+
+    Postings map each token to per-card weighted term frequencies (title tokens
+    count double); a sorted vocabulary answers prefix queries via bisection.
+    """
+
+    def __init__(self, board: BoardState | None = None) -> None:
+        self._postings: dict[str, dict[str, int]] = {}
+        self._documents: dict[str, Counter[str]] = {}
+        self._vocabulary: list[str] = []
+        if board is not None:
+            self.attach(board)
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def attach(self, board: BoardState) -> None:
+        """Index every card on *board* and follow its future mutations."""
+
+        self.cards_stored(list(board.cards.values()))
+        board.observers.append(self)
+
+    def card_stored(self, record: CardRecord) -> None:
+        weights: Counter[str] = Counter()
+        for token in tokenize(record.title):
+            weights[token] += _TITLE_WEIGHT
+        for token in tokenize(record.description):
+            weights[token] += 1
+        previous = self._documents.get(record.card_id)
+        if previous == weights:
+            return
+        if previous is not None:
+            self._unindex(record.card_id, previous)
+        self._documents[record.card_id] = weights
+        for token, weight in weights.items():
+            postings = self._postings.get(token)
+            if postings is None:
+                postings = self._postings[token] = {}
+                bisect.insort(self._vocabulary, token)
+            postings[record.card_id] = weight
+
+    def card_removed(self, record: CardRecord) -> None:
+        previous = self._documents.pop(record.card_id, None)
+        if previous is not None:
+            self._unindex(record.card_id, previous)
+
+    def cards_stored(self, records: Sequence[CardRecord]) -> None:
+        # Postings are dicts, so per-card maintenance is already O(tokens).
+        for record in records:
+            self.card_stored(record)
+
+    def cards_removed(self, records: Sequence[CardRecord]) -> None:
+        for record in records:
+            self.card_removed(record)
+
+    def _unindex(self, card_id: str, weights: Counter[str]) -> None:
+        for token in weights:
+            postings = self._postings.get(token)
+            if postings is None:
+                continue
+            postings.pop(card_id, None)
+            if not postings:
+                del self._postings[token]
+                position = bisect.bisect_left(self._vocabulary, token)
+                del self._vocabulary[position]
+
+    def _expand(self, term: str, *, prefix: bool) -> list[str]:
+        if not prefix:
+            return [term] if term in self._postings else []
+        start = bisect.bisect_left(self._vocabulary, term)
+        matches: list[str] = []
+        for token in self._vocabulary[start:]:
+            if not token.startswith(term):
+                break
+            matches.append(token)
+        return matches
+
+    def search(
+        self, query: str, *, limit: int = 20, prefix: bool = False
+    ) -> list[SearchHit]:
+        """Return cards containing every query term, best TF-IDF score first.
+
+        With ``prefix=True`` each query term matches any token it starts.
+        """
+
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms or limit <= 0:
+            return []
+        total = len(self._documents)
+        per_term: list[dict[str, float]] = []
+        for term in terms:
+            scores: dict[str, float] = {}
+            for token in self._expand(term, prefix=prefix):
+                postings = self._postings[token]
+                idf = math.log(1 + total / len(postings))
+                for card_id, weight in postings.items():
+                    scores[card_id] = scores.get(card_id, 0.0) + weight * idf
+            if not scores:
+                return []
+            per_term.append(scores)
+        per_term.sort(key=len)
+        candidates = per_term[0]
+        for scores in per_term[1:]:
+            candidates = {
+                card_id: score + scores[card_id]
+                for card_id, score in candidates.items()
+                if card_id in scores
+            }
+            if not candidates:
+                return []
+        best = heapq.nlargest(limit, candidates.items(), key=lambda item: item[1])
+        return [SearchHit(card_id=card_id, score=score) for card_id, score in best]
@@ -0,0 +1,153 @@
+"""Diff and patch helpers for synchronising JSON boards between hosts."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field, replace
+from typing import TYPE_CHECKING, cast
+
+from x_make_common_x.json_board import BoardState, CardRecord, load_board
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+__all__ = [
+    "BoardDiff",
+    "BoardDiffConflictError",
+    "apply_diff",
+    "card_digest",
+    "diff_boards",
+]
+
+
+class BoardDiffConflictError(ValueError):
+    """Raised when a diff does not match the board it is applied to."""
+
+    def __init__(self, conflicts: Sequence[str]) -> None:
+        super().__init__("board diff conflicts: " + "; ".join(conflicts))
+        self.conflicts = tuple(conflicts)
+
+
+def card_digest(record: CardRecord) -> str:
+    """Return a stable content hash covering every serialized card field."""
+
+    serialized = json.dumps(record.to_json(), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+@dataclass(slots=True, frozen=True)
+class BoardDiff:
+    """Cards to add, change, and remove to turn one board into another."""
+
+    added: tuple[CardRecord, ...] = field(default_factory=tuple)
+    changed: tuple[CardRecord, ...] = field(default_factory=tuple)
+    removed: tuple[str, ...] = field(default_factory=tuple)
+
+    def is_empty(self) -> bool:
+        return not (self.added or self.changed or self.removed)
+
+    def to_json(self) -> dict[str, object]:
+        return {
+            "added": [card.to_json() for card in self.added],
+            "changed": [card.to_json() for card in self.changed],
+            "removed": list(self.removed),
+        }
+
+    @classmethod
+    def from_json(cls, payload: Mapping[str, object]) -> BoardDiff:
+        return cls(
+            added=_records_from(payload.get("added")),
+            changed=_records_from(payload.get("changed")),
+            removed=_ids_from(payload.get("removed")),
+        )
+
+
+def _records_from(value: object) -> tuple[CardRecord, ...]:
+    if value is None:
+        return ()
+    if not isinstance(value, Sequence) or isinstance(value, (str, bytes, bytearray)):
+        msg = "Board diff card sections must be lists of card objects"
+        raise TypeError(msg)
+    records: list[CardRecord] = []
+    for entry in cast("Sequence[object]", value):
+        if not isinstance(entry, Mapping):
+            msg = "Board diff card sections must be lists of card objects"
+            raise TypeError(msg)
+        records.append(CardRecord.from_json(cast("Mapping[str, object]", entry)))
+    return tuple(records)
+
+
+def _ids_from(value: object) -> tuple[str, ...]:
+    if value is None:
+        return ()
+    if not isinstance(value, Sequence) or isinstance(value, (str, bytes, bytearray)):
+        msg = "Board diff 'removed' section must be a list of card ids"
+        raise TypeError(msg)
+    return tuple(str(entry) for entry in cast("Sequence[object]", value))
+
+
+def _as_state(board: BoardState | Path | str) -> BoardState:
+    if isinstance(board, BoardState):
+        return board
+    return load_board(board)
+
+
+def diff_boards(
+    source: BoardState | Path | str, target: BoardState | Path | str
+) -> BoardDiff:
+    """Compute the changes that turn *source* into *target* in linear time."""
+
+    source_state = _as_state(source)
+    target_state = _as_state(target)
+    source_cards = source_state.cards
+    added: list[CardRecord] = []
+    changed: list[CardRecord] = []
+    for key, record in target_state.cards.items():
+        original = source_cards.get(key)
+        if original is None:
+            added.append(record)
+        elif card_digest(original) != card_digest(record):
+            changed.append(record)
+    target_cards = target_state.cards
+    removed = [key for key in source_cards if key not in target_cards]
+    return BoardDiff(added=tuple(added), changed=tuple(changed), removed=tuple(removed))
+
+
+def _conflicts(state: BoardState, diff: BoardDiff) -> list[str]:
+    cards = state.cards
+    conflicts = [
+        f"added card already exists: {record.card_id}"
+        for record in diff.added
+        if record.card_id in cards
+    ]
+    conflicts.extend(
+        f"changed card not found: {record.card_id}"
+        for record in diff.changed
+        if record.card_id not in cards
+    )
+    conflicts.extend(
+        f"removed card not found: {card_id}"
+        for card_id in diff.removed
+        if card_id not in cards
+    )
+    return conflicts
+
+
+def apply_diff(state: BoardState, diff: BoardDiff) -> BoardState:
+    """Apply *diff* to *state* in place, keeping the diff's timestamps verbatim.
+
+    The diff must have been computed against this board: added cards must be
+    absent and changed or removed cards present. Otherwise nothing is applied
+    and ``BoardDiffConflictError`` lists every mismatch. Cards are stored as
+    copies, so the diff and the source board never share records with *state*.
+    """
+
+    conflicts = _conflicts(state, diff)
+    if conflicts:
+        raise BoardDiffConflictError(conflicts)
+    state.remove_many(diff.removed)
+    for record in (*diff.added, *diff.changed):
+        state.restore(replace(record))
+    return state
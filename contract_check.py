@@ -0,0 +1,165 @@
+"""Validate a JSONL file (or stdin) against a JSON Schema, line by line."""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import importlib
+import json
+import sys
+import time
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, TextIO, cast
+
+from x_make_common_x.json_contracts import (
+    DEFAULT_BATCH_CHUNK_SIZE,
+    ContractViolation,
+    validate_jsonl,
+    validate_schema,
+)
+
+__all__ = ["ContractCheckSummary", "check_jsonl"]
+
+_EXIT_INVALID = 1
+_EXIT_USAGE = 2
+
+
+@dataclass(slots=True, frozen=True)
+class ContractCheckSummary:
+    """Totals for one streaming validation run."""
+
+    lines: int
+    invalid: int
+    seconds: float
+
+    @property
+    def lines_per_second(self) -> float:
+        return self.lines / self.seconds if self.seconds > 0 else float(self.lines)
+
+    def to_payload(self) -> dict[str, object]:
+        return {
+            "lines": self.lines,
+            "invalid": self.invalid,
+            "seconds": round(self.seconds, 3),
+            "lines_per_second": round(self.lines_per_second),
+        }
+
+
+class _LineCounter:
+    """Pass lines through while counting them, without buffering."""
+
+    def __init__(self, lines: Iterable[bytes]) -> None:
+        self._lines = lines
+        self.count = 0
+
+    def __iter__(self) -> Iterator[bytes]:
+        for line in self._lines:
+            self.count += 1
+            yield line
+
+
+def _format_violation(line_number: int, violation: ContractViolation) -> str:
+    location = "/".join(str(part) for part in violation.path) or "<root>"
+    return f"line {line_number}: {location}: {violation.message}"
+
+
+def check_jsonl(  # noqa: PLR0913 - mirrors the command-line options
+    source: BinaryIO,
+    schema: Mapping[str, object],
+    *,
+    out: TextIO,
+    fail_fast: bool = False,
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_BATCH_CHUNK_SIZE,
+) -> ContractCheckSummary:
+    """Stream *source* through ``validate_jsonl``, writing one line per error.
+
+    With ``fail_fast`` the summary counts lines up to the first invalid one,
+    not lines that were read ahead but never validated.
+    """
+
+    counter = _LineCounter(source)
+    invalid = 0
+    last_line = 0
+    started = time.perf_counter()
+    for line_number, violations in validate_jsonl(
+        counter, schema, fail_fast=fail_fast, workers=workers, chunk_size=chunk_size
+    ):
+        invalid += 1
+        last_line = line_number
+        out.writelines(
+            _format_violation(line_number, violation) + "\n" for violation in violations
+        )
+    return ContractCheckSummary(
+        lines=last_line if fail_fast and invalid else counter.count,
+        invalid=invalid,
+        seconds=time.perf_counter() - started,
+    )
+
+
+def _load_schema(path: Path) -> dict[str, object]:
+    payload: object = json.loads(path.read_text(encoding="utf-8"))
+    if not isinstance(payload, Mapping):
+        msg = f"{path}: schema JSON must be an object"
+        raise TypeError(msg)
+    return dict(cast("Mapping[str, object]", payload))
+
+
+def _schema_error_type() -> type[Exception]:
+    module = importlib.import_module("jsonschema.exceptions")
+    return cast("type[Exception]", module.SchemaError)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("schema", type=Path, help="JSON Schema file")
+    parser.add_argument(
+        "input", nargs="?", default="-", help="JSONL file, or '-' for stdin"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=None, help="worker processes (default: CPUs)"
+    )
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_BATCH_CHUNK_SIZE)
+    parser.add_argument(
+        "--fail-fast", action="store_true", help="stop at the first invalid line"
+    )
+    args = parser.parse_args(argv)
+    schema_error = _schema_error_type()
+    try:
+        schema = _load_schema(args.schema)
+        validate_schema(schema)
+    except schema_error as exc:
+        reason = getattr(exc, "message", exc)
+        sys.stderr.write(f"error: {args.schema}: invalid schema: {reason}\n")
+        return _EXIT_USAGE
+    except (OSError, TypeError, ValueError) as exc:
+        sys.stderr.write(f"error: {exc}\n")
+        return _EXIT_USAGE
+    with contextlib.ExitStack() as stack:
+        if args.input == "-":
+            source = sys.stdin.buffer
+        else:
+            try:
+                source = stack.enter_context(Path(args.input).open("rb"))
+            except OSError as exc:
+                sys.stderr.write(f"error: {exc}\n")
+                return _EXIT_USAGE
+        summary = check_jsonl(
+            source,
+            schema,
+            out=sys.stdout,
+            fail_fast=args.fail_fast,
+            workers=args.workers,
+            chunk_size=args.chunk_size,
+        )
+    sys.stderr.write(
+        f"checked {summary.lines} lines in {summary.seconds:.2f}s "
+        f"({summary.lines_per_second:,.0f} lines/s), {summary.invalid} invalid\n"
+    )
+    return _EXIT_INVALID if summary.invalid else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -4,13 +4,23 @@ from __future__ import annotations
 
 import contextlib
 import json
-from collections.abc import Iterable, Mapping
+from collections.abc import Iterable, Mapping, Sequence
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import cast
+from typing import Literal, Protocol, cast
 
-__all__ = ["BoardState", "CardRecord", "dump_board", "load_board", "save_board"]
+BulkOutcome = Literal["inserted", "updated", "unchanged", "removed", "missing"]
+
+__all__ = [
+    "BoardObserver",
+    "BoardState",
+    "BulkOutcome",
+    "CardRecord",
+    "dump_board",
+    "load_board",
+    "save_board",
+]
 
 
 @dataclass(slots=True)
@@ -68,15 +78,71 @@ def _coerce_timestamp(value: object) -> datetime:
     return datetime.now(UTC)
 
 
+class BoardObserver(Protocol):
+    """Secondary structure kept current by ``BoardState`` mutations.
+
+    Bulk operations call ``cards_stored``/``cards_removed`` once per call, so
+    observers can do one maintenance pass; a batch may repeat a card id, in
+    which case the last record is current.
+    """
+
+    def card_stored(self, record: CardRecord) -> None: ...
+
+    def card_removed(self, record: CardRecord) -> None: ...
+
+    def cards_stored(self, records: Sequence[CardRecord]) -> None: ...
+
+    def cards_removed(self, records: Sequence[CardRecord]) -> None: ...
+
+
 def _empty_board() -> dict[str, CardRecord]:
     return {}
 
 
+def _empty_observers() -> list[BoardObserver]:
+    return []
+
+
+def _same_content(left: CardRecord, right: CardRecord) -> bool:
+    return (
+        left.title == right.title
+        and left.status == right.status
+        and left.description == right.description
+    )
+
+
 @dataclass(slots=True)
 class BoardState:
     """In-memory board where mutations are mirrored back into JSON."""
 
     cards: dict[str, CardRecord] = field(default_factory=_empty_board)
+    observers: list[BoardObserver] = field(
+        default_factory=_empty_observers, compare=False, repr=False
+    )
+
+    def _store(self, record: CardRecord) -> None:
+        self.cards[record.card_id] = record
+        for observer in self.observers:
+            observer.card_stored(record)
+
+    def _store_many(self, records: Sequence[CardRecord]) -> None:
+        for record in records:
+            self.cards[record.card_id] = record
+        if records:
+            for observer in self.observers:
+                observer.cards_stored(records)
+
+    def _drop(self, card_id: str) -> CardRecord | None:
+        removed = self.cards.pop(card_id, None)
+        if removed is not None:
+            for observer in self.observers:
+                observer.card_removed(removed)
+        return removed
+
+    def restore(self, record: CardRecord) -> None:
+        """Store *record* verbatim, keeping its timestamps (loads and patches)."""
+
+        self._store(record)
 
     def add(self, record: CardRecord) -> None:
         key = record.card_id
@@ -86,7 +152,7 @@ class BoardState:
         now = datetime.now(UTC)
         record.created_at = now
         record.updated_at = now
-        self.cards[key] = record
+        self._store(record)
 
     def update(self, record: CardRecord) -> None:
         key = record.card_id
@@ -96,14 +162,78 @@ class BoardState:
         original = self.cards[key]
         record.created_at = original.created_at
         record.updated_at = datetime.now(UTC)
-        self.cards[key] = record
+        self._store(record)
 
     def remove(self, card_id: str) -> CardRecord:
-        try:
-            return self.cards.pop(card_id)
-        except KeyError as exc:  # pragma: no cover - defensive barrier
+        removed = self._drop(card_id)
+        if removed is None:  # pragma: no cover - defensive barrier
             msg = f"card not found: {card_id}"
-            raise ValueError(msg) from exc
+            raise ValueError(msg)
+        return removed
+
+    def add_many(self, records: Iterable[CardRecord]) -> dict[str, BulkOutcome]:
+        """Insert *records* with a single timestamp; nothing is applied on error."""
+
+        batch = list(records)
+        seen: set[str] = set()
+        for record in batch:
+            key = record.card_id
+            if key in self.cards or key in seen:
+                msg = f"card already exists: {key}"
+                raise ValueError(msg)
+            seen.add(key)
+        now = datetime.now(UTC)
+        outcomes: dict[str, BulkOutcome] = {}
+        for record in batch:
+            record.created_at = now
+            record.updated_at = now
+            outcomes[record.card_id] = "inserted"
+        self._store_many(batch)
+        return outcomes
+
+    def upsert_many(self, records: Iterable[CardRecord]) -> dict[str, BulkOutcome]:
+        """Insert or update *records*, leaving cards with identical content alone."""
+
+        now = datetime.now(UTC)
+        outcomes: dict[str, BulkOutcome] = {}
+        stored: list[CardRecord] = []
+        for record in records:
+            key = record.card_id
+            original = self.cards.get(key)
+            if original is None:
+                record.created_at = now
+                record.updated_at = now
+                outcomes[key] = "inserted"
+            elif _same_content(original, record):
+                outcomes.setdefault(key, "unchanged")
+                continue
+            else:
+                record.created_at = original.created_at
+                record.updated_at = now
+                if outcomes.get(key) != "inserted":
+                    outcomes[key] = "updated"
+            # Later records in the batch compare against this one.
+            self.cards[key] = record
+            stored.append(record)
+        self._store_many(stored)
+        return outcomes
+
+    def remove_many(self, card_ids: Iterable[str]) -> dict[str, BulkOutcome]:
+        """Remove *card_ids*, reporting ids that were not on the board as missing."""
+
+        outcomes: dict[str, BulkOutcome] = {}
+        removed: list[CardRecord] = []
+        for card_id in card_ids:
+            record = self.cards.pop(card_id, None)
+            if record is not None:
+                removed.append(record)
+                outcomes[card_id] = "removed"
+            else:
+                outcomes.setdefault(card_id, "missing")
+        if removed:
+            for observer in self.observers:
+                observer.cards_removed(removed)
+        return outcomes
 
     def list_cards(self) -> list[CardRecord]:
         return list(self.cards.values())
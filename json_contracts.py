@@ -2,27 +2,59 @@
 
 from __future__ import annotations
 
+import copy
+import functools
+import hashlib
 import importlib
-from collections.abc import Mapping, MutableMapping
-from typing import Protocol, cast
+import itertools
+import json
+import numbers
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from collections.abc import Callable, Iterable, Iterator, Mapping, MutableMapping
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Protocol, TypeVar, cast
+
+if TYPE_CHECKING:
+    from pathlib import Path
 
 SchemaMapping = Mapping[str, object]
+_T = TypeVar("_T")
 MutableSchemaMapping = MutableMapping[str, object]
 
 
+class _ValidationErrorLike(Protocol):
+    message: str
+    validator: object
+    absolute_path: Iterable[str | int]
+    absolute_schema_path: Iterable[str | int]
+
+
 class _DraftValidator(Protocol):
     """Subset of the Draft 2020-12 validator API we rely on."""
 
     @classmethod
     def check_schema(cls, schema: Mapping[str, object]) -> None: ...
 
-    def __init__(self, schema: Mapping[str, object]) -> None: ...
+    def __init__(
+        self, schema: Mapping[str, object], *, registry: object = ...
+    ) -> None: ...
 
     def validate(self, payload: object) -> None: ...
 
+    def iter_errors(self, payload: object) -> Iterator[_ValidationErrorLike]: ...
 
+
+@functools.cache
 def _load_draft_validator() -> type[_DraftValidator]:
-    """Resolve the jsonschema Draft 2020-12 validator without requiring stubs."""
+    """Resolve the jsonschema Draft 2020-12 validator without requiring stubs.
+
+    Resolved on first use so importing this package does not pay for
+    importing jsonschema.
+    """
 
     class _ValidatorsModule(Protocol):
         Draft202012Validator: type[_DraftValidator]
@@ -34,22 +66,1000 @@ def _load_draft_validator() -> type[_DraftValidator]:
     return validators_module.Draft202012Validator
 
 
-_DRAFT_VALIDATOR: type[_DraftValidator] = _load_draft_validator()
+class _Registry(Protocol):
+    def with_resources(self, pairs: Iterable[tuple[str, object]]) -> _Registry: ...
+
+    def crawl(self) -> _Registry: ...
+
+
+class _ResourceFactory(Protocol):
+    def from_contents(
+        self, contents: Mapping[str, object], default_specification: object
+    ) -> object: ...
+
+
+@functools.cache
+def _load_referencing() -> tuple[type[_Registry], _ResourceFactory, object]:
+    """Resolve ``referencing`` (a jsonschema dependency) on first use."""
+
+    class _ReferencingModule(Protocol):
+        Registry: type[_Registry]
+        Resource: _ResourceFactory
+
+    class _SpecificationsModule(Protocol):
+        DRAFT202012: object
+
+    referencing = cast("_ReferencingModule", importlib.import_module("referencing"))
+    specifications = cast(
+        "_SpecificationsModule", importlib.import_module("referencing.jsonschema")
+    )
+    return referencing.Registry, referencing.Resource, specifications.DRAFT202012
+
+
+DEFAULT_VALIDATOR_CACHE_SIZE = 128
+
+
+def _json_default(value: object) -> object:
+    if isinstance(value, Mapping):
+        return dict(cast("Mapping[str, object]", value))
+    msg = f"Object of type {type(value).__name__} is not JSON serializable"
+    raise TypeError(msg)
+
+
+def _canonical_digest(value: object) -> str:
+    canonical = json.dumps(
+        value,
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=_json_default,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+_PLAIN_SCALARS = (str, int, float, bool, type(None))
+
+
+def _is_plain_json(value: object) -> bool:
+    """Return whether *value* is built only from exact JSON-native types.
+
+    Subclasses and other containers (tuples, mapping proxies) validate
+    differently yet serialize the same, so they must not share memo keys.
+    """
+
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        kind = type(item)
+        if kind is dict:
+            mapping = cast("dict[object, object]", item)
+            if any(type(key) is not str for key in mapping):
+                return False
+            stack.extend(mapping.values())
+        elif kind is list:
+            stack.extend(cast("list[object]", item))
+        elif kind not in _PLAIN_SCALARS:
+            return False
+    return True
+
+
+def schema_fingerprint(schema: SchemaMapping | MutableSchemaMapping) -> str:
+    """Return a stable digest of *schema*'s canonical JSON form.
+
+    Key order and mapping type do not matter, so equal schemas loaded from
+    different places share one fingerprint.
+    """
+
+    return _canonical_digest(schema)
+
+
+def _snapshot(value: object) -> object:
+    """Copy nested mappings and lists so later edits cannot reach the copy."""
+
+    if isinstance(value, Mapping):
+        mapping = cast("Mapping[object, object]", value)
+        return {key: _snapshot(item) for key, item in mapping.items()}
+    if isinstance(value, list):
+        return [_snapshot(item) for item in cast("list[object]", value)]
+    if isinstance(value, tuple):
+        return tuple(_snapshot(item) for item in cast("tuple[object, ...]", value))
+    return value
+
+
+@dataclass(slots=True, frozen=True)
+class _KnownSchema:
+    schema: object
+    snapshot: object
+    fingerprint: str
+
+
+@dataclass(slots=True)
+class _CompiledSchema:
+    validator: _DraftValidator
+    checked: bool
+
+
+class ValidatorCache:
+    """Thread-safe LRU of compiled validators keyed by schema fingerprint.
+
+    Fingerprints are remembered per schema object, so passing the same
+    schema again costs an equality check against a snapshot instead of a
+    canonical dump and hash; a schema mutated in place is re-fingerprinted.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_VALIDATOR_CACHE_SIZE) -> None:
+        if maxsize <= 0:
+            msg = "validator cache maxsize must be positive"
+            raise ValueError(msg)
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, _CompiledSchema] = OrderedDict()
+        self._known: OrderedDict[int, _KnownSchema] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(
+        self,
+        schema: SchemaMapping | MutableSchemaMapping,
+        *,
+        check_schema: bool = False,
+        fingerprint: str | None = None,
+    ) -> _DraftValidator:
+        """Return the compiled validator for *schema*, compiling on first use.
+
+        With ``check_schema=True`` the schema itself is validated the first
+        time it is requested that way; the result is remembered.
+        """
+
+        key = fingerprint or self.fingerprint(schema)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+        if entry is None:
+            # Copy so later edits to nested schema content cannot change the
+            # cached validator behind its fingerprint.
+            plain = cast("dict[str, object]", _snapshot(schema))
+            if check_schema:
+                _load_draft_validator().check_schema(plain)
+            entry = _CompiledSchema(
+                _load_draft_validator()(plain), checked=check_schema
+            )
+            with self._lock:
+                self.misses += 1
+                self._entries[key] = entry
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+        elif check_schema and not entry.checked:
+            _load_draft_validator().check_schema(dict(schema))
+            entry.checked = True
+        return entry.validator
+
+    def fingerprint(self, schema: SchemaMapping | MutableSchemaMapping) -> str:
+        """Return ``schema_fingerprint(schema)``, reusing it for known objects."""
+
+        with self._lock:
+            known = self._known.get(id(schema))
+        # The entry holds a reference to the schema, so its id cannot have been
+        # reused; the snapshot comparison catches in-place edits.
+        if known is not None and known.schema is schema and known.snapshot == schema:
+            return known.fingerprint
+        fingerprint = schema_fingerprint(schema)
+        with self._lock:
+            self._known[id(schema)] = _KnownSchema(
+                schema, _snapshot(schema), fingerprint
+            )
+            self._known.move_to_end(id(schema))
+            while len(self._known) > self.maxsize:
+                self._known.popitem(last=False)
+        return fingerprint
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._known.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+_VALIDATOR_CACHE = ValidatorCache()
+
+
+def compile_validator(
+    schema: SchemaMapping | MutableSchemaMapping, *, check_schema: bool = False
+) -> _DraftValidator:
+    """Return a cached Draft 2020-12 validator for *schema*.
+
+    Hold on to the result in hot loops: calling ``validate`` on it skips
+    fingerprinting as well as compilation.
+    """
+
+    return _VALIDATOR_CACHE.get(schema, check_schema=check_schema)
+
+
+def validator_cache() -> ValidatorCache:
+    """Return the process-wide cache used by ``validate_payload``."""
+
+    return _VALIDATOR_CACHE
+
+
+@dataclass(slots=True, frozen=True)
+class ContractViolation:
+    """Picklable summary of one ``ValidationError`` for batch results."""
+
+    message: str
+    path: tuple[str | int, ...] = ()
+    schema_path: tuple[str | int, ...] = ()
+    validator: str = ""
+
+    @classmethod
+    def from_error(cls, error: _ValidationErrorLike) -> ContractViolation:
+        return cls(
+            message=error.message,
+            path=tuple(error.absolute_path),
+            schema_path=tuple(error.absolute_schema_path),
+            validator=str(error.validator),
+        )
+
+    def to_json(self) -> dict[str, object]:
+        return {
+            "message": self.message,
+            "path": list(self.path),
+            "schema_path": list(self.schema_path),
+            "validator": self.validator,
+        }
+
+
+PayloadResult = tuple[int, tuple[ContractViolation, ...]]
+DEFAULT_BATCH_CHUNK_SIZE = 1024
+
+
+def _violations_of(
+    validator: _DraftValidator, payload: object, *, fail_fast: bool
+) -> tuple[ContractViolation, ...]:
+    errors = validator.iter_errors(payload)
+    if fail_fast:
+        first = next(errors, None)
+        return () if first is None else (ContractViolation.from_error(first),)
+    return tuple(ContractViolation.from_error(error) for error in errors)
+
+
+def _validate_chunk(
+    schema: dict[str, object],
+    fingerprint: str,
+    start: int,
+    payloads: list[object],
+    *,
+    fail_fast: bool,
+) -> list[PayloadResult]:
+    validator = _VALIDATOR_CACHE.get(schema, fingerprint=fingerprint)
+    results: list[PayloadResult] = []
+    for index, payload in enumerate(payloads, start):
+        violations = _violations_of(validator, payload, fail_fast=fail_fast)
+        if violations:
+            results.append((index, violations))
+            if fail_fast:
+                break
+    return results
+
+
+def _validate_lines_chunk(
+    schema: dict[str, object],
+    fingerprint: str,
+    start: int,
+    lines: list[bytes | str],
+    *,
+    fail_fast: bool,
+) -> list[PayloadResult]:
+    validator = _VALIDATOR_CACHE.get(schema, fingerprint=fingerprint)
+    results: list[PayloadResult] = []
+    for line_number, line in enumerate(lines, start + 1):
+        if not line.strip():
+            continue
+        violations: tuple[ContractViolation, ...]
+        try:
+            payload: object = json.loads(line)
+        except ValueError as exc:
+            violations = (ContractViolation(f"invalid JSON: {exc}", validator="json"),)
+        else:
+            violations = _violations_of(validator, payload, fail_fast=fail_fast)
+        if violations:
+            results.append((line_number, violations))
+            if fail_fast:
+                break
+    return results
+
+
+def _iter_chunks(
+    items: Iterable[_T], chunk_size: int
+) -> Iterator[tuple[int, list[_T]]]:
+    iterator = iter(items)
+    start = 0
+    while chunk := list(itertools.islice(iterator, chunk_size)):
+        yield start, chunk
+        start += len(chunk)
+
+
+def _run_chunks(
+    task: Callable[[int, list[_T]], list[PayloadResult]],
+    chunks: Iterator[tuple[int, list[_T]]],
+    *,
+    fail_fast: bool,
+    workers: int | None,
+) -> Iterator[PayloadResult]:
+    """Run *task* over *chunks* in order, in-process or in a process pool.
+
+    At most two chunks per worker are in flight, so the input is consumed
+    lazily and memory stays flat for long streams.
+    """
+
+    worker_count = workers or os.cpu_count() or 1
+    if worker_count <= 1:
+        for start, chunk in chunks:
+            results = task(start, chunk)
+            yield from results
+            if fail_fast and results:
+                return
+        return
+    with ProcessPoolExecutor(max_workers=worker_count) as pool:
+        in_flight: deque[Future[list[PayloadResult]]] = deque()
+        try:
+            for start, chunk in chunks:
+                in_flight.append(pool.submit(task, start, chunk))
+                if len(in_flight) < worker_count * 2:
+                    continue
+                results = in_flight.popleft().result()
+                yield from results
+                if fail_fast and results:
+                    return
+            while in_flight:
+                results = in_flight.popleft().result()
+                yield from results
+                if fail_fast and results:
+                    return
+        finally:
+            for future in in_flight:
+                future.cancel()
+
+
+def validate_many(
+    payloads: Iterable[object],
+    schema: SchemaMapping | MutableSchemaMapping,
+    *,
+    fail_fast: bool = False,
+    workers: int | None = 1,
+    chunk_size: int = DEFAULT_BATCH_CHUNK_SIZE,
+) -> Iterator[PayloadResult]:
+    """Yield ``(index, violations)`` for each invalid payload, in input order.
+
+    The schema is compiled once (per process). By default every error of
+    every payload is collected; ``fail_fast=True`` stops at the first invalid
+    payload and reports only its first error. ``workers`` > 1 (or ``None``
+    for one per CPU) validates ``chunk_size`` payloads at a time in a process
+    pool; *payloads* is consumed lazily with a bounded number of chunks in
+    flight, so memory stays flat for long streams.
+    """
+
+    if chunk_size <= 0:
+        msg = "validate_many chunk_size must be positive"
+        raise ValueError(msg)
+    plain = dict(schema)
+    task = functools.partial(
+        _validate_chunk, plain, schema_fingerprint(plain), fail_fast=fail_fast
+    )
+    yield from _run_chunks(
+        task, _iter_chunks(payloads, chunk_size), fail_fast=fail_fast, workers=workers
+    )
+
+
+def validate_jsonl(
+    lines: Iterable[bytes | str],
+    schema: SchemaMapping | MutableSchemaMapping,
+    *,
+    fail_fast: bool = False,
+    workers: int | None = 1,
+    chunk_size: int = DEFAULT_BATCH_CHUNK_SIZE,
+) -> Iterator[PayloadResult]:
+    """Like ``validate_many`` for raw JSONL lines, keyed by 1-based line number.
+
+    Lines are parsed in the workers, blank lines are skipped and a line that
+    is not valid JSON is reported with a ``json`` violation.
+    """
+
+    if chunk_size <= 0:
+        msg = "validate_jsonl chunk_size must be positive"
+        raise ValueError(msg)
+    plain = dict(schema)
+    task = functools.partial(
+        _validate_lines_chunk, plain, schema_fingerprint(plain), fail_fast=fail_fast
+    )
+    yield from _run_chunks(
+        task, _iter_chunks(lines, chunk_size), fail_fast=fail_fast, workers=workers
+    )
+
+
+_ANNOTATION_KEYWORDS = frozenset(
+    {
+        "$comment",
+        "$id",
+        "$schema",
+        "default",
+        "deprecated",
+        "description",
+        "examples",
+        "format",
+        "readOnly",
+        "title",
+        "writeOnly",
+    }
+)
+_TYPE_TESTS = {
+    "array": "isinstance(v, list)",
+    "boolean": "isinstance(v, bool)",
+    "integer": (
+        "(isinstance(v, int) and not isinstance(v, bool)"
+        " or isinstance(v, float) and v.is_integer())"
+    ),
+    "null": "v is None",
+    "number": "(isinstance(v, _Number) and not isinstance(v, bool))",
+    "object": "isinstance(v, dict)",
+    "string": "isinstance(v, str)",
+}
+_NUMBER_BOUNDS = {
+    "minimum": "<",
+    "maximum": ">",
+    "exclusiveMinimum": "<=",
+    "exclusiveMaximum": ">=",
+}
+_SIZE_BOUNDS = {
+    "minLength": ("str", "<"),
+    "maxLength": ("str", ">"),
+    "minItems": ("list", "<"),
+    "maxItems": ("list", ">"),
+    "minProperties": ("dict", "<"),
+    "maxProperties": ("dict", ">"),
+}
+_COMPILED_KEYWORDS = frozenset(
+    {
+        "additionalProperties",
+        "enum",
+        "items",
+        "properties",
+        "required",
+        "type",
+        *_NUMBER_BOUNDS,
+        *_SIZE_BOUNDS,
+    }
+)
+# jsonschema treats any numbers.Number except bool as a number.
+_IS_NUMBER = "isinstance(v, _Number) and not isinstance(v, bool)"
+
+
+def _json_equal(one: object, two: object) -> bool:
+    """JSON Schema equality: ``True`` is not ``1`` and containers recurse."""
+
+    if one is two:
+        return True
+    if isinstance(one, bool) or isinstance(two, bool):
+        return isinstance(one, bool) and isinstance(two, bool) and one == two
+    if isinstance(one, list) and isinstance(two, list):
+        left = cast("list[object]", one)
+        right = cast("list[object]", two)
+        return len(left) == len(right) and all(
+            _json_equal(a, b) for a, b in zip(left, right, strict=True)
+        )
+    if isinstance(one, dict) and isinstance(two, dict):
+        left_map = cast("dict[str, object]", one)
+        right_map = cast("dict[str, object]", two)
+        return left_map.keys() == right_map.keys() and all(
+            _json_equal(value, right_map[key]) for key, value in left_map.items()
+        )
+    return one == two
+
+
+class _UnsupportedSchemaError(Exception):
+    """A keyword or keyword value outside the compiled subset."""
+
+
+class _ContractCompiler:
+    """Translate a schema subset into Python source, one function per subschema."""
+
+    def __init__(self) -> None:
+        self.namespace: dict[str, object] = {
+            "_MISSING": object(),
+            "_json_equal": _json_equal,
+            "_Number": numbers.Number,
+        }
+        self.functions: list[str] = []
+
+    def constant(self, value: object) -> str:
+        name = f"_c{len(self.namespace)}"
+        self.namespace[name] = value
+        return name
+
+    def function(self, schema: object) -> str:
+        if schema is True:
+            return self.constant(lambda _value: True)
+        if schema is False:
+            return self.constant(lambda _value: False)
+        if not isinstance(schema, Mapping):
+            raise _UnsupportedSchemaError
+        node = cast("Mapping[str, object]", schema)
+        if set(node) - _COMPILED_KEYWORDS - _ANNOTATION_KEYWORDS:
+            raise _UnsupportedSchemaError
+        index = len(self.functions)
+        name = f"_check{index}"
+        self.functions.append("")
+        body = [
+            *self._type_lines(node),
+            *self._enum_lines(node),
+            *self._bound_lines(node),
+            *self._object_lines(node),
+            *self._array_lines(node),
+        ]
+        source = [
+            f"def {name}(v):",
+            *(f"    {line}" for line in body),
+            "    return True",
+        ]
+        self.functions[index] = "\n".join(source)
+        return name
+
+    def _type_lines(self, node: Mapping[str, object]) -> list[str]:
+        if "type" not in node:
+            return []
+        declared = node["type"]
+        names = [declared] if isinstance(declared, str) else declared
+        if not isinstance(names, list) or not names:
+            raise _UnsupportedSchemaError
+        tests = [_TYPE_TESTS.get(str(type_name)) for type_name in names]
+        if None in tests:
+            raise _UnsupportedSchemaError
+        return [
+            f"if not ({' or '.join(cast('list[str]', tests))}):",
+            "    return False",
+        ]
+
+    def _enum_lines(self, node: Mapping[str, object]) -> list[str]:
+        if "enum" not in node:
+            return []
+        options = node["enum"]
+        if not isinstance(options, list):
+            raise _UnsupportedSchemaError
+        values = cast("list[object]", options)
+        if all(isinstance(value, str) for value in values):
+            allowed = self.constant(frozenset(cast("list[str]", values)))
+            return [
+                f"if not (isinstance(v, str) and v in {allowed}):",
+                "    return False",
+            ]
+        allowed = self.constant(tuple(values))
+        return [
+            f"if not any(_json_equal(v, option) for option in {allowed}):",
+            "    return False",
+        ]
+
+    def _bound_lines(self, node: Mapping[str, object]) -> list[str]:
+        lines: list[str] = []
+        for keyword, operator in _NUMBER_BOUNDS.items():
+            if keyword not in node:
+                continue
+            limit = node[keyword]
+            if isinstance(limit, bool) or not isinstance(limit, (int, float)):
+                raise _UnsupportedSchemaError
+            lines += [
+                f"if {_IS_NUMBER} and v {operator} {self.constant(limit)}:",
+                "    return False",
+            ]
+        for keyword, (kind, operator) in _SIZE_BOUNDS.items():
+            if keyword not in node:
+                continue
+            limit = node[keyword]
+            if isinstance(limit, bool) or not isinstance(limit, int):
+                raise _UnsupportedSchemaError
+            lines += [
+                f"if isinstance(v, {kind}) and len(v) {operator} {limit}:",
+                "    return False",
+            ]
+        return lines
+
+    def _object_lines(self, node: Mapping[str, object]) -> list[str]:
+        lines: list[str] = []
+        required = node.get("required")
+        if required is not None:
+            if not isinstance(required, list) or not all(
+                isinstance(key, str) for key in cast("list[object]", required)
+            ):
+                raise _UnsupportedSchemaError
+            keys = self.constant(frozenset(cast("list[str]", required)))
+            lines += [f"if not ({keys} <= v.keys()):", "    return False"]
+        properties_obj = node.get("properties", {})
+        if not isinstance(properties_obj, Mapping):
+            raise _UnsupportedSchemaError
+        properties = cast("Mapping[str, object]", properties_obj)
+        for key, subschema in properties.items():
+            if subschema is True:
+                continue
+            check = self.function(subschema)
+            lines += [
+                f"item = v.get({key!r}, _MISSING)",
+                f"if item is not _MISSING and not {check}(item):",
+                "    return False",
+            ]
+        if "additionalProperties" in node:
+            lines += self._additional_lines(node["additionalProperties"], properties)
+        if not lines:
+            return []
+        return ["if isinstance(v, dict):", *(f"    {line}" for line in lines)]
+
+    def _additional_lines(
+        self, additional: object, properties: Mapping[str, object]
+    ) -> list[str]:
+        if additional is True:
+            return []
+        known = self.constant(frozenset(properties))
+        if additional is False:
+            return [f"if not (v.keys() <= {known}):", "    return False"]
+        check = self.function(additional)
+        return [
+            "for key, item in v.items():",
+            f"    if key not in {known} and not {check}(item):",
+            "        return False",
+        ]
+
+    def _array_lines(self, node: Mapping[str, object]) -> list[str]:
+        if "items" not in node or node["items"] is True:
+            return []
+        check = self.function(node["items"])
+        return [
+            "if isinstance(v, list):",
+            "    for item in v:",
+            f"        if not {check}(item):",
+            "            return False",
+        ]
+
+
+def _generate_checker(
+    schema: Mapping[str, object],
+) -> tuple[str | None, Callable[[object], bool] | None]:
+    compiler = _ContractCompiler()
+    try:
+        root = compiler.function(schema)
+    except _UnsupportedSchemaError:
+        return None, None
+    source = "\n\n".join(compiler.functions) + "\n"
+    namespace = dict(compiler.namespace)
+    code = compile(source, "<json_contracts>", "exec")
+    exec(code, namespace)  # noqa: S102 - source is generated from a fixed grammar
+    return source, cast("Callable[[object], bool]", namespace[root])
+
+
+class CompiledContract:
+    """Schema-specialised validator generated as plain Python functions.
+
+    Schemas limited to ``type``, ``enum``, ``required``, ``properties``,
+    ``additionalProperties``, ``items`` and the numeric/size bounds (plus
+    annotations) are translated to straight-line checks. Valid payloads are
+    accepted by the generated code alone; anything it rejects, and any schema
+    using other keywords, goes through the full Draft 2020-12 validator, so
+    errors are exactly the ones ``validate_payload`` raises.
+    """
+
+    def __init__(
+        self,
+        schema: SchemaMapping | MutableSchemaMapping,
+        *,
+        check_schema: bool = False,
+    ) -> None:
+        self.schema = dict(schema)
+        self.fingerprint = schema_fingerprint(self.schema)
+        if check_schema:
+            _load_draft_validator().check_schema(self.schema)
+        self.source, self._check = _generate_checker(self.schema)
+
+    @property
+    def specialized(self) -> bool:
+        """Whether generated code is in use (``False`` means full fallback)."""
+
+        return self._check is not None
+
+    def _full(self) -> _DraftValidator:
+        return _VALIDATOR_CACHE.get(self.schema, fingerprint=self.fingerprint)
+
+    def is_valid(self, payload: object) -> bool:
+        if self._check is not None and self._check(payload):
+            return True
+        return next(self._full().iter_errors(payload), None) is None
+
+    def iter_errors(self, payload: object) -> Iterator[_ValidationErrorLike]:
+        if self._check is not None and self._check(payload):
+            return iter(())
+        return self._full().iter_errors(payload)
+
+    def validate(self, payload: object) -> None:
+        """Raise the full validator's ``ValidationError`` if *payload* is invalid."""
+
+        if self._check is not None and self._check(payload):
+            return
+        self._full().validate(payload)
+
+
+def compile_contract(
+    schema: SchemaMapping | MutableSchemaMapping, *, check_schema: bool = False
+) -> CompiledContract:
+    """Generate a specialised validator for *schema*; keep it for hot loops."""
+
+    return CompiledContract(schema, check_schema=check_schema)
+
+
+class SchemaRegistry:
+    """Local schemas addressed by ``$id`` with ``$ref`` resolved offline.
+
+    Schemas are read once (``from_directory``) and indexed in a
+    ``referencing`` registry that is crawled up front, so every validator
+    handed out shares the pre-resolved references. Nothing is fetched over
+    the network: a ``$ref`` to an unknown URI fails to resolve.
+    """
+
+    def __init__(self, schemas: Iterable[SchemaMapping] = ()) -> None:
+        self._schemas: dict[str, dict[str, object]] = {}
+        self._registry: _Registry | None = None
+        self._validators: dict[str, _DraftValidator] = {}
+        self._lock = threading.Lock()
+        for schema in schemas:
+            self.add(schema)
+
+    @classmethod
+    def from_directory(
+        cls, directory: Path, *, pattern: str = "*.json"
+    ) -> SchemaRegistry:
+        """Load every schema file under *directory* matching *pattern*."""
+
+        registry = cls()
+        for path in sorted(directory.rglob(pattern)):
+            payload: object = json.loads(path.read_text(encoding="utf-8"))
+            if not isinstance(payload, Mapping):
+                msg = f"{path}: schema JSON must be an object"
+                raise TypeError(msg)
+            try:
+                registry.add(cast("Mapping[str, object]", payload))
+            except ValueError as exc:
+                msg = f"{path}: {exc}"
+                raise ValueError(msg) from exc
+        return registry
+
+    def __contains__(self, schema_id: object) -> bool:
+        return schema_id in self._schemas
+
+    def __len__(self) -> int:
+        return len(self._schemas)
+
+    @property
+    def ids(self) -> tuple[str, ...]:
+        return tuple(sorted(self._schemas))
+
+    def add(self, schema: SchemaMapping | MutableSchemaMapping) -> str:
+        """Register *schema* under its ``$id`` and return that id."""
+
+        schema_id = schema.get("$id")
+        if not isinstance(schema_id, str) or not schema_id:
+            msg = "registered schemas require a string '$id'"
+            raise ValueError(msg)
+        with self._lock:
+            self._schemas[schema_id] = dict(schema)
+            self._registry = None
+            self._validators.clear()
+        return schema_id
+
+    def get(self, schema_id: str) -> dict[str, object]:
+        try:
+            return self._schemas[schema_id]
+        except KeyError:
+            msg = f"Unknown schema id: {schema_id}"
+            raise KeyError(msg) from None
+
+    def _referencing(self) -> _Registry:
+        if self._registry is None:
+            registry_type, resource, draft = _load_referencing()
+            resources = [
+                (schema_id, resource.from_contents(schema, default_specification=draft))
+                for schema_id, schema in self._schemas.items()
+            ]
+            self._registry = registry_type().with_resources(resources).crawl()
+        return self._registry
+
+    def validator(self, schema_id: str) -> _DraftValidator:
+        """Return the compiled validator for *schema_id*, building it once."""
+
+        with self._lock:
+            validator = self._validators.get(schema_id)
+            if validator is None:
+                schema = self.get(schema_id)
+                validator = _load_draft_validator()(
+                    schema, registry=self._referencing()
+                )
+                self._validators[schema_id] = validator
+        return validator
+
+    def validate(self, payload: object, schema_id: str) -> None:
+        """Validate *payload* against the registered schema *schema_id*."""
+
+        self.validator(schema_id).validate(payload)
+
+
+DEFAULT_MEMO_SIZE = 4096
+DEFAULT_MEMO_TTL_SECONDS = 300.0
+
+
+@dataclass(slots=True, frozen=True)
+class _MemoEntry:
+    expires_at: float
+    violations: tuple[ContractViolation, ...]
+    error: Exception | None
+
+
+class ValidationMemo:
+    """Opt-in cache of validation outcomes for repeated identical payloads.
+
+    Outcomes are keyed by ``(schema fingerprint, canonical payload digest)``
+    and kept in a bounded LRU whose entries expire after ``ttl_seconds``.
+    Invalid outcomes keep their violations and the original
+    ``ValidationError``, which ``validate`` re-raises. Payloads that are not
+    plain ``dict``/``list``/scalar trees bypass the memo.
+    """
+
+    def __init__(
+        self,
+        *,
+        maxsize: int = DEFAULT_MEMO_SIZE,
+        ttl_seconds: float | None = DEFAULT_MEMO_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if maxsize <= 0:
+            msg = "validation memo maxsize must be positive"
+            raise ValueError(msg)
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple[str, str], _MemoEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _lookup(self, key: tuple[str, str], now: float) -> _MemoEntry | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= now:
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def _store(self, key: tuple[str, str], entry: _MemoEntry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def _evaluate(
+        self, validator: _DraftValidator, payload: object, now: float
+    ) -> _MemoEntry:
+        errors = list(validator.iter_errors(payload))
+        ttl = self.ttl_seconds
+        return _MemoEntry(
+            expires_at=float("inf") if ttl is None else now + ttl,
+            violations=tuple(ContractViolation.from_error(error) for error in errors),
+            error=cast("Exception", errors[0]) if errors else None,
+        )
+
+    def _outcome(
+        self,
+        payload: object,
+        schema: SchemaMapping | MutableSchemaMapping,
+        fingerprint: str | None,
+    ) -> _MemoEntry:
+        schema_key = fingerprint or _VALIDATOR_CACHE.fingerprint(schema)
+        validator = _VALIDATOR_CACHE.get(schema, fingerprint=schema_key)
+        now = self.clock()
+        if not _is_plain_json(payload):
+            return self._evaluate(validator, payload, now)
+        try:
+            key = (schema_key, _canonical_digest(payload))
+        except (TypeError, ValueError):
+            return self._evaluate(validator, payload, now)
+        entry = self._lookup(key, now)
+        if entry is None:
+            entry = self._evaluate(validator, payload, now)
+            self._store(key, entry)
+        return entry
+
+    def violations(
+        self,
+        payload: object,
+        schema: SchemaMapping | MutableSchemaMapping,
+        *,
+        fingerprint: str | None = None,
+    ) -> tuple[ContractViolation, ...]:
+        """Return every violation of *payload* (empty when valid)."""
+
+        return self._outcome(payload, schema, fingerprint).violations
+
+    def validate(
+        self,
+        payload: object,
+        schema: SchemaMapping | MutableSchemaMapping,
+        *,
+        fingerprint: str | None = None,
+    ) -> None:
+        """Raise a copy of the remembered ``ValidationError`` if *payload* is invalid.
+
+        Pass a precomputed ``schema_fingerprint`` to skip hashing the schema.
+        Each raise gets a fresh exception, so tracebacks and ``__context__``
+        from one caller never leak into the next.
+        """
+
+        error = self._outcome(payload, schema, fingerprint).error
+        if error is not None:
+            raise copy.copy(error)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
 
 
 def validate_schema(schema: SchemaMapping | MutableSchemaMapping) -> None:
     """Raise ``ValidationError`` if *schema* is not a valid JSON Schema."""
 
-    _DRAFT_VALIDATOR.check_schema(dict(schema))
+    _load_draft_validator().check_schema(dict(schema))
 
 
 def validate_payload(
-    payload: object, schema: SchemaMapping | MutableSchemaMapping
+    payload: object,
+    schema: SchemaMapping | MutableSchemaMapping,
+    *,
+    memo: ValidationMemo | None = None,
+    fingerprint: str | None = None,
 ) -> None:
-    """Validate *payload* against *schema* using Draft 2020-12 semantics."""
+    """Validate *payload* against *schema* using Draft 2020-12 semantics.
+
+    The compiled validator is reused across calls with an equal schema.
+    Pass a ``ValidationMemo`` to reuse outcomes for repeated payloads, and a
+    precomputed ``schema_fingerprint`` to skip identifying the schema.
+    """
 
-    validator = _DRAFT_VALIDATOR(dict(schema))
-    validator.validate(payload)
+    if memo is not None:
+        memo.validate(payload, schema, fingerprint=fingerprint)
+        return
+    _VALIDATOR_CACHE.get(schema, fingerprint=fingerprint).validate(payload)
 
 
-__all__ = ["validate_payload", "validate_schema"]
+__all__ = [
+    "CompiledContract",
+    "ContractViolation",
+    "SchemaRegistry",
+    "ValidationMemo",
+    "ValidatorCache",
+    "compile_contract",
+    "compile_validator",
+    "schema_fingerprint",
+    "validate_jsonl",
+    "validate_many",
+    "validate_payload",
+    "validate_schema",
+    "validator_cache",
+]
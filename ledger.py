@@ -2,15 +2,82 @@
 
 from __future__ import annotations
 
+import contextlib
 import hashlib
+import importlib
 import json
+import os
+import threading
+import time
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Protocol, Self
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Iterator, Mapping, Sequence
     from pathlib import Path
+    from types import ModuleType, TracebackType
+
+GENESIS_DIGEST = "0" * 64
+_TAIL_BLOCK_SIZE = 4096
+_APPEND_FLAGS = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0)
+
+
+def _load_lock_module(name: str) -> ModuleType | None:
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+
+_FCNTL = _load_lock_module("fcntl")
+_MSVCRT = None if _FCNTL is not None else _load_lock_module("msvcrt")
+
+
+@contextlib.contextmanager
+def _exclusive_lock(fd: int) -> Iterator[None]:
+    """Hold an advisory whole-file lock on *fd* (flock, or msvcrt on Windows)."""
+
+    if _FCNTL is not None:
+        _FCNTL.flock(fd, _FCNTL.LOCK_EX)
+        try:
+            yield
+        finally:
+            _FCNTL.flock(fd, _FCNTL.LOCK_UN)
+        return
+    if _MSVCRT is None:  # pragma: no cover - no locking primitive available
+        yield
+        return
+    os.lseek(fd, 0, os.SEEK_SET)  # pragma: no cover - Windows only
+    _MSVCRT.locking(fd, _MSVCRT.LK_LOCK, 1)  # pragma: no cover
+    try:  # pragma: no cover
+        yield
+    finally:  # pragma: no cover
+        os.lseek(fd, 0, os.SEEK_SET)
+        _MSVCRT.locking(fd, _MSVCRT.LK_UNLCK, 1)
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
+def _append_bytes(fd: int, data: bytes) -> None:
+    """Append *data* to an ``O_APPEND`` descriptor without interleaving.
+
+    POSIX only promises atomic writes for pipes (``PIPE_BUF``), and the kernel
+    may split a large write to a regular file, so every append holds the
+    advisory lock. Appenders that bypass this helper are not excluded.
+    """
+
+    with _exclusive_lock(fd):
+        _write_all(fd, data)
+
+
+def _open_append(path: Path) -> int:
+    return os.open(path, _APPEND_FLAGS, 0o666)
 
 
 @dataclass(slots=True, frozen=True)
@@ -29,24 +96,286 @@ class LedgerEvent:
         }
 
 
+_CANONICAL = json.JSONEncoder(sort_keys=True, separators=(",", ":"))
+
+
+def _encode_entry(event: LedgerEvent, previous: str | None = None) -> tuple[bytes, str]:
+    """Return the encoded JSONL line (with newline) and its digest.
+
+    The entry is serialized once in canonical form (sorted keys, compact
+    separators), hashed, and the digest spliced in before the closing brace;
+    ``sha256`` sorts last, so the stored line is itself canonical. When
+    *previous* is given the entry records it as ``prev_sha256`` so the digest
+    also covers the preceding entry (chained mode).
+    """
+
+    payload = event.payload if isinstance(event.payload, dict) else dict(event.payload)
+    body = (
+        '{"emitted_at":'
+        + _CANONICAL.encode(event.emitted_at)
+        + ',"event_type":'
+        + _CANONICAL.encode(event.event_type)
+        + ',"payload":'
+        + _CANONICAL.encode(payload)
+    )
+    if previous is not None:
+        body += ',"prev_sha256":' + _CANONICAL.encode(previous)
+    encoded = body.encode("utf-8")
+    hasher = hashlib.sha256(encoded)
+    hasher.update(b"}")
+    digest = hasher.hexdigest()
+    return encoded + b',"sha256":"' + digest.encode("ascii") + b'"}\n', digest
+
+
+def read_last_line(path: Path) -> bytes | None:
+    """Return the last complete, non-blank line of *path*, reading from the end."""
+
+    if not path.exists():
+        return None
+    with path.open("rb") as handle:
+        end = handle.seek(0, os.SEEK_END)
+        tail = b""
+        position = end
+        while position > 0:
+            step = min(_TAIL_BLOCK_SIZE, position)
+            position -= step
+            handle.seek(position)
+            tail = handle.read(step) + tail
+            lines = [line for line in tail.split(b"\n")[:-1] if line.strip()]
+            if lines and (position == 0 or len(lines) > 1):
+                return lines[-1]
+    return None
+
+
+def read_last_digest(path: Path) -> str | None:
+    """Return the ``sha256`` of the last complete entry in *path*, if any."""
+
+    line = read_last_line(path)
+    if line is None:
+        return None
+    payload: object = json.loads(line)
+    digest = payload.get("sha256") if isinstance(payload, dict) else None
+    return digest if isinstance(digest, str) else None
+
+
 class LedgerWriter:
-    """Append-only JSONL writer that includes per-entry checksums."""
+    """Append-only JSONL writer that includes per-entry checksums.
+
+    Each entry is one ``O_APPEND`` write, so several processes may append to
+    the same path. With ``chained=True`` every entry also commits to the
+    previous entry's digest, so deleted or reordered lines break verification;
+    chained appends re-read the tail under the advisory lock.
+    """
 
-    def __init__(self, path: Path) -> None:
+    def __init__(self, path: Path, *, chained: bool = False) -> None:
         self.path = path
         self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.chained = chained
 
     def append(self, event: LedgerEvent) -> str:
-        entry = event.to_dict()
-        serialized = json.dumps(entry, sort_keys=True, separators=(",", ":"))
-        digest = hashlib.sha256(serialized.encode("utf-8")).hexdigest()
-        line = json.dumps({**entry, "sha256": digest})
-        with self.path.open("a", encoding="utf-8") as handle:
-            handle.write(line)
-            handle.write("\n")
+        fd = _open_append(self.path)
+        try:
+            if not self.chained:
+                line, digest = _encode_entry(event)
+                _append_bytes(fd, line)
+            else:
+                with _exclusive_lock(fd):
+                    previous = read_last_digest(self.path) or GENESIS_DIGEST
+                    line, digest = _encode_entry(event, previous)
+                    _write_all(fd, line)
+        finally:
+            os.close(fd)
+        _sync_type_sidecar(self.path)
         return digest
 
 
+def _sync_type_sidecar(path: Path) -> None:
+    """Bring an existing ``EventTypeIndex`` sidecar up to the end of *path*."""
+
+    from x_make_common_x.ledger_index import (  # noqa: PLC0415 - import cycle
+        EventTypeIndex,
+    )
+
+    if EventTypeIndex.sidecar_path(path).exists():
+        EventTypeIndex.catch_up(path)
+
+
+class LedgerWriteObserver(Protocol):
+    """Sidecar structure kept current by a ``BufferedLedgerWriter``.
+
+    ``entry_appended`` receives the byte offset and encoded line of each entry;
+    ``flushed`` runs after pending lines reach the ledger file.
+    """
+
+    def entry_appended(self, offset: int, line: bytes, event: LedgerEvent) -> None: ...
+
+    def flushed(self) -> None: ...
+
+
+@dataclass(slots=True, frozen=True)
+class LedgerFlushPolicy:
+    """When a buffered ledger writer pushes pending lines to disk.
+
+    Pending lines are written once ``max_events`` are buffered or the oldest
+    pending line is ``max_delay_ms`` old, even if the writer then sits idle;
+    ``fsync`` also forces each flushed batch to stable storage.
+    """
+
+    max_events: int = 256
+    max_delay_ms: float | None = 200.0
+    fsync: bool = False
+
+
+class BufferedLedgerWriter:
+    """Long-lived ledger writer that keeps its handle open and groups commits.
+
+    Use it as a context manager so buffered events are flushed on exit. Each
+    flush is one ``O_APPEND`` write under an advisory lock, so batches from
+    writers using this module do not interleave; chained mode and sidecar
+    observers still assume this writer is the file's only appender. A chained writer
+    links to the file's last entry unless ``previous`` seeds the chain
+    explicitly (e.g. from the prior segment).
+
+    With ``max_delay_ms`` set, a daemon thread flushes idle pending lines once
+    they reach that age; the writer's methods are safe to call from any thread.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        policy: LedgerFlushPolicy | None = None,
+        chained: bool = False,
+        previous: str | None = None,
+        observers: Sequence[LedgerWriteObserver] = (),
+    ) -> None:
+        self.path = path
+        self.policy = policy or LedgerFlushPolicy()
+        self.observers = list(observers)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.chained = chained
+        self._last_digest: str | None = None
+        if chained:
+            self._last_digest = previous or read_last_digest(path) or GENESIS_DIGEST
+        self._fd: int | None = _open_append(path)
+        self._size = os.fstat(self._fd).st_size
+        self._pending: list[bytes] = []
+        self._oldest_pending = 0.0
+        self._condition = threading.Condition()
+        self._flusher: threading.Thread | None = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    @property
+    def closed(self) -> bool:
+        return self._fd is None
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    @property
+    def size(self) -> int:
+        """Bytes in the ledger file once pending lines are flushed."""
+
+        return self._size
+
+    def append(self, event: LedgerEvent) -> str:
+        with self._condition:
+            if self._fd is None:
+                msg = f"ledger writer is closed: {self.path}"
+                raise ValueError(msg)
+            encoded, digest = _encode_entry(event, self._last_digest)
+            if self.chained:
+                self._last_digest = digest
+            if not self._pending:
+                self._oldest_pending = time.monotonic()
+                self._start_flusher()
+                self._condition.notify_all()
+            self._pending.append(encoded)
+            for observer in self.observers:
+                observer.entry_appended(self._size, encoded, event)
+            self._size += len(encoded)
+            if self._should_flush():
+                self._flush_locked()
+            return digest
+
+    def _start_flusher(self) -> None:
+        if self.policy.max_delay_ms is None or self._flusher is not None:
+            return
+        self._flusher = threading.Thread(
+            target=self._run_flusher, name=f"ledger-flush:{self.path.name}", daemon=True
+        )
+        self._flusher.start()
+
+    def _run_flusher(self) -> None:
+        delay = (self.policy.max_delay_ms or 0.0) / 1000.0
+        with self._condition:
+            while self._fd is not None:
+                if not self._pending:
+                    self._condition.wait()
+                    continue
+                remaining = self._oldest_pending + delay - time.monotonic()
+                if remaining > 0:
+                    self._condition.wait(remaining)
+                    continue
+                try:
+                    self._flush_locked()
+                except OSError:
+                    # Lines stay pending; the next explicit flush or close
+                    # retries and raises to the caller.
+                    self._condition.wait()
+
+    def _should_flush(self) -> bool:
+        policy = self.policy
+        if len(self._pending) >= policy.max_events:
+            return True
+        if policy.max_delay_ms is None:
+            return False
+        elapsed_ms = (time.monotonic() - self._oldest_pending) * 1000.0
+        return elapsed_ms >= policy.max_delay_ms
+
+    def flush(self) -> None:
+        """Append every pending line in one write, fsyncing if the policy asks."""
+
+        with self._condition:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        if self._fd is None:
+            return
+        if self._pending:
+            _append_bytes(self._fd, b"".join(self._pending))
+            self._pending.clear()
+            if self.policy.fsync:
+                os.fsync(self._fd)
+        for observer in self.observers:
+            observer.flushed()
+
+    def close(self) -> None:
+        with self._condition:
+            if self._fd is None:
+                return
+            try:
+                self._flush_locked()
+            finally:
+                os.close(self._fd)
+                self._fd = None
+                self._condition.notify_all()
+        flusher = self._flusher
+        if flusher is not None and flusher is not threading.current_thread():
+            flusher.join()
+
+
 def append_event(path: Path, event_type: str, payload: Mapping[str, Any]) -> str:
     """Append a ledger event to *path*, returning the checksum."""
 
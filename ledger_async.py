@@ -0,0 +1,180 @@
+"""Asyncio front end for ledger writers with batched, off-loop writes."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import replace
+from typing import TYPE_CHECKING, Self
+
+from x_make_common_x.ledger import BufferedLedgerWriter, LedgerFlushPolicy
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from pathlib import Path
+    from types import TracebackType
+
+    from x_make_common_x.ledger import LedgerEvent, LedgerWriteObserver
+
+__all__ = ["AsyncLedgerWriter"]
+
+_Pending = tuple["LedgerEvent", "asyncio.Future[str]"]
+
+
+class AsyncLedgerWriter:
+    """Accept ``await append(event)`` from many tasks, writing in batches.
+
+    Events go through a bounded queue, so producers are suspended (not
+    buffered without limit) when the writer falls behind. A background task
+    drains up to ``policy.max_events`` queued events and hands them to a
+    ``BufferedLedgerWriter`` on a worker thread, so encoding and the single
+    ``write`` per batch never block the event loop. Each ``append`` resolves
+    to the entry's digest once its batch is on disk.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        policy: LedgerFlushPolicy | None = None,
+        chained: bool = False,
+        max_queue: int = 1024,
+        observers: Sequence[LedgerWriteObserver] = (),
+    ) -> None:
+        self.policy = policy or LedgerFlushPolicy()
+        if max_queue <= 0 or self.policy.max_events <= 0:
+            msg = "async ledger writer max_queue and max_events must be positive"
+            raise ValueError(msg)
+        self.path = path
+        self.chained = chained
+        self.max_queue = max_queue
+        self.observers = list(observers)
+        self._queue: asyncio.Queue[_Pending | None] | None = None
+        self._worker: asyncio.Task[None] | None = None
+        self._writer: BufferedLedgerWriter | None = None
+        self._closed = False
+        self._start_lock = asyncio.Lock()
+
+    async def __aenter__(self) -> Self:
+        await self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    async def start(self) -> None:
+        """Open the ledger and start the batching task (idempotent)."""
+
+        if self._closed:
+            msg = f"ledger writer is closed: {self.path}"
+            raise ValueError(msg)
+        # Concurrent first appends all call start(); only one may open the file.
+        async with self._start_lock:
+            if self._worker is not None:
+                return
+            # Batches are formed from the queue; the inner writer only flushes
+            # when told to, so each batch is one write.
+            policy = replace(self.policy, max_delay_ms=None)
+            self._writer = await asyncio.to_thread(
+                BufferedLedgerWriter,
+                self.path,
+                policy=policy,
+                chained=self.chained,
+                observers=self.observers,
+            )
+            self._queue = asyncio.Queue(maxsize=self.max_queue)
+            self._worker = asyncio.create_task(self._run(self._queue))
+
+    async def append(self, event: LedgerEvent) -> str:
+        """Queue *event*, waiting for room, and return its digest once written."""
+
+        if self._worker is None:
+            await self.start()
+        if self._closed or self._queue is None:
+            msg = f"ledger writer is closed: {self.path}"
+            raise ValueError(msg)
+        future: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+        await self._queue.put((event, future))
+        return await future
+
+    def _write_batch(self, events: list[LedgerEvent]) -> list[str | Exception]:
+        """Buffer each event on its own, then flush the batch once.
+
+        An event that fails to encode is rejected by itself: ``append`` leaves
+        the writer untouched on error, so the other events are still written
+        and only that caller sees the exception.
+        """
+
+        writer = self._writer
+        if writer is None:  # pragma: no cover - guarded by start()
+            msg = f"ledger writer is not open: {self.path}"
+            raise ValueError(msg)
+        outcomes: list[str | Exception] = []
+        for event in events:
+            try:
+                outcomes.append(writer.append(event))
+            except (TypeError, ValueError) as exc:
+                outcomes.append(exc)
+        writer.flush()
+        return outcomes
+
+    def _drain(
+        self, queue: asyncio.Queue[_Pending | None], first: _Pending
+    ) -> tuple[list[_Pending], bool]:
+        batch = [first]
+        stopping = False
+        while len(batch) < self.policy.max_events and not queue.empty():
+            item = queue.get_nowait()
+            if item is None:
+                stopping = True
+                break
+            batch.append(item)
+        return batch, stopping
+
+    async def _run(self, queue: asyncio.Queue[_Pending | None]) -> None:
+        while (first := await queue.get()) is not None:
+            batch, stopping = self._drain(queue, first)
+            try:
+                outcomes = await asyncio.to_thread(
+                    self._write_batch, [event for event, _future in batch]
+                )
+            except Exception as exc:  # noqa: BLE001 - delivered to each caller
+                for _event, future in batch:
+                    if not future.done():
+                        future.set_exception(exc)
+            else:
+                for (_event, future), outcome in zip(batch, outcomes, strict=True):
+                    if future.done():
+                        continue
+                    if isinstance(outcome, Exception):
+                        future.set_exception(outcome)
+                    else:
+                        future.set_result(outcome)
+            if stopping:
+                return
+
+    async def close(self) -> None:
+        """Write everything already queued, then close the ledger."""
+
+        if self._closed:
+            return
+        self._closed = True
+        queue = self._queue
+        if self._worker is not None and queue is not None:
+            await queue.put(None)
+            await self._worker
+            while not queue.empty():
+                item = queue.get_nowait()
+                if item is not None and not item[1].done():
+                    msg = f"ledger writer is closed: {self.path}"
+                    item[1].set_exception(ValueError(msg))
+        if self._writer is not None:
+            await asyncio.to_thread(self._writer.close)
@@ -0,0 +1,136 @@
+"""Micro-benchmark for ledger entry encoding throughput."""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import sys
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from x_make_common_x.ledger import GENESIS_DIGEST, LedgerEvent, _encode_entry
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+__all__ = ["LedgerEncodeBenchmark", "run_encode_benchmark"]
+
+DEFAULT_PAYLOAD_SIZES = (256, 2048, 16384)
+
+
+def _two_pass_encode(
+    event: LedgerEvent, previous: str | None = None
+) -> tuple[bytes, str]:
+    """The original encoder: canonical dump for the digest, second dump for the line."""
+
+    entry = event.to_dict()
+    if previous is not None:
+        entry["prev_sha256"] = previous
+    serialized = json.dumps(entry, sort_keys=True, separators=(",", ":"))
+    digest = hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+    line = json.dumps({**entry, "sha256": digest})
+    return line.encode("utf-8") + b"\n", digest
+
+
+@dataclass(slots=True, frozen=True)
+class LedgerEncodeBenchmark:
+    """Events per second for both encoders at one payload size."""
+
+    payload_bytes: int
+    events: int
+    two_pass_per_second: float
+    single_pass_per_second: float
+    digests_match: bool
+
+    @property
+    def speedup(self) -> float:
+        return self.single_pass_per_second / self.two_pass_per_second
+
+    def to_payload(self) -> dict[str, object]:
+        return {
+            "payload_bytes": self.payload_bytes,
+            "events": self.events,
+            "two_pass_per_second": round(self.two_pass_per_second),
+            "single_pass_per_second": round(self.single_pass_per_second),
+            "speedup": round(self.speedup, 2),
+            "digests_match": self.digests_match,
+        }
+
+
+def _sample_events(count: int, payload_bytes: int) -> list[LedgerEvent]:
+    """Stage-progress shaped payloads padded to roughly *payload_bytes*."""
+
+    notes = "stage output line\n" * max(payload_bytes // 18, 1)
+    return [
+        LedgerEvent(
+            "stage_progress",
+            {
+                "run_id": f"run-{index:08d}",
+                "stage": "build",
+                "status": "running",
+                "attempt": index % 3,
+                "metrics": {"files": index, "duration_ms": index * 1.5},
+                "tags": ["ci", "nightly"],
+                "notes": notes,
+            },
+            emitted_at="2025-01-01T00:00:00+00:00",
+        )
+        for index in range(count)
+    ]
+
+
+def _rate(
+    encode: Callable[[LedgerEvent, str | None], tuple[bytes, str]],
+    events: Sequence[LedgerEvent],
+) -> tuple[float, list[str]]:
+    digests: list[str] = []
+    previous = GENESIS_DIGEST
+    started = time.perf_counter()
+    for event in events:
+        _line, previous = encode(event, previous)
+        digests.append(previous)
+    elapsed = time.perf_counter() - started
+    return len(events) / max(elapsed, 1e-9), digests
+
+
+def run_encode_benchmark(
+    *,
+    events: int = 20_000,
+    payload_sizes: Sequence[int] = DEFAULT_PAYLOAD_SIZES,
+) -> list[LedgerEncodeBenchmark]:
+    """Time chained encoding with the two-pass and single-pass encoders."""
+
+    results: list[LedgerEncodeBenchmark] = []
+    for payload_bytes in payload_sizes:
+        sample = _sample_events(events, payload_bytes)
+        before, before_digests = _rate(_two_pass_encode, sample)
+        after, after_digests = _rate(_encode_entry, sample)
+        results.append(
+            LedgerEncodeBenchmark(
+                payload_bytes=payload_bytes,
+                events=events,
+                two_pass_per_second=before,
+                single_pass_per_second=after,
+                digests_match=before_digests == after_digests,
+            )
+        )
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=20_000)
+    parser.add_argument(
+        "--payload-bytes", type=int, nargs="+", default=list(DEFAULT_PAYLOAD_SIZES)
+    )
+    args = parser.parse_args(argv)
+    results = run_encode_benchmark(events=args.events, payload_sizes=args.payload_bytes)
+    payload = [result.to_payload() for result in results]
+    sys.stdout.write(json.dumps(payload, indent=2) + "\n")
+    return 0 if all(result.digests_match for result in results) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,360 @@
+"""Block-compressed, seekable storage for sealed JSONL ledgers."""
+
+from __future__ import annotations
+
+import bisect
+import json
+import struct
+import zlib
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Literal, cast
+
+from x_make_common_x.ledger_index import EventTypeIndex
+from x_make_common_x.ledger_reader import parse_ledger_line
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from x_make_common_x.ledger import LedgerEvent
+    from x_make_common_x.ledger_reader import LedgerRecord
+
+__all__ = [
+    "COMPRESSED_SUFFIX",
+    "CompressedLedgerReader",
+    "LedgerBlock",
+    "compress_ledger",
+    "compressed_path",
+]
+
+LedgerCodec = Literal["zlib", "lzma"]
+
+COMPRESSED_SUFFIX = ".blk"
+DEFAULT_BLOCK_SIZE = 256 << 10
+_BLOCKS_SCHEMA = "x_make.ledger.blocks/1.0"
+_MAGIC = b"XLDGBLK1"
+_FOOTER = struct.Struct(">Q8s")
+_READ_CHUNK_SIZE = 1 << 20
+
+
+def compressed_path(path: Path) -> Path:
+    """Return where ``compress_ledger`` stores *path* by default."""
+
+    return path.with_name(f"{path.name}{COMPRESSED_SUFFIX}")
+
+
+def _compress(codec: LedgerCodec, data: bytes, level: int | None) -> bytes:
+    if codec == "zlib":
+        return zlib.compress(data, -1 if level is None else level)
+    import lzma  # noqa: PLC0415 - only lzma-coded ledgers pay for the import
+
+    return lzma.compress(data, preset=6 if level is None else level)
+
+
+def _decompress(codec: str, data: bytes) -> bytes:
+    if codec == "zlib":
+        return zlib.decompress(data)
+    if codec == "lzma":
+        import lzma  # noqa: PLC0415 - only lzma-coded ledgers pay for the import
+
+        return lzma.decompress(data)
+    msg = f"Unsupported ledger block codec: {codec!r}"
+    raise ValueError(msg)
+
+
+@dataclass(slots=True, frozen=True)
+class LedgerBlock:
+    """Location of one independently compressed run of whole ledger lines.
+
+    ``raw_offset`` is the block's byte offset in the original ledger, so
+    offsets recorded by readers and sidecar indexes stay valid.
+    """
+
+    offset: int
+    length: int
+    raw_offset: int
+    raw_length: int
+    first_sequence: int
+    entries: int
+
+    def to_json(self) -> dict[str, object]:
+        return {
+            "offset": self.offset,
+            "length": self.length,
+            "raw_offset": self.raw_offset,
+            "raw_length": self.raw_length,
+            "first_sequence": self.first_sequence,
+            "entries": self.entries,
+        }
+
+    @classmethod
+    def from_json(cls, payload: Mapping[str, object]) -> LedgerBlock:
+        values: dict[str, int] = {}
+        for key in (
+            "offset",
+            "length",
+            "raw_offset",
+            "raw_length",
+            "first_sequence",
+            "entries",
+        ):
+            value = payload.get(key)
+            if not isinstance(value, int):
+                msg = f"ledger block entry missing integer {key!r}"
+                raise TypeError(msg)
+            values[key] = value
+        return cls(**values)
+
+
+def _iter_raw_blocks(source: Path, block_size: int) -> Iterator[bytes]:
+    buffer = b""
+    with source.open("rb") as handle:
+        while chunk := handle.read(_READ_CHUNK_SIZE):
+            buffer += chunk
+            while len(buffer) >= block_size:
+                cut = buffer.rfind(b"\n", 0, block_size) + 1
+                if not cut:
+                    cut = buffer.find(b"\n", block_size) + 1
+                if not cut:
+                    break
+                yield buffer[:cut]
+                buffer = buffer[cut:]
+    if buffer:
+        yield buffer
+
+
+def _count_entries(data: bytes) -> int:
+    return sum(1 for line in data.split(b"\n")[:-1] if line)
+
+
+def compress_ledger(
+    source: Path,
+    destination: Path | None = None,
+    *,
+    codec: LedgerCodec = "zlib",
+    block_size: int = DEFAULT_BLOCK_SIZE,
+    level: int | None = None,
+) -> Path:
+    """Write *source* as independently compressed blocks plus a block index.
+
+    Blocks end on line boundaries and hold roughly ``block_size`` raw bytes.
+    The output is byte-for-byte reversible and is written atomically, so it
+    is safe to run in the background against sealed ledgers.
+    """
+
+    if block_size <= 0:
+        msg = "ledger block_size must be positive"
+        raise ValueError(msg)
+    if codec not in {"zlib", "lzma"}:
+        msg = f"Unsupported ledger block codec: {codec!r}"
+        raise ValueError(msg)
+    target = destination or compressed_path(source)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = target.with_name(f"{target.name}.tmp")
+    blocks: list[LedgerBlock] = []
+    raw_offset = 0
+    sequence = 0
+    with tmp_path.open("wb") as handle:
+        handle.write(_MAGIC)
+        for raw in _iter_raw_blocks(source, block_size):
+            packed = _compress(codec, raw, level)
+            entries = _count_entries(raw)
+            blocks.append(
+                LedgerBlock(
+                    offset=handle.tell(),
+                    length=len(packed),
+                    raw_offset=raw_offset,
+                    raw_length=len(raw),
+                    first_sequence=sequence,
+                    entries=entries,
+                )
+            )
+            handle.write(packed)
+            raw_offset += len(raw)
+            sequence += entries
+        index_offset = handle.tell()
+        index = {
+            "schema_version": _BLOCKS_SCHEMA,
+            "codec": codec,
+            "raw_size": raw_offset,
+            "entries": sequence,
+            "blocks": [block.to_json() for block in blocks],
+        }
+        handle.write(json.dumps(index, separators=(",", ":")).encode("utf-8"))
+        handle.write(_FOOTER.pack(index_offset, _MAGIC))
+    tmp_path.replace(target)
+    return target
+
+
+class CompressedLedgerReader:
+    """Read a ``compress_ledger`` file, decompressing only the blocks needed.
+
+    Offsets match the original ledger, so a ``SparseLedgerIndex`` or
+    ``EventTypeIndex`` built before compression can still drive
+    ``iter_records_at``. A ``<file>.types`` sidecar beside the compressed file
+    (see ``compress_sealed_segments``) serves typed ``iter_events`` reads.
+    """
+
+    def __init__(self, path: Path, *, verify: bool = False) -> None:
+        self.path = path
+        self.verify = verify
+        self._codec = ""
+        self._blocks: list[LedgerBlock] | None = None
+        self._raw_offsets: list[int] = []
+        self._sequences: list[int] = []
+        self._cached: tuple[int, bytes] | None = None
+
+    def __iter__(self) -> Iterator[LedgerRecord]:
+        return self.iter_records()
+
+    @property
+    def codec(self) -> str:
+        self._load_index()
+        return self._codec
+
+    @property
+    def blocks(self) -> tuple[LedgerBlock, ...]:
+        return tuple(self._load_index())
+
+    @property
+    def raw_size(self) -> int:
+        """Size in bytes of the original, uncompressed ledger."""
+
+        blocks = self._load_index()
+        return blocks[-1].raw_offset + blocks[-1].raw_length if blocks else 0
+
+    def _load_index(self) -> list[LedgerBlock]:
+        if self._blocks is not None:
+            return self._blocks
+        with self.path.open("rb") as handle:
+            if handle.read(len(_MAGIC)) != _MAGIC:
+                msg = f"{self.path}: not a compressed ledger"
+                raise ValueError(msg)
+            handle.seek(-_FOOTER.size, 2)
+            index_offset, magic = _FOOTER.unpack(handle.read(_FOOTER.size))
+            if magic != _MAGIC:
+                msg = f"{self.path}: compressed ledger footer is damaged"
+                raise ValueError(msg)
+            handle.seek(index_offset)
+            raw_index = handle.read()[: -_FOOTER.size]
+        payload: object = json.loads(raw_index)
+        if not isinstance(payload, Mapping):
+            msg = "Compressed ledger index JSON must be an object"
+            raise TypeError(msg)
+        index = cast("Mapping[str, object]", payload)
+        codec = index.get("codec")
+        entries = index.get("blocks")
+        if not isinstance(codec, str) or not isinstance(entries, Sequence):
+            msg = "Compressed ledger index requires 'codec' and 'blocks'"
+            raise TypeError(msg)
+        blocks = [
+            LedgerBlock.from_json(cast("Mapping[str, object]", entry))
+            for entry in cast("Sequence[object]", entries)
+            if isinstance(entry, Mapping)
+        ]
+        self._codec = codec
+        self._raw_offsets = [block.raw_offset for block in blocks]
+        self._sequences = [block.first_sequence for block in blocks]
+        self._blocks = blocks
+        return blocks
+
+    def read_block(self, position: int) -> bytes:
+        """Return the decompressed bytes of block number *position*."""
+
+        if self._cached is not None and self._cached[0] == position:
+            return self._cached[1]
+        block = self._load_index()[position]
+        with self.path.open("rb") as handle:
+            handle.seek(block.offset)
+            packed = handle.read(block.length)
+        data = _decompress(self._codec, packed)
+        if len(data) != block.raw_length:
+            msg = f"{self.path}: block {position} decompressed to the wrong size"
+            raise ValueError(msg)
+        self._cached = (position, data)
+        return data
+
+    def _block_for(self, offset: int) -> int:
+        self._load_index()
+        return max(bisect.bisect_right(self._raw_offsets, offset) - 1, 0)
+
+    def iter_lines(
+        self, start: int = 0, end: int | None = None
+    ) -> Iterator[tuple[int, bytes]]:
+        """Yield ``(offset, line)`` like ``iter_ledger_lines`` on the original."""
+
+        blocks = self._load_index()
+        for position in range(self._block_for(start), len(blocks)):
+            block = blocks[position]
+            if end is not None and block.raw_offset >= end:
+                return
+            data = self.read_block(position)
+            cursor = max(start - block.raw_offset, 0)
+            while cursor < len(data):
+                offset = block.raw_offset + cursor
+                if end is not None and offset >= end:
+                    return
+                newline = data.find(b"\n", cursor)
+                if newline < 0:
+                    break
+                if newline > cursor:
+                    yield offset, data[cursor:newline]
+                cursor = newline + 1
+
+    def iter_records(
+        self, start: int = 0, end: int | None = None
+    ) -> Iterator[LedgerRecord]:
+        for offset, line in self.iter_lines(start, end):
+            yield self._parse(offset, line)
+
+    def iter_records_at(self, offsets: Iterable[int]) -> Iterator[LedgerRecord]:
+        """Yield the records starting at each of *offsets* (e.g. from an index)."""
+
+        blocks = self._load_index()
+        for offset in offsets:
+            if not blocks:
+                return
+            position = self._block_for(offset)
+            block = blocks[position]
+            data = self.read_block(position)
+            start = offset - block.raw_offset
+            newline = data.find(b"\n", start)
+            if 0 <= start < newline:
+                yield self._parse(offset, data[start:newline])
+
+    def iter_from_sequence(self, sequence: int) -> Iterator[LedgerRecord]:
+        """Yield records starting at entry number *sequence* (0-based)."""
+
+        blocks = self._load_index()
+        if not blocks:
+            return
+        position = max(bisect.bisect_right(self._sequences, sequence) - 1, 0)
+        skip = sequence - blocks[position].first_sequence
+        for record in self.iter_records(blocks[position].raw_offset):
+            if skip > 0:
+                skip -= 1
+                continue
+            yield record
+
+    def iter_events(self, types: Iterable[str] | None = None) -> Iterator[LedgerEvent]:
+        wanted = set(types) if types is not None else None
+        sidecar = EventTypeIndex.sidecar_path(self.path)
+        if wanted is not None and sidecar.exists():
+            raw_size = self.raw_size
+            index = EventTypeIndex(
+                self.path, index_path=sidecar, persist=False, ledger_size=raw_size
+            )
+            if index.end_offset == raw_size:
+                for record in self.iter_records_at(index.offsets_for(wanted)):
+                    yield record.event
+                return
+        for record in self.iter_records():
+            if wanted is None or record.event.event_type in wanted:
+                yield record.event
+
+    def _parse(self, offset: int, line: bytes) -> LedgerRecord:
+        try:
+            return parse_ledger_line(offset, line, verify=self.verify)
+        except (TypeError, ValueError) as exc:
+            msg = f"{self.path}: {exc}"
+            raise ValueError(msg) from exc
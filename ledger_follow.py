@@ -0,0 +1,295 @@
+"""Tail-follow JSONL ledgers and segment directories for live consumers."""
+
+from __future__ import annotations
+
+import contextlib
+import ctypes
+import ctypes.util
+import json
+import os
+import select
+import sys
+import time
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Protocol, Self, cast
+
+from x_make_common_x.ledger_compression import CompressedLedgerReader, compressed_path
+from x_make_common_x.ledger_reader import iter_ledger_lines, parse_ledger_line
+from x_make_common_x.ledger_segments import MANIFEST_FILENAME, LedgerManifest
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from types import TracebackType
+
+    from x_make_common_x.ledger import LedgerEvent
+    from x_make_common_x.ledger_reader import LedgerRecord
+
+__all__ = ["LedgerCursor", "LedgerFollower"]
+
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_WATCH_MASK = _IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE
+_EVENT_BUFFER = 64 << 10
+
+
+@dataclass(slots=True, frozen=True)
+class LedgerCursor:
+    """Resume point for a follower: the file being read and its byte offset.
+
+    ``segment`` is the segment file name when following a segment directory
+    and ``None`` for a single ledger file.
+    """
+
+    offset: int = 0
+    segment: str | None = None
+
+    def to_json(self) -> dict[str, object]:
+        return {"offset": self.offset, "segment": self.segment}
+
+    @classmethod
+    def from_json(cls, payload: Mapping[str, object]) -> LedgerCursor:
+        offset = payload.get("offset")
+        segment = payload.get("segment")
+        if not isinstance(offset, int) or offset < 0:
+            msg = "ledger cursor requires a non-negative integer 'offset'"
+            raise TypeError(msg)
+        return cls(offset=offset, segment=segment if isinstance(segment, str) else None)
+
+    @classmethod
+    def load(cls, path: Path) -> LedgerCursor:
+        if not path.exists():
+            return cls()
+        payload: object = json.loads(path.read_text(encoding="utf-8"))
+        if not isinstance(payload, Mapping):
+            msg = "Ledger cursor JSON must be an object"
+            raise TypeError(msg)
+        return cls.from_json(cast("Mapping[str, object]", payload))
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.tmp")
+        tmp_path.write_text(json.dumps(self.to_json()), encoding="utf-8")
+        tmp_path.replace(path)
+
+
+class _ChangeWaiter(Protocol):
+    def wait(self, timeout: float) -> None: ...
+
+    def close(self) -> None: ...
+
+
+class _SleepWaiter:
+    """Fallback that simply sleeps between polls."""
+
+    def wait(self, timeout: float) -> None:
+        time.sleep(timeout)
+
+    def close(self) -> None:
+        return None
+
+
+class _InotifyWaiter:
+    """Block on Linux inotify events for a directory instead of sleeping."""
+
+    def __init__(self, directory: Path) -> None:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        fd = int(libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC))
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        watch = int(
+            libc.inotify_add_watch(
+                fd, os.fsencode(directory), ctypes.c_uint32(_WATCH_MASK)
+            )
+        )
+        if watch < 0:
+            errno = ctypes.get_errno()
+            os.close(fd)
+            raise OSError(errno, f"inotify_add_watch failed for {directory}")
+        self._fd = fd
+
+    def wait(self, timeout: float) -> None:
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return
+        with contextlib.suppress(BlockingIOError):
+            while os.read(self._fd, _EVENT_BUFFER):
+                pass
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+def _open_waiter(directory: Path, *, use_inotify: bool) -> _ChangeWaiter:
+    if use_inotify and sys.platform.startswith("linux"):
+        with contextlib.suppress(OSError, AttributeError):
+            return _InotifyWaiter(directory)
+    return _SleepWaiter()
+
+
+class LedgerFollower:
+    """Yield ledger records as they are appended, resuming from a cursor.
+
+    *target* is either a ledger file or a ``SegmentedLedgerWriter`` directory.
+    Segment directories are followed across rotations using the manifest:
+    once a segment is drained and a later one is listed, reading moves on,
+    including through segments that ``compress_sealed_segments`` packed.
+    A single file that shrinks or is replaced is re-read from the start.
+    Only complete lines are returned, so a half-written append is picked up on
+    the next poll. On Linux the follower waits on inotify; elsewhere (or when
+    ``use_inotify=False``) it sleeps ``poll_interval`` between polls.
+    """
+
+    def __init__(
+        self,
+        target: Path,
+        *,
+        cursor: LedgerCursor | None = None,
+        poll_interval: float = 0.5,
+        verify: bool = False,
+        use_inotify: bool = True,
+    ) -> None:
+        if poll_interval <= 0:
+            msg = "ledger follow poll_interval must be positive"
+            raise ValueError(msg)
+        self.target = target
+        self.poll_interval = poll_interval
+        self.verify = verify
+        self.use_inotify = use_inotify
+        self._cursor = cursor or LedgerCursor()
+        self._identity: tuple[int, int] | None = None
+        self._waiter: _ChangeWaiter | None = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    @property
+    def cursor(self) -> LedgerCursor:
+        """Position just past the last record returned."""
+
+        return self._cursor
+
+    @property
+    def segmented(self) -> bool:
+        return self.target.is_dir()
+
+    def _segment_names(self) -> list[str]:
+        if not (self.target / MANIFEST_FILENAME).exists():
+            return []
+        return [segment.name for segment in LedgerManifest.load(self.target).segments]
+
+    def _current_path(self) -> Path | None:
+        if not self.segmented:
+            return self.target
+        names = self._segment_names()
+        if not names:
+            return None
+        if self._cursor.segment not in names:
+            self._cursor = LedgerCursor(segment=names[0])
+        return self.target / cast("str", self._cursor.segment)
+
+    def _next_segment(self) -> str | None:
+        names = self._segment_names()
+        if self._cursor.segment not in names:
+            return None
+        position = names.index(self._cursor.segment) + 1
+        return names[position] if position < len(names) else None
+
+    def _check_replaced(self, path: Path) -> None:
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return
+        identity = (stat.st_dev, stat.st_ino)
+        replaced = self._identity is not None and identity != self._identity
+        if replaced or stat.st_size < self._cursor.offset:
+            self._cursor = LedgerCursor(segment=self._cursor.segment)
+        self._identity = identity
+
+    def _iter_available(self, path: Path) -> Iterator[LedgerRecord]:
+        if path.exists():
+            lines = iter_ledger_lines(path, self._cursor.offset)
+        elif self.segmented and compressed_path(path).exists():
+            reader = CompressedLedgerReader(compressed_path(path))
+            lines = reader.iter_lines(self._cursor.offset)
+        else:
+            return
+        for offset, line in lines:
+            record = parse_ledger_line(offset, line, verify=self.verify)
+            self._cursor = LedgerCursor(
+                offset=offset + len(line) + 1, segment=self._cursor.segment
+            )
+            yield record
+
+    def _iter_new(self) -> Iterator[LedgerRecord]:
+        while (path := self._current_path()) is not None:
+            if not self.segmented:
+                self._check_replaced(path)
+            yield from self._iter_available(path)
+            if not self.segmented:
+                return
+            following = self._next_segment()
+            if following is None:
+                return
+            # The writer seals a segment before listing the next, so one more
+            # pass catches lines flushed between the read above and the check.
+            yield from self._iter_available(path)
+            self._cursor = LedgerCursor(segment=following)
+
+    def poll(self) -> list[LedgerRecord]:
+        """Return every complete record appended since the cursor, without waiting."""
+
+        return list(self._iter_new())
+
+    def _wait(self, timeout: float) -> None:
+        if self._waiter is None:
+            directory = self.target if self.segmented else self.target.parent
+            self._waiter = _open_waiter(directory, use_inotify=self.use_inotify)
+        self._waiter.wait(timeout)
+
+    def follow(self, *, idle_timeout: float | None = None) -> Iterator[LedgerRecord]:
+        """Yield records indefinitely, or until nothing arrives for ``idle_timeout``.
+
+        The cursor advances with each yielded record; persist ``cursor`` with
+        ``LedgerCursor.save`` to resume in a later process.
+        """
+
+        idle_since = time.monotonic()
+        while True:
+            received = False
+            for record in self._iter_new():
+                received = True
+                yield record
+            if received:
+                idle_since = time.monotonic()
+                continue
+            wait_for = self.poll_interval
+            if idle_timeout is not None:
+                remaining = idle_timeout - (time.monotonic() - idle_since)
+                if remaining <= 0:
+                    return
+                wait_for = min(wait_for, remaining)
+            self._wait(wait_for)
+
+    def follow_events(
+        self, *, idle_timeout: float | None = None
+    ) -> Iterator[LedgerEvent]:
+        for record in self.follow(idle_timeout=idle_timeout):
+            yield record.event
+
+    def close(self) -> None:
+        if self._waiter is not None:
+            self._waiter.close()
+            self._waiter = None
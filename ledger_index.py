@@ -0,0 +1,406 @@
+"""Sparse sidecar offset index for random access into JSONL ledgers."""
+
+from __future__ import annotations
+
+import bisect
+import contextlib
+import heapq
+import json
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass
+from datetime import datetime
+from typing import TYPE_CHECKING, cast
+
+from x_make_common_x.ledger import read_last_line
+from x_make_common_x.ledger_reader import LedgerReader, iter_ledger_lines
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from x_make_common_x.ledger import LedgerEvent
+    from x_make_common_x.ledger_reader import LedgerRecord
+
+__all__ = ["EventTypeIndex", "LedgerIndexPoint", "SparseLedgerIndex"]
+
+DEFAULT_INDEX_INTERVAL = 1024
+
+
+def _timestamp(value: str) -> float | None:
+    with contextlib.suppress(ValueError):
+        return datetime.fromisoformat(value).timestamp()
+    return None
+
+
+def _entry_field(line: bytes, key: str) -> str:
+    with contextlib.suppress(ValueError):
+        payload: object = json.loads(line)
+        if isinstance(payload, Mapping):
+            value = cast("Mapping[str, object]", payload).get(key)
+            if isinstance(value, str):
+                return value
+    return ""
+
+
+@dataclass(slots=True, frozen=True)
+class LedgerIndexPoint:
+    """Sequence number, emission time and byte offset of one indexed entry."""
+
+    sequence: int
+    emitted_at: str
+    offset: int
+
+    def to_json(self) -> dict[str, object]:
+        return {
+            "seq": self.sequence,
+            "emitted_at": self.emitted_at,
+            "offset": self.offset,
+        }
+
+
+class SparseLedgerIndex:
+    """Every ``interval``-th entry's position, stored beside the ledger.
+
+    The sidecar (``<ledger>.idx``) is append-only JSONL. Opening the index
+    catches up on entries appended since it was last written and rebuilds it
+    when it points past the end of the ledger. Attach it to a
+    ``BufferedLedgerWriter`` via ``observers=`` to keep it current while
+    writing. Time seeks assume ``emitted_at`` is non-decreasing.
+    """
+
+    def __init__(
+        self,
+        ledger_path: Path,
+        *,
+        interval: int = DEFAULT_INDEX_INTERVAL,
+        index_path: Path | None = None,
+    ) -> None:
+        if interval <= 0:
+            msg = "ledger index interval must be positive"
+            raise ValueError(msg)
+        self.ledger_path = ledger_path
+        self.interval = interval
+        self.index_path = index_path or self.sidecar_path(ledger_path)
+        self._points: list[LedgerIndexPoint] = []
+        self._sequences: list[int] = []
+        self._times: list[float] = []
+        self._pending: list[LedgerIndexPoint] = []
+        self._next_sequence = 0
+        self._end_offset = 0
+        self._load()
+        self.refresh()
+
+    @staticmethod
+    def sidecar_path(ledger_path: Path) -> Path:
+        return ledger_path.with_name(f"{ledger_path.name}.idx")
+
+    @property
+    def points(self) -> tuple[LedgerIndexPoint, ...]:
+        return tuple(self._points)
+
+    @property
+    def entries(self) -> int:
+        """Number of ledger entries the index has accounted for."""
+
+        return self._next_sequence
+
+    def _load(self) -> None:
+        if not self.index_path.exists():
+            return
+        size = self.ledger_path.stat().st_size if self.ledger_path.exists() else 0
+        for raw in self.index_path.read_bytes().splitlines():
+            point = self._parse_point(raw)
+            if point is None or point.offset >= size:
+                self.rebuild()
+                return
+            self._remember(point)
+        if self._points:
+            last = self._points[-1]
+            self._next_sequence = last.sequence
+            self._end_offset = last.offset
+
+    def _parse_point(self, raw: bytes) -> LedgerIndexPoint | None:
+        try:
+            payload: object = json.loads(raw)
+        except ValueError:
+            return None
+        if not isinstance(payload, Mapping):
+            return None
+        entry = cast("Mapping[str, object]", payload)
+        sequence = entry.get("seq")
+        offset = entry.get("offset")
+        emitted_at = entry.get("emitted_at")
+        if not isinstance(sequence, int) or not isinstance(offset, int):
+            return None
+        if sequence % self.interval:
+            return None
+        return LedgerIndexPoint(
+            sequence=sequence,
+            emitted_at=emitted_at if isinstance(emitted_at, str) else "",
+            offset=offset,
+        )
+
+    def _remember(self, point: LedgerIndexPoint) -> None:
+        self._points.append(point)
+        self._sequences.append(point.sequence)
+        stamp = _timestamp(point.emitted_at)
+        if stamp is None:
+            stamp = self._times[-1] if self._times else float("-inf")
+        self._times.append(stamp)
+
+    def _observe(self, offset: int, length: int, emitted_at: str) -> None:
+        sequence = self._next_sequence
+        known = bool(self._sequences) and self._sequences[-1] == sequence
+        if sequence % self.interval == 0 and not known:
+            point = LedgerIndexPoint(sequence, emitted_at, offset)
+            self._remember(point)
+            self._pending.append(point)
+        self._next_sequence += 1
+        self._end_offset = offset + length
+
+    def refresh(self) -> None:
+        """Index entries appended to the ledger since the last known offset."""
+
+        if self.ledger_path.exists():
+            for offset, line in iter_ledger_lines(self.ledger_path, self._end_offset):
+                self._observe(offset, len(line) + 1, _entry_field(line, "emitted_at"))
+        self.flushed()
+
+    def rebuild(self) -> None:
+        """Discard the sidecar and re-derive it from the ledger itself."""
+
+        self.index_path.unlink(missing_ok=True)
+        self._points.clear()
+        self._sequences.clear()
+        self._times.clear()
+        self._pending.clear()
+        self._next_sequence = 0
+        self._end_offset = 0
+        self.refresh()
+
+    def entry_appended(self, offset: int, line: bytes, event: LedgerEvent) -> None:
+        if offset < self._end_offset:
+            return
+        self._observe(offset, len(line), event.emitted_at)
+
+    def flushed(self) -> None:
+        if not self._pending:
+            return
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        lines = "".join(json.dumps(point.to_json()) + "\n" for point in self._pending)
+        with self.index_path.open("a", encoding="utf-8") as handle:
+            handle.write(lines)
+        self._pending.clear()
+
+    def locate_sequence(self, sequence: int) -> LedgerIndexPoint | None:
+        """Return the last indexed point at or before *sequence*."""
+
+        position = bisect.bisect_right(self._sequences, sequence) - 1
+        return self._points[position] if position >= 0 else None
+
+    def locate_time(self, moment: datetime) -> LedgerIndexPoint | None:
+        """Return the last indexed point emitted strictly before *moment*."""
+
+        position = bisect.bisect_left(self._times, moment.timestamp()) - 1
+        return self._points[position] if position >= 0 else None
+
+    def iter_from_sequence(
+        self, sequence: int, *, verify: bool = False
+    ) -> Iterator[LedgerRecord]:
+        """Yield records starting at entry number *sequence* (0-based)."""
+
+        point = self.locate_sequence(sequence)
+        start = point.offset if point is not None else 0
+        skip = sequence - (point.sequence if point is not None else 0)
+        reader = LedgerReader(self.ledger_path, verify=verify)
+        for record in reader.iter_records(start):
+            if skip > 0:
+                skip -= 1
+                continue
+            yield record
+
+    def iter_from_time(
+        self, moment: datetime, *, verify: bool = False
+    ) -> Iterator[LedgerRecord]:
+        """Yield records emitted at or after *moment*."""
+
+        point = self.locate_time(moment)
+        start = point.offset if point is not None else 0
+        threshold = moment.timestamp()
+        reader = LedgerReader(self.ledger_path, verify=verify)
+        records = reader.iter_records(start)
+        for record in records:
+            stamp = _timestamp(record.event.emitted_at)
+            if stamp is not None and stamp < threshold:
+                continue
+            yield record
+            yield from records
+            return
+
+
+class EventTypeIndex:
+    """Byte offsets of ledger entries grouped by ``event_type``.
+
+    Stored beside the ledger as ``<ledger>.types``: one JSON line per flush
+    holding the new offsets per type and the ledger offset they cover up to.
+    Like ``SparseLedgerIndex`` it catches up on open, rebuilds when stale,
+    and can observe a ``BufferedLedgerWriter``. Readers pass
+    ``persist=False`` to catch up in memory without writing the sidecar.
+    ``ledger_size`` is for ledgers not readable as raw JSONL (e.g. compressed
+    segments): the sidecar is trusted up to that size and never refreshed.
+    ``LedgerWriter`` calls ``catch_up`` after each append, so the sidecar of
+    a ledger written one event at a time stays current too.
+    """
+
+    def __init__(
+        self,
+        ledger_path: Path,
+        *,
+        index_path: Path | None = None,
+        persist: bool = True,
+        ledger_size: int | None = None,
+    ) -> None:
+        self.ledger_path = ledger_path
+        self.index_path = index_path or self.sidecar_path(ledger_path)
+        self.persist = persist
+        self.ledger_size = ledger_size
+        self._offsets: dict[str, list[int]] = {}
+        self._pending: dict[str, list[int]] = {}
+        self._end_offset = 0
+        self._load()
+        self.refresh()
+
+    @staticmethod
+    def sidecar_path(ledger_path: Path) -> Path:
+        return ledger_path.with_name(f"{ledger_path.name}.types")
+
+    @property
+    def event_types(self) -> tuple[str, ...]:
+        return tuple(sorted(self._offsets))
+
+    @property
+    def end_offset(self) -> int:
+        """Ledger offset up to which entries are indexed."""
+
+        return self._end_offset
+
+    def count(self, event_type: str) -> int:
+        return len(self._offsets.get(event_type, ()))
+
+    def _load(self) -> None:
+        if not self.index_path.exists():
+            return
+        if self.ledger_size is not None:
+            size = self.ledger_size
+        elif self.ledger_path.exists():
+            size = self.ledger_path.stat().st_size
+        else:
+            size = 0
+        for raw in self.index_path.read_bytes().splitlines():
+            batch = self._parse_batch(raw)
+            if batch is None or batch[0] > size:
+                self.rebuild()
+                return
+            end_offset, offsets = batch
+            if end_offset <= self._end_offset:
+                continue
+            # Another instance may have written a batch overlapping this one.
+            for event_type, positions in offsets.items():
+                self._offsets.setdefault(event_type, []).extend(
+                    position for position in positions if position >= self._end_offset
+                )
+            self._end_offset = end_offset
+
+    @staticmethod
+    def _parse_batch(raw: bytes) -> tuple[int, dict[str, list[int]]] | None:
+        try:
+            payload: object = json.loads(raw)
+        except ValueError:
+            return None
+        if not isinstance(payload, Mapping):
+            return None
+        entry = cast("Mapping[str, object]", payload)
+        end_offset = entry.get("end")
+        offsets_obj = entry.get("offsets")
+        if not isinstance(end_offset, int) or not isinstance(offsets_obj, Mapping):
+            return None
+        offsets: dict[str, list[int]] = {}
+        for key, value in cast("Mapping[str, object]", offsets_obj).items():
+            if not isinstance(value, list):
+                return None
+            offsets[str(key)] = [int(item) for item in cast("list[int]", value)]
+        return end_offset, offsets
+
+    @classmethod
+    def catch_up(cls, ledger_path: Path, *, index_path: Path | None = None) -> None:
+        """Append a batch for entries past the sidecar's last batch.
+
+        Only the sidecar's last line and the ledger's tail are read. A batch
+        overlapping one written concurrently is merged away on load; a
+        sidecar that is unreadable or ahead of the ledger is left for the
+        next open to rebuild.
+        """
+
+        index_path = index_path or cls.sidecar_path(ledger_path)
+        last = read_last_line(index_path)
+        batch = cls._parse_batch(last) if last is not None else None
+        if batch is None or not ledger_path.exists():
+            return
+        start = batch[0]
+        if start > ledger_path.stat().st_size:
+            return
+        offsets: dict[str, list[int]] = {}
+        end_offset = start
+        for offset, line in iter_ledger_lines(ledger_path, start):
+            offsets.setdefault(_entry_field(line, "event_type"), []).append(offset)
+            end_offset = offset + len(line) + 1
+        if not offsets:
+            return
+        batch_line = {"end": end_offset, "offsets": offsets}
+        with index_path.open("a", encoding="utf-8") as handle:
+            handle.write(json.dumps(batch_line, separators=(",", ":")) + "\n")
+
+    def _observe(self, offset: int, length: int, event_type: str) -> None:
+        self._offsets.setdefault(event_type, []).append(offset)
+        self._pending.setdefault(event_type, []).append(offset)
+        self._end_offset = offset + length
+
+    def refresh(self) -> None:
+        """Index entries appended to the ledger since the last known offset."""
+
+        if self.ledger_size is None and self.ledger_path.exists():
+            for offset, line in iter_ledger_lines(self.ledger_path, self._end_offset):
+                self._observe(offset, len(line) + 1, _entry_field(line, "event_type"))
+        self.flushed()
+
+    def rebuild(self) -> None:
+        """Discard the sidecar and re-derive it from the ledger itself."""
+
+        if self.persist:
+            self.index_path.unlink(missing_ok=True)
+        self._offsets.clear()
+        self._pending.clear()
+        self._end_offset = 0
+        self.refresh()
+
+    def entry_appended(self, offset: int, line: bytes, event: LedgerEvent) -> None:
+        if offset < self._end_offset:
+            return
+        self._observe(offset, len(line), event.event_type)
+
+    def flushed(self) -> None:
+        if not self._pending:
+            return
+        if not self.persist:
+            self._pending = {}
+            return
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        batch = {"end": self._end_offset, "offsets": self._pending}
+        with self.index_path.open("a", encoding="utf-8") as handle:
+            handle.write(json.dumps(batch, separators=(",", ":")) + "\n")
+        self._pending = {}
+
+    def offsets_for(self, types: Iterable[str]) -> list[int]:
+        """Return the sorted offsets of entries whose type is in *types*."""
+
+        selected = [self._offsets.get(event_type, []) for event_type in set(types)]
+        return list(heapq.merge(*selected))
@@ -0,0 +1,580 @@
+"""Merkle checkpoints and inclusion/consistency proofs over ledger digests."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import struct
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, cast
+
+from x_make_common_x.ledger_reader import iter_ledger_lines
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from x_make_common_x.ledger import LedgerEvent
+
+__all__ = [
+    "LedgerConsistencyProof",
+    "LedgerInclusionProof",
+    "LedgerMerkleCheckpoint",
+    "LedgerMerkleLog",
+    "verify_consistency",
+    "verify_inclusion",
+]
+
+DEFAULT_CHECKPOINT_INTERVAL = 4096
+_LEAF = struct.Struct(">Q32s")
+_NODE_SIZE = 32
+_RESTORE_CHUNK = 4096
+EMPTY_ROOT = hashlib.sha256(b"").hexdigest()
+
+
+def _leaf_node(digest: bytes) -> bytes:
+    return hashlib.sha256(b"\x00" + digest).digest()
+
+
+def _leaf_hash(digest: str) -> bytes:
+    return _leaf_node(bytes.fromhex(digest))
+
+
+def _node_hash(left: bytes, right: bytes) -> bytes:
+    return hashlib.sha256(b"\x01" + left + right).digest()
+
+
+def _split(size: int) -> int:
+    """Largest power of two strictly below *size* (RFC 6962 ``k``)."""
+
+    return 1 << ((size - 1).bit_length() - 1)
+
+
+def _node_position(level: int, index: int) -> int:
+    """Record number of interior node (*level* >= 1, *index*) in ``.nodes``.
+
+    The node completes with leaf ``last``; before it come the nodes finished
+    by earlier leaves (``last - popcount(last)``) and the ``level - 1`` nodes
+    below it on the same right edge.
+    """
+
+    last = ((index + 1) << level) - 1
+    return last - last.bit_count() + level - 1
+
+
+def _whole_records(path: Path, record_size: int) -> int:
+    """Count whole fixed-size records in *path*, trimming a torn final write."""
+
+    if not path.exists():
+        return 0
+    length = path.stat().st_size
+    whole = length - length % record_size
+    if whole != length:
+        with path.open("r+b") as handle:
+            handle.truncate(whole)
+    return whole // record_size
+
+
+def _read_record(path: Path, record_size: int, index: int) -> bytes:
+    with path.open("rb") as handle:
+        handle.seek(index * record_size)
+        record = handle.read(record_size)
+    if len(record) != record_size:
+        msg = f"{path}: sidecar record {index} is truncated"
+        raise ValueError(msg)
+    return record
+
+
+def _line_digest(line: bytes, offset: int) -> str:
+    entry: object = json.loads(line)
+    digest = entry.get("sha256") if isinstance(entry, Mapping) else None
+    if not isinstance(digest, str):
+        msg = f"ledger entry at byte {offset} has no 'sha256' to commit to"
+        raise TypeError(msg)
+    return digest
+
+
+@dataclass(slots=True, frozen=True)
+class LedgerMerkleCheckpoint:
+    """Signed-off tree head: the Merkle root over the first ``size`` entries."""
+
+    size: int
+    root: str
+    created_at: str = ""
+
+    def to_json(self) -> dict[str, object]:
+        return {"size": self.size, "root": self.root, "created_at": self.created_at}
+
+    @classmethod
+    def from_json(cls, payload: Mapping[str, object]) -> LedgerMerkleCheckpoint:
+        size = payload.get("size")
+        root = payload.get("root")
+        created_at = payload.get("created_at")
+        if not isinstance(size, int) or not isinstance(root, str):
+            msg = "ledger Merkle checkpoint requires integer 'size' and string 'root'"
+            raise TypeError(msg)
+        return cls(
+            size=size,
+            root=root,
+            created_at=created_at if isinstance(created_at, str) else "",
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class LedgerInclusionProof:
+    """Audit path showing entry ``index`` (digest ``leaf``) is in a tree of ``size``."""
+
+    index: int
+    size: int
+    leaf: str
+    path: tuple[str, ...]
+
+    def to_json(self) -> dict[str, object]:
+        return {
+            "index": self.index,
+            "size": self.size,
+            "leaf": self.leaf,
+            "path": list(self.path),
+        }
+
+    @classmethod
+    def from_json(cls, payload: Mapping[str, object]) -> LedgerInclusionProof:
+        index = payload.get("index")
+        size = payload.get("size")
+        leaf = payload.get("leaf")
+        path = payload.get("path")
+        if (
+            not isinstance(index, int)
+            or not isinstance(size, int)
+            or not isinstance(leaf, str)
+            or not isinstance(path, Sequence)
+        ):
+            msg = "ledger inclusion proof requires 'index', 'size', 'leaf', 'path'"
+            raise TypeError(msg)
+        return cls(
+            index=index,
+            size=size,
+            leaf=leaf,
+            path=tuple(str(node) for node in cast("Sequence[object]", path)),
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class LedgerConsistencyProof:
+    """Proof that the tree of ``old_size`` is a prefix of the tree of ``new_size``."""
+
+    old_size: int
+    new_size: int
+    path: tuple[str, ...]
+
+    def to_json(self) -> dict[str, object]:
+        return {
+            "old_size": self.old_size,
+            "new_size": self.new_size,
+            "path": list(self.path),
+        }
+
+    @classmethod
+    def from_json(cls, payload: Mapping[str, object]) -> LedgerConsistencyProof:
+        old_size = payload.get("old_size")
+        new_size = payload.get("new_size")
+        path = payload.get("path")
+        if (
+            not isinstance(old_size, int)
+            or not isinstance(new_size, int)
+            or not isinstance(path, Sequence)
+        ):
+            msg = "ledger consistency proof requires 'old_size', 'new_size', 'path'"
+            raise TypeError(msg)
+        return cls(
+            old_size=old_size,
+            new_size=new_size,
+            path=tuple(str(node) for node in cast("Sequence[object]", path)),
+        )
+
+
+def _decode_path(nodes: Sequence[str], seed: str | None = None) -> list[bytes]:
+    """Decode hex proof nodes, prefixing *seed*; empty on malformed input."""
+
+    try:
+        path = [bytes.fromhex(node) for node in nodes]
+        if seed is not None:
+            path.insert(0, bytes.fromhex(seed))
+    except ValueError:
+        return []
+    return path
+
+
+def verify_inclusion(proof: LedgerInclusionProof, root: str) -> bool:
+    """Check *proof* against a trusted *root* in O(log n) hashes (RFC 9162)."""
+
+    if not 0 <= proof.index < proof.size:
+        return False
+    try:
+        node = _leaf_hash(proof.leaf)
+    except ValueError:
+        return False
+    path = _decode_path(proof.path)
+    if len(path) != len(proof.path):
+        return False
+    index, last = proof.index, proof.size - 1
+    for sibling in path:
+        if last == 0:
+            return False
+        if index & 1 or index == last:
+            node = _node_hash(sibling, node)
+            while not index & 1 and index:
+                index >>= 1
+                last >>= 1
+        else:
+            node = _node_hash(node, sibling)
+        index >>= 1
+        last >>= 1
+    return last == 0 and node.hex() == root
+
+
+def verify_consistency(
+    proof: LedgerConsistencyProof, old_root: str, new_root: str
+) -> bool:
+    """Check that *old_root* is a prefix commitment of *new_root* (RFC 9162)."""
+
+    old_size, new_size = proof.old_size, proof.new_size
+    if not 0 <= old_size <= new_size:
+        return False
+    if old_size in {0, new_size}:
+        expected = EMPTY_ROOT if old_size == 0 else new_root
+        return not proof.path and old_root == expected
+    seed = old_root if old_size & (old_size - 1) == 0 else None
+    path = _decode_path(proof.path, seed)
+    if not path:
+        return False
+    index, last = old_size - 1, new_size - 1
+    while index & 1:
+        index >>= 1
+        last >>= 1
+    old_node = new_node = path[0]
+    for sibling in path[1:]:
+        if last == 0:
+            return False
+        if index & 1 or index == last:
+            old_node = _node_hash(sibling, old_node)
+            new_node = _node_hash(sibling, new_node)
+            while not index & 1 and index:
+                index >>= 1
+                last >>= 1
+        else:
+            new_node = _node_hash(new_node, sibling)
+        index >>= 1
+        last >>= 1
+    return last == 0 and old_node.hex() == old_root and new_node.hex() == new_root
+
+
+class LedgerMerkleLog:
+    """Merkle tree over a ledger's entry digests, kept in sidecars.
+
+    Leaves are the stored ``sha256`` of each entry (no payload re-hashing).
+    ``<ledger>.leaves`` holds one fixed-size ``(offset, digest)`` record per
+    entry, ``<ledger>.nodes`` every interior hash as a 32-byte record in the
+    order the nodes complete, and ``<ledger>.checkpoints`` is append-only
+    JSONL of tree heads taken every ``interval`` entries or on demand. Only
+    the right edge of the tree is held in memory; roots and proofs read the
+    O(log n) nodes they need by position. Like ``SparseLedgerIndex`` it
+    catches up on open and can observe a ``BufferedLedgerWriter``.
+    """
+
+    def __init__(
+        self,
+        ledger_path: Path,
+        *,
+        interval: int = DEFAULT_CHECKPOINT_INTERVAL,
+    ) -> None:
+        if interval <= 0:
+            msg = "ledger checkpoint interval must be positive"
+            raise ValueError(msg)
+        self.ledger_path = ledger_path
+        self.interval = interval
+        self.leaves_path = ledger_path.with_name(f"{ledger_path.name}.leaves")
+        self.nodes_path = ledger_path.with_name(f"{ledger_path.name}.nodes")
+        self.checkpoints_path = ledger_path.with_name(f"{ledger_path.name}.checkpoints")
+        self._frontier: list[bytes | None] = []
+        self._size = 0
+        self._last_offset = -1
+        self._stored_leaves = 0
+        self._stored_nodes = 0
+        self._checkpoints: list[LedgerMerkleCheckpoint] = []
+        self._pending_leaves: list[bytes] = []
+        self._pending_nodes: list[bytes] = []
+        self._pending_checkpoints: list[LedgerMerkleCheckpoint] = []
+        self._load()
+        self.refresh()
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def checkpoints(self) -> tuple[LedgerMerkleCheckpoint, ...]:
+        return tuple(self._checkpoints)
+
+    def leaf_offset(self, index: int) -> int:
+        """Byte offset of entry *index* in the ledger, for fetching its line."""
+
+        return self._leaf(index)[0]
+
+    def _leaf(self, index: int) -> tuple[int, bytes]:
+        if not 0 <= index < self._size:
+            msg = f"entry {index} is outside a tree of {self._size} leaves"
+            raise IndexError(msg)
+        if index >= self._stored_leaves:
+            record = self._pending_leaves[index - self._stored_leaves]
+        else:
+            record = _read_record(self.leaves_path, _LEAF.size, index)
+        offset, digest = cast("tuple[int, bytes]", _LEAF.unpack(record))
+        return offset, digest
+
+    def _node(self, level: int, index: int) -> bytes:
+        """Hash of the complete subtree of width ``2**level`` at *index*."""
+
+        if level == 0:
+            return _leaf_node(self._leaf(index)[1])
+        position = _node_position(level, index)
+        if position >= self._stored_nodes:
+            return self._pending_nodes[position - self._stored_nodes]
+        return _read_record(self.nodes_path, _NODE_SIZE, position)
+
+    def _load(self) -> None:
+        if not self.leaves_path.exists():
+            return
+        leaves = _whole_records(self.leaves_path, _LEAF.size)
+        if leaves == 0:
+            return
+        size = self.ledger_path.stat().st_size if self.ledger_path.exists() else 0
+        record = _read_record(self.leaves_path, _LEAF.size, leaves - 1)
+        last_offset = cast("int", _LEAF.unpack(record)[0])
+        if last_offset >= size:
+            self.rebuild()
+            return
+        self._size = self._stored_leaves = leaves
+        self._last_offset = last_offset
+        if _whole_records(self.nodes_path, _NODE_SIZE) == leaves - leaves.bit_count():
+            self._stored_nodes = leaves - leaves.bit_count()
+            self._frontier = self._read_frontier()
+        else:
+            self._restore_nodes()
+        if self.checkpoints_path.exists():
+            for line in self.checkpoints_path.read_bytes().splitlines():
+                payload: object = json.loads(line)
+                if isinstance(payload, Mapping):
+                    checkpoint = LedgerMerkleCheckpoint.from_json(
+                        cast("Mapping[str, object]", payload)
+                    )
+                    if checkpoint.size <= self.size:
+                        self._checkpoints.append(checkpoint)
+
+    def _read_frontier(self) -> list[bytes | None]:
+        frontier: list[bytes | None] = [None] * self._size.bit_length()
+        start = 0
+        for level in reversed(range(len(frontier))):
+            if self._size >> level & 1:
+                frontier[level] = self._node(level, start >> level)
+                start += 1 << level
+        return frontier
+
+    def _restore_nodes(self) -> None:
+        """Re-derive ``.nodes`` from the stored leaf digests (older sidecars)."""
+
+        self.nodes_path.unlink(missing_ok=True)
+        self._frontier = []
+        self._stored_nodes = 0
+        with self.leaves_path.open("rb") as handle:
+            for _ in range(0, self._stored_leaves, _RESTORE_CHUNK):
+                chunk = handle.read(_RESTORE_CHUNK * _LEAF.size)
+                for _offset, digest in _LEAF.iter_unpack(chunk):
+                    self._push(_leaf_node(digest))
+                self._write_nodes()
+
+    def _push(self, node: bytes) -> None:
+        level = 0
+        while level < len(self._frontier):
+            left = self._frontier[level]
+            if left is None:
+                self._frontier[level] = node
+                return
+            node = _node_hash(left, node)
+            self._frontier[level] = None
+            self._pending_nodes.append(node)
+            level += 1
+        self._frontier.append(node)
+
+    def _observe(self, offset: int, digest: str) -> None:
+        raw = bytes.fromhex(digest)
+        self._pending_leaves.append(_LEAF.pack(offset, raw))
+        self._push(_leaf_node(raw))
+        self._size += 1
+        self._last_offset = offset
+        if self._size % self.interval == 0:
+            self._pending_checkpoints.append(self._head())
+
+    def refresh(self) -> None:
+        """Add leaves for entries appended since the last known one."""
+
+        if self.ledger_path.exists():
+            start = max(self._last_offset, 0)
+            for offset, line in iter_ledger_lines(self.ledger_path, start):
+                if offset <= self._last_offset:
+                    continue
+                self._observe(offset, _line_digest(line, offset))
+        self.flushed()
+
+    def rebuild(self) -> None:
+        """Discard every sidecar and re-derive them from the ledger."""
+
+        self.leaves_path.unlink(missing_ok=True)
+        self.nodes_path.unlink(missing_ok=True)
+        self.checkpoints_path.unlink(missing_ok=True)
+        self._frontier = []
+        self._size = 0
+        self._last_offset = -1
+        self._stored_leaves = 0
+        self._stored_nodes = 0
+        self._checkpoints.clear()
+        self._pending_leaves.clear()
+        self._pending_nodes.clear()
+        self._pending_checkpoints.clear()
+        self.refresh()
+
+    def entry_appended(self, offset: int, line: bytes, event: LedgerEvent) -> None:
+        del event
+        if offset <= self._last_offset:
+            return
+        self._observe(offset, _line_digest(line, offset))
+
+    def _write_nodes(self) -> None:
+        if not self._pending_nodes:
+            return
+        with self.nodes_path.open("ab") as handle:
+            handle.write(b"".join(self._pending_nodes))
+        self._stored_nodes += len(self._pending_nodes)
+        self._pending_nodes.clear()
+
+    def flushed(self) -> None:
+        # Leaves first: nodes missing after a crash are re-derived from them.
+        if self._pending_leaves:
+            self.leaves_path.parent.mkdir(parents=True, exist_ok=True)
+            with self.leaves_path.open("ab") as handle:
+                handle.write(b"".join(self._pending_leaves))
+            self._stored_leaves += len(self._pending_leaves)
+            self._pending_leaves.clear()
+        self._write_nodes()
+        if self._pending_checkpoints:
+            lines = "".join(
+                json.dumps(checkpoint.to_json()) + "\n"
+                for checkpoint in self._pending_checkpoints
+            )
+            with self.checkpoints_path.open("a", encoding="utf-8") as handle:
+                handle.write(lines)
+            self._checkpoints.extend(self._pending_checkpoints)
+            self._pending_checkpoints.clear()
+
+    def _head(self) -> LedgerMerkleCheckpoint:
+        return LedgerMerkleCheckpoint(
+            size=self.size,
+            root=self.root(),
+            created_at=datetime.now(UTC).isoformat(),
+        )
+
+    def checkpoint(self) -> LedgerMerkleCheckpoint:
+        """Record a tree head for the current size and persist it."""
+
+        self.refresh()
+        head = self._head()
+        if not self._checkpoints or self._checkpoints[-1].size != head.size:
+            self._pending_checkpoints.append(head)
+            self.flushed()
+        return head
+
+    def _subtree(self, start: int, end: int) -> bytes:
+        width = end - start
+        if width & (width - 1) == 0 and start % width == 0:
+            return self._node(width.bit_length() - 1, start // width)
+        middle = start + _split(width)
+        return _node_hash(self._subtree(start, middle), self._subtree(middle, end))
+
+    def _check_size(self, size: int | None) -> int:
+        resolved = self.size if size is None else size
+        if not 0 <= resolved <= self.size:
+            msg = f"ledger Merkle tree has {self.size} leaves, not {resolved}"
+            raise ValueError(msg)
+        return resolved
+
+    def root(self, size: int | None = None) -> str:
+        """Merkle root over the first *size* entries (default: all of them)."""
+
+        resolved = self._check_size(size)
+        if resolved == 0:
+            return EMPTY_ROOT
+        if resolved < self._size:
+            return self._subtree(0, resolved).hex()
+        node: bytes | None = None
+        for subtree in self._frontier:
+            if subtree is not None:
+                node = subtree if node is None else _node_hash(subtree, node)
+        return cast("bytes", node).hex()
+
+    def inclusion_proof(
+        self, index: int, size: int | None = None
+    ) -> LedgerInclusionProof:
+        resolved = self._check_size(size)
+        if not 0 <= index < resolved:
+            msg = f"entry {index} is outside a tree of {resolved} leaves"
+            raise ValueError(msg)
+        path: list[bytes] = []
+        start, end, target = 0, resolved, index
+        while end - start > 1:
+            middle = start + _split(end - start)
+            if target < middle:
+                path.append(self._subtree(middle, end))
+                end = middle
+            else:
+                path.append(self._subtree(start, middle))
+                start = middle
+        return LedgerInclusionProof(
+            index=index,
+            size=resolved,
+            leaf=self._leaf(index)[1].hex(),
+            path=tuple(node.hex() for node in reversed(path)),
+        )
+
+    def consistency_proof(
+        self, old_size: int, new_size: int | None = None
+    ) -> LedgerConsistencyProof:
+        resolved = self._check_size(new_size)
+        if not 0 <= old_size <= resolved:
+            msg = f"cannot prove size {old_size} against size {resolved}"
+            raise ValueError(msg)
+        path: list[bytes] = []
+        if 0 < old_size < resolved:
+            self._subproof(old_size, 0, resolved, complete=True, path=path)
+        return LedgerConsistencyProof(
+            old_size=old_size,
+            new_size=resolved,
+            path=tuple(node.hex() for node in path),
+        )
+
+    def _subproof(
+        self, old_size: int, start: int, end: int, *, complete: bool, path: list[bytes]
+    ) -> None:
+        if old_size == end - start:
+            if not complete:
+                path.append(self._subtree(start, end))
+            return
+        middle = start + _split(end - start)
+        if old_size <= middle - start:
+            self._subproof(old_size, start, middle, complete=complete, path=path)
+            path.append(self._subtree(middle, end))
+        else:
+            self._subproof(
+                old_size - (middle - start), middle, end, complete=False, path=path
+            )
+            path.append(self._subtree(start, middle))
@@ -0,0 +1,329 @@
+"""Streaming readers and parallel auditors for JSONL ledgers."""
+
+from __future__ import annotations
+
+import itertools
+import json
+import mmap
+import os
+from collections.abc import Iterable, Iterator, Mapping
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, BinaryIO, cast
+
+from x_make_common_x.ledger import GENESIS_DIGEST, LedgerEvent
+from x_make_common_x.ledger_verify import verify_entry_line
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+__all__ = [
+    "LedgerAudit",
+    "LedgerReader",
+    "LedgerRecord",
+    "iter_ledger_lines",
+    "parse_ledger_line",
+    "verify_ledger",
+]
+
+_READ_CHUNK_SIZE = 1 << 20
+_PARALLEL_CHUNK_SIZE = 64 << 20
+
+
+@dataclass(slots=True, frozen=True)
+class LedgerRecord:
+    """One ledger entry together with its byte offset and stored digests."""
+
+    offset: int
+    event: LedgerEvent
+    sha256: str | None
+    prev_sha256: str | None = None
+
+
+def _record_from_entry(offset: int, entry: Mapping[str, object]) -> LedgerRecord:
+    event_type = entry.get("event_type")
+    payload = entry.get("payload")
+    emitted_at = entry.get("emitted_at")
+    if not isinstance(event_type, str) or not isinstance(payload, Mapping):
+        msg = f"ledger entry at byte {offset} lacks 'event_type' or 'payload'"
+        raise TypeError(msg)
+    event = LedgerEvent(
+        event_type=event_type,
+        payload=cast("Mapping[str, Any]", payload),
+        emitted_at=emitted_at if isinstance(emitted_at, str) else "",
+    )
+    sha256 = entry.get("sha256")
+    prev_sha256 = entry.get("prev_sha256")
+    return LedgerRecord(
+        offset=offset,
+        event=event,
+        sha256=sha256 if isinstance(sha256, str) else None,
+        prev_sha256=prev_sha256 if isinstance(prev_sha256, str) else None,
+    )
+
+
+def _iter_mapped_lines(
+    view: mmap.mmap, start: int, end: int
+) -> Iterator[tuple[int, bytes]]:
+    position = start
+    while position < end:
+        newline = view.find(b"\n", position, end)
+        if newline < 0:
+            return
+        if newline > position:
+            yield position, view[position:newline]
+        position = newline + 1
+
+
+def _iter_buffered_lines(
+    handle: BinaryIO, start: int, end: int
+) -> Iterator[tuple[int, bytes]]:
+    handle.seek(start)
+    offset = start
+    buffer = b""
+    while offset + len(buffer) < end:
+        chunk = handle.read(min(_READ_CHUNK_SIZE, end - offset - len(buffer)))
+        if not chunk:
+            return
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            if line:
+                yield offset, line
+            offset += len(line) + 1
+
+
+def iter_ledger_lines(
+    path: Path, start: int = 0, end: int | None = None
+) -> Iterator[tuple[int, bytes]]:
+    """Yield ``(offset, line)`` for complete lines between *start* and *end*.
+
+    The file is memory-mapped when possible; a trailing line without a newline
+    is treated as an append in progress and skipped.
+    """
+
+    with path.open("rb") as handle:
+        size = os.fstat(handle.fileno()).st_size
+        stop = size if end is None else min(end, size)
+        if start >= stop:
+            return
+        try:
+            view = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            yield from _iter_buffered_lines(handle, start, stop)
+            return
+        with view:
+            yield from _iter_mapped_lines(view, start, stop)
+
+
+def _iter_lines_at(
+    handle: BinaryIO, offsets: Iterable[int]
+) -> Iterator[tuple[int, bytes]]:
+    try:
+        view = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        for offset in offsets:
+            handle.seek(offset)
+            line = handle.readline()
+            if line.endswith(b"\n"):
+                yield offset, line[:-1]
+        return
+    with view:
+        for offset in offsets:
+            newline = view.find(b"\n", offset)
+            if newline >= 0:
+                yield offset, view[offset:newline]
+
+
+def parse_ledger_line(
+    offset: int, line: bytes, *, verify: bool = False
+) -> LedgerRecord:
+    """Decode one ledger line found at byte *offset*, optionally re-hashing it."""
+
+    if verify:
+        try:
+            entry, digest = verify_entry_line(line)
+        except (TypeError, ValueError) as exc:
+            msg = f"entry at byte {offset} {exc}"
+            raise ValueError(msg) from exc
+        entry["sha256"] = digest
+    else:
+        entry = cast("dict[str, object]", json.loads(line))
+    return _record_from_entry(offset, entry)
+
+
+class LedgerReader:
+    """Stream ledger entries with bounded memory.
+
+    With ``verify=True`` every line's ``sha256`` is recomputed and a mismatch
+    raises ``ValueError`` naming the byte offset.
+    """
+
+    def __init__(self, path: Path, *, verify: bool = False) -> None:
+        self.path = path
+        self.verify = verify
+
+    def __iter__(self) -> Iterator[LedgerRecord]:
+        return self.iter_records()
+
+    def iter_records(
+        self, start: int = 0, end: int | None = None
+    ) -> Iterator[LedgerRecord]:
+        if not self.path.exists():
+            return
+        for offset, line in iter_ledger_lines(self.path, start, end):
+            yield self._parse(offset, line)
+
+    def iter_records_at(self, offsets: Iterable[int]) -> Iterator[LedgerRecord]:
+        """Yield the records starting at each of *offsets* (e.g. from an index)."""
+
+        if not self.path.exists():
+            return
+        with self.path.open("rb") as handle:
+            for offset, line in _iter_lines_at(handle, offsets):
+                yield self._parse(offset, line)
+
+    def _parse(self, offset: int, line: bytes) -> LedgerRecord:
+        try:
+            return parse_ledger_line(offset, line, verify=self.verify)
+        except (TypeError, ValueError) as exc:
+            msg = f"{self.path}: {exc}"
+            raise ValueError(msg) from exc
+
+    def iter_events(self, types: Iterable[str] | None = None) -> Iterator[LedgerEvent]:
+        """Yield events, optionally only those whose type is in *types*.
+
+        When an ``EventTypeIndex`` sidecar exists the matching lines are read
+        directly by offset instead of parsing the whole ledger.
+        """
+
+        if types is None:
+            for record in self.iter_records():
+                yield record.event
+            return
+        wanted = set(types)
+        from x_make_common_x.ledger_index import (  # noqa: PLC0415 - import cycle
+            EventTypeIndex,
+        )
+
+        if EventTypeIndex.sidecar_path(self.path).exists():
+            index = EventTypeIndex(self.path, persist=False)
+            offsets = index.offsets_for(wanted)
+            for record in self.iter_records_at(offsets):
+                yield record.event
+            return
+        for record in self.iter_records():
+            if record.event.event_type in wanted:
+                yield record.event
+
+
+@dataclass(slots=True)
+class LedgerAudit:
+    """Result of verifying every line of a ledger."""
+
+    entries: int = 0
+    failures: list[tuple[int, str]] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.failures
+
+
+@dataclass(slots=True)
+class _ChunkResult:
+    entries: int = 0
+    failures: list[tuple[int, str]] = field(default_factory=list)
+    first_offset: int | None = None
+    first_prev: str | None = None
+    last_digest: str | None = None
+
+
+def _verify_chunk(path: Path, start: int, end: int, chained: bool) -> _ChunkResult:  # noqa: FBT001 - positional for executor.map
+    result = _ChunkResult()
+    previous: str | None = None
+    for offset, line in iter_ledger_lines(path, start, end):
+        result.entries += 1
+        try:
+            entry, digest = verify_entry_line(line)
+        except (TypeError, ValueError) as exc:
+            result.failures.append((offset, str(exc)))
+            previous = None
+            continue
+        prev_sha256 = entry.get("prev_sha256")
+        if result.first_offset is None:
+            result.first_offset = offset
+            result.first_prev = prev_sha256 if isinstance(prev_sha256, str) else None
+        elif chained and previous is not None and prev_sha256 != previous:
+            result.failures.append((offset, "does not link to the previous entry"))
+        previous = digest
+        result.last_digest = digest
+    return result
+
+
+def _line_boundaries(path: Path, parts: int) -> list[int]:
+    size = path.stat().st_size
+    boundaries = [0]
+    with path.open("rb") as handle:
+        for index in range(1, parts):
+            handle.seek(max(size * index // parts, boundaries[-1]))
+            handle.readline()
+            position = handle.tell()
+            if position >= size:
+                break
+            if position > boundaries[-1]:
+                boundaries.append(position)
+    boundaries.append(size)
+    return boundaries
+
+
+def verify_ledger(
+    path: Path,
+    *,
+    workers: int | None = None,
+    chained: bool = False,
+    chunk_size: int = _PARALLEL_CHUNK_SIZE,
+) -> LedgerAudit:
+    """Recompute every checksum in *path*, fanning large files across processes.
+
+    The file is split at line boundaries into roughly ``chunk_size`` pieces.
+    With ``chained=True`` links are also checked, including across pieces.
+    """
+
+    audit = LedgerAudit()
+    if not path.exists():
+        return audit
+    size = path.stat().st_size
+    worker_count = workers or os.cpu_count() or 1
+    parts = max(1, min(worker_count * 4, -(-size // max(chunk_size, 1))))
+    boundaries = _line_boundaries(path, parts)
+    spans = list(itertools.pairwise(boundaries))
+    if worker_count <= 1 or len(spans) <= 1:
+        results = [_verify_chunk(path, start, end, chained) for start, end in spans]
+    else:
+        with ProcessPoolExecutor(max_workers=worker_count) as pool:
+            results = list(
+                pool.map(
+                    _verify_chunk,
+                    [path] * len(spans),
+                    [start for start, _end in spans],
+                    [end for _start, end in spans],
+                    [chained] * len(spans),
+                )
+            )
+    previous: str | None = GENESIS_DIGEST
+    for result in results:
+        audit.entries += result.entries
+        audit.failures.extend(result.failures)
+        if (
+            chained
+            and result.first_offset is not None
+            and previous is not None
+            and result.first_prev != previous
+        ):
+            audit.failures.append(
+                (result.first_offset, "does not link to the previous entry")
+            )
+        if result.entries:
+            previous = result.last_digest
+    audit.failures.sort()
+    return audit
@@ -0,0 +1,407 @@
+"""Rotating ledger segments with a manifest of per-segment bounds."""
+
+from __future__ import annotations
+
+import contextlib
+import json
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass, field, replace
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Self, cast
+
+from x_make_common_x.ledger import BufferedLedgerWriter, LedgerFlushPolicy
+from x_make_common_x.ledger_compression import (
+    DEFAULT_BLOCK_SIZE,
+    CompressedLedgerReader,
+    compress_ledger,
+    compressed_path,
+)
+from x_make_common_x.ledger_index import EventTypeIndex, SparseLedgerIndex
+from x_make_common_x.ledger_reader import LedgerReader
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from types import TracebackType
+
+    from x_make_common_x.ledger import LedgerEvent, LedgerWriteObserver
+    from x_make_common_x.ledger_compression import LedgerCodec
+    from x_make_common_x.ledger_reader import LedgerRecord
+
+__all__ = [
+    "LedgerManifest",
+    "LedgerRotationPolicy",
+    "LedgerSegment",
+    "SegmentedLedgerReader",
+    "SegmentedLedgerWriter",
+    "compress_sealed_segments",
+]
+
+MANIFEST_FILENAME = "manifest.json"
+_MANIFEST_SCHEMA = "x_make.ledger.manifest/1.0"
+_SEGMENT_TEMPLATE = "segment-{index:06d}.jsonl"
+
+
+def _parse_timestamp(value: str | None) -> datetime | None:
+    if not value:
+        return None
+    with contextlib.suppress(ValueError):
+        return datetime.fromisoformat(value)
+    return None
+
+
+def _within(emitted_at: str, since: datetime | None, until: datetime | None) -> bool:
+    if since is None and until is None:
+        return True
+    emitted = _parse_timestamp(emitted_at)
+    if emitted is None:
+        return True
+    return (since is None or emitted >= since) and (until is None or emitted < until)
+
+
+@dataclass(slots=True, frozen=True)
+class LedgerRotationPolicy:
+    """Seal the current segment at ``max_bytes`` or after ``max_age_seconds``."""
+
+    max_bytes: int | None = 64 << 20
+    max_age_seconds: float | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class LedgerSegment:
+    """Manifest entry describing one segment file."""
+
+    name: str
+    opened_at: str
+    events: int = 0
+    size: int = 0
+    first_emitted_at: str | None = None
+    last_emitted_at: str | None = None
+    last_digest: str | None = None
+    sealed: bool = False
+
+    def overlaps(self, since: datetime | None, until: datetime | None) -> bool:
+        """Return ``False`` only when the segment provably lies outside the range.
+
+        The manifest is saved on flush, rotate and close, so an open segment's
+        ``last_emitted_at`` may be stale; only sealed segments are excluded by
+        their upper bound.
+        """
+
+        first = _parse_timestamp(self.first_emitted_at)
+        last = _parse_timestamp(self.last_emitted_at) if self.sealed else None
+        if since is not None and last is not None and last < since:
+            return False
+        return not (until is not None and first is not None and first >= until)
+
+    def to_json(self) -> dict[str, object]:
+        return {
+            "name": self.name,
+            "opened_at": self.opened_at,
+            "events": self.events,
+            "size": self.size,
+            "first_emitted_at": self.first_emitted_at,
+            "last_emitted_at": self.last_emitted_at,
+            "last_digest": self.last_digest,
+            "sealed": self.sealed,
+        }
+
+    @classmethod
+    def from_json(cls, payload: Mapping[str, object]) -> LedgerSegment:
+        name = payload.get("name")
+        if not isinstance(name, str) or not name:
+            msg = "ledger segment entry missing 'name'"
+            raise ValueError(msg)
+
+        def _text(key: str) -> str | None:
+            value = payload.get(key)
+            return value if isinstance(value, str) else None
+
+        def _count(key: str) -> int:
+            value = payload.get(key)
+            return value if isinstance(value, int) else 0
+
+        return cls(
+            name=name,
+            opened_at=_text("opened_at") or "",
+            events=_count("events"),
+            size=_count("size"),
+            first_emitted_at=_text("first_emitted_at"),
+            last_emitted_at=_text("last_emitted_at"),
+            last_digest=_text("last_digest"),
+            sealed=payload.get("sealed") is True,
+        )
+
+
+@dataclass(slots=True)
+class LedgerManifest:
+    """Ordered list of segments stored as ``manifest.json`` in the ledger dir."""
+
+    directory: Path
+    segments: list[LedgerSegment] = field(default_factory=list)
+
+    @property
+    def path(self) -> Path:
+        return self.directory / MANIFEST_FILENAME
+
+    @classmethod
+    def load(cls, directory: Path) -> LedgerManifest:
+        manifest = cls(directory=directory)
+        if not manifest.path.exists():
+            return manifest
+        payload: object = json.loads(manifest.path.read_text(encoding="utf-8"))
+        if not isinstance(payload, Mapping):
+            msg = "Ledger manifest JSON must be an object"
+            raise TypeError(msg)
+        entries = cast("Mapping[str, object]", payload).get("segments")
+        if isinstance(entries, Sequence) and not isinstance(entries, str):
+            for entry in cast("Sequence[object]", entries):
+                if isinstance(entry, Mapping):
+                    segment_payload = cast("Mapping[str, object]", entry)
+                    manifest.segments.append(LedgerSegment.from_json(segment_payload))
+        return manifest
+
+    def save(self) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "schema_version": _MANIFEST_SCHEMA,
+            "updated_at": datetime.now(UTC).isoformat(),
+            "segments": [segment.to_json() for segment in self.segments],
+        }
+        tmp_path = self.path.with_name(f"{self.path.name}.tmp")
+        tmp_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        tmp_path.replace(self.path)
+
+    def segment_path(self, segment: LedgerSegment) -> Path:
+        return self.directory / segment.name
+
+
+def _segment_reader(
+    path: Path, *, verify: bool
+) -> LedgerReader | CompressedLedgerReader:
+    packed = compressed_path(path)
+    if not path.exists() and packed.exists():
+        return CompressedLedgerReader(packed, verify=verify)
+    return LedgerReader(path, verify=verify)
+
+
+def _scan_segment(path: Path, segment: LedgerSegment) -> LedgerSegment:
+    """Rebuild an open segment's statistics from its file (crash recovery)."""
+
+    events = 0
+    first: str | None = None
+    last: str | None = None
+    digest: str | None = None
+    for record in LedgerReader(path):
+        events += 1
+        first = first or record.event.emitted_at
+        last = record.event.emitted_at
+        digest = record.sha256
+    size = path.stat().st_size if path.exists() else 0
+    return replace(
+        segment,
+        events=events,
+        size=size,
+        first_emitted_at=first,
+        last_emitted_at=last,
+        last_digest=digest,
+    )
+
+
+class SegmentedLedgerWriter:
+    """Buffered ledger writer that rotates into numbered segment files.
+
+    The manifest is rewritten on rotation, ``flush`` and ``close``; an open
+    segment is rescanned on startup so stale statistics self-heal. In chained
+    mode the hash chain continues across segment boundaries.
+    ``observer_factory`` builds per-segment sidecars (e.g. an
+    ``EventTypeIndex``) for each segment file as it is opened.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        *,
+        rotation: LedgerRotationPolicy | None = None,
+        policy: LedgerFlushPolicy | None = None,
+        chained: bool = False,
+        observer_factory: Callable[[Path], Sequence[LedgerWriteObserver]] | None = None,
+    ) -> None:
+        self.directory = directory
+        self.rotation = rotation or LedgerRotationPolicy()
+        self.policy = policy
+        self.chained = chained
+        self.observer_factory = observer_factory
+        self.manifest = LedgerManifest.load(directory)
+        segments = self.manifest.segments
+        if segments and not segments[-1].sealed:
+            current = segments[-1]
+            segments[-1] = _scan_segment(self.manifest.segment_path(current), current)
+            previous = segments[-2].last_digest if len(segments) > 1 else None
+            self._writer = self._open_writer(
+                segments[-1], previous=segments[-1].last_digest or previous
+            )
+        else:
+            self._writer = self._start_segment()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    @property
+    def current_segment(self) -> LedgerSegment:
+        return self.manifest.segments[-1]
+
+    def _open_writer(
+        self, segment: LedgerSegment, *, previous: str | None
+    ) -> BufferedLedgerWriter:
+        path = self.manifest.segment_path(segment)
+        observers = self.observer_factory(path) if self.observer_factory else ()
+        return BufferedLedgerWriter(
+            path,
+            policy=self.policy,
+            chained=self.chained,
+            previous=previous,
+            observers=observers,
+        )
+
+    def _start_segment(self) -> BufferedLedgerWriter:
+        segments = self.manifest.segments
+        previous = segments[-1].last_digest if segments else None
+        segment = LedgerSegment(
+            name=_SEGMENT_TEMPLATE.format(index=len(segments)),
+            opened_at=datetime.now(UTC).isoformat(),
+        )
+        segments.append(segment)
+        writer = self._open_writer(segment, previous=previous)
+        self.manifest.save()
+        return writer
+
+    def _should_rotate(self) -> bool:
+        segment = self.current_segment
+        if segment.events == 0:
+            return False
+        max_bytes = self.rotation.max_bytes
+        if max_bytes is not None and self._writer.size >= max_bytes:
+            return True
+        max_age = self.rotation.max_age_seconds
+        opened_at = _parse_timestamp(segment.opened_at)
+        if max_age is None or opened_at is None:
+            return False
+        return (datetime.now(UTC) - opened_at).total_seconds() >= max_age
+
+    def append(self, event: LedgerEvent) -> str:
+        if self._should_rotate():
+            self.rotate()
+        digest = self._writer.append(event)
+        segment = self.current_segment
+        self.manifest.segments[-1] = replace(
+            segment,
+            events=segment.events + 1,
+            size=self._writer.size,
+            first_emitted_at=segment.first_emitted_at or event.emitted_at,
+            last_emitted_at=event.emitted_at,
+            last_digest=digest,
+        )
+        return digest
+
+    def rotate(self) -> None:
+        """Seal the current segment and start a new one."""
+
+        self._writer.close()
+        self.manifest.segments[-1] = replace(self.current_segment, sealed=True)
+        self._writer = self._start_segment()
+
+    def flush(self) -> None:
+        self._writer.flush()
+        self.manifest.save()
+
+    def close(self) -> None:
+        if self._writer.closed:
+            return
+        self._writer.close()
+        self.manifest.save()
+
+
+class SegmentedLedgerReader:
+    """Read every segment listed in a manifest as one logical stream."""
+
+    def __init__(self, directory: Path, *, verify: bool = False) -> None:
+        self.directory = directory
+        self.verify = verify
+
+    def segments(
+        self, *, since: datetime | None = None, until: datetime | None = None
+    ) -> list[LedgerSegment]:
+        manifest = LedgerManifest.load(self.directory)
+        return [
+            segment for segment in manifest.segments if segment.overlaps(since, until)
+        ]
+
+    def iter_records(
+        self, *, since: datetime | None = None, until: datetime | None = None
+    ) -> Iterator[LedgerRecord]:
+        """Yield records in order, skipping segments outside ``[since, until)``."""
+
+        for segment in self.segments(since=since, until=until):
+            reader = _segment_reader(self.directory / segment.name, verify=self.verify)
+            for record in reader:
+                if _within(record.event.emitted_at, since, until):
+                    yield record
+
+    def iter_events(
+        self,
+        *,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        types: Iterable[str] | None = None,
+    ) -> Iterator[LedgerEvent]:
+        """Yield events in order; ``types`` uses per-segment type indexes."""
+
+        if types is None:
+            for record in self.iter_records(since=since, until=until):
+                yield record.event
+            return
+        wanted = set(types)
+        for segment in self.segments(since=since, until=until):
+            reader = _segment_reader(self.directory / segment.name, verify=self.verify)
+            for event in reader.iter_events(types=wanted):
+                if _within(event.emitted_at, since, until):
+                    yield event
+
+
+def compress_sealed_segments(
+    directory: Path,
+    *,
+    codec: LedgerCodec = "zlib",
+    block_size: int = DEFAULT_BLOCK_SIZE,
+) -> list[str]:
+    """Block-compress every sealed segment that is still stored raw.
+
+    Each segment is written to ``<segment>.blk`` before the raw file is
+    removed, and the manifest is left untouched, so this can run in the
+    background beside a live ``SegmentedLedgerWriter``. An ``EventTypeIndex``
+    sidecar moves to ``<segment>.blk.types`` (its offsets stay valid); the
+    sparse ``.idx`` sidecar is dropped, since the block index replaces it.
+    Returns the names of the segments compressed by this call.
+    """
+
+    compressed: list[str] = []
+    for segment in LedgerManifest.load(directory).segments:
+        path = directory / segment.name
+        if not segment.sealed or not path.exists():
+            continue
+        target = compress_ledger(path, codec=codec, block_size=block_size)
+        types_sidecar = EventTypeIndex.sidecar_path(path)
+        if types_sidecar.exists():
+            types_sidecar.replace(EventTypeIndex.sidecar_path(target))
+        SparseLedgerIndex.sidecar_path(path).unlink(missing_ok=True)
+        path.unlink()
+        compressed.append(segment.name)
+    return compressed
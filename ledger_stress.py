@@ -0,0 +1,113 @@
+"""Multi-process append stress harness for JSONL ledgers."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from x_make_common_x.ledger import append_event
+from x_make_common_x.ledger_reader import LedgerReader, verify_ledger
+
+__all__ = ["LedgerStressResult", "run_append_stress"]
+
+
+@dataclass(slots=True, frozen=True)
+class LedgerStressResult:
+    """Outcome of a concurrent append run."""
+
+    expected: int
+    entries: int
+    failures: tuple[tuple[int, str], ...]
+    missing: int
+
+    @property
+    def ok(self) -> bool:
+        return not self.failures and self.entries == self.expected and not self.missing
+
+    def to_payload(self) -> dict[str, object]:
+        return {
+            "expected": self.expected,
+            "entries": self.entries,
+            "failures": [list(failure) for failure in self.failures],
+            "missing": self.missing,
+            "ok": self.ok,
+        }
+
+
+def _append_worker(path: Path, writer_id: int, events: int, oversize_every: int) -> int:
+    for sequence in range(events):
+        padding = 0
+        if oversize_every and sequence % oversize_every == 0:
+            padding = 16 << 10
+        append_event(
+            path,
+            "stress",
+            {"writer": writer_id, "sequence": sequence, "padding": "x" * padding},
+        )
+    return events
+
+
+def run_append_stress(
+    path: Path,
+    *,
+    writers: int = 8,
+    events_per_writer: int = 500,
+    oversize_every: int = 25,
+) -> LedgerStressResult:
+    """Append from *writers* processes concurrently, then audit every line.
+
+    Every ``oversize_every``-th event carries a payload large enough for the
+    kernel to split the write, so the advisory lock is what keeps lines whole.
+    """
+
+    with ProcessPoolExecutor(max_workers=writers) as pool:
+        futures = [
+            pool.submit(
+                _append_worker, path, writer_id, events_per_writer, oversize_every
+            )
+            for writer_id in range(writers)
+        ]
+        expected = sum(future.result() for future in futures)
+    audit = verify_ledger(path, workers=1)
+    if audit.ok:
+        seen = {
+            (event.payload.get("writer"), event.payload.get("sequence"))
+            for event in LedgerReader(path).iter_events()
+        }
+        missing = expected - len(seen)
+    else:
+        missing = max(expected - audit.entries, 0)
+    return LedgerStressResult(
+        expected=expected,
+        entries=audit.entries,
+        failures=tuple(audit.failures),
+        missing=missing,
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--path", type=Path, default=None)
+    parser.add_argument("--writers", type=int, default=8)
+    parser.add_argument("--events", type=int, default=500)
+    parser.add_argument("--oversize-every", type=int, default=25)
+    args = parser.parse_args(argv)
+    with tempfile.TemporaryDirectory() as scratch:
+        path = args.path or Path(scratch) / "stress.jsonl"
+        result = run_append_stress(
+            path,
+            writers=args.writers,
+            events_per_writer=args.events,
+            oversize_every=args.oversize_every,
+        )
+    sys.stdout.write(json.dumps(result.to_payload(), indent=2) + "\n")
+    return 0 if result.ok else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
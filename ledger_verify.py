@@ -0,0 +1,170 @@
+"""Checksum and hash-chain verification for JSONL ledgers."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, cast
+
+from x_make_common_x.ledger import GENESIS_DIGEST
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+__all__ = [
+    "LedgerCheckpoint",
+    "LedgerVerificationError",
+    "LedgerVerifier",
+    "verify_entry_line",
+]
+
+_READ_CHUNK_SIZE = 1 << 20
+
+
+class LedgerVerificationError(ValueError):
+    """Raised when a ledger entry fails its checksum or chain link."""
+
+    def __init__(self, path: Path, offset: int, reason: str) -> None:
+        super().__init__(f"{path}: entry at byte {offset} {reason}")
+        self.path = path
+        self.offset = offset
+        self.reason = reason
+
+
+def verify_entry_line(line: bytes | str) -> tuple[dict[str, object], str]:
+    """Recompute the digest of one ledger line and return ``(entry, sha256)``.
+
+    Raises ``TypeError`` when the line is not an object and ``ValueError`` when
+    its stored ``sha256`` does not match the canonical serialization of the
+    other fields.
+    """
+
+    payload: object = json.loads(line)
+    if not isinstance(payload, dict):
+        msg = "ledger line is not a JSON object"
+        raise TypeError(msg)
+    entry = cast("dict[str, object]", payload)
+    stored = entry.pop("sha256", None)
+    serialized = json.dumps(entry, sort_keys=True, separators=(",", ":"))
+    digest = hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+    if stored != digest:
+        msg = "checksum mismatch"
+        raise ValueError(msg)
+    return entry, digest
+
+
+@dataclass(slots=True, frozen=True)
+class LedgerCheckpoint:
+    """Byte offset, last digest and entry count of a verified ledger prefix."""
+
+    offset: int = 0
+    digest: str = GENESIS_DIGEST
+    entries: int = 0
+
+    def to_json(self) -> dict[str, object]:
+        return {"offset": self.offset, "digest": self.digest, "entries": self.entries}
+
+    @classmethod
+    def from_json(cls, payload: Mapping[str, object]) -> LedgerCheckpoint:
+        offset = payload.get("offset")
+        digest = payload.get("digest")
+        entries = payload.get("entries")
+        if not isinstance(offset, int) or not isinstance(digest, str):
+            msg = "ledger checkpoint requires integer 'offset' and string 'digest'"
+            raise TypeError(msg)
+        return cls(
+            offset=offset,
+            digest=digest,
+            entries=entries if isinstance(entries, int) else 0,
+        )
+
+
+class LedgerVerifier:
+    """Incrementally verify a chained ledger, persisting a checkpoint.
+
+    Each ``verify`` call resumes at the checkpointed offset, so only entries
+    appended since the previous run are hashed. A trailing line without a
+    newline (an append in progress) is left for the next run.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        checkpoint_path: Path | None = None,
+        chained: bool = True,
+    ) -> None:
+        self.path = path
+        self.checkpoint_path = checkpoint_path or path.with_name(
+            f"{path.name}.verified.json"
+        )
+        self.chained = chained
+
+    def load_checkpoint(self) -> LedgerCheckpoint:
+        if not self.checkpoint_path.exists():
+            return LedgerCheckpoint()
+        payload: object = json.loads(self.checkpoint_path.read_text(encoding="utf-8"))
+        if not isinstance(payload, Mapping):
+            msg = "Ledger checkpoint JSON must be an object"
+            raise TypeError(msg)
+        return LedgerCheckpoint.from_json(cast("Mapping[str, object]", payload))
+
+    def _save_checkpoint(self, checkpoint: LedgerCheckpoint) -> None:
+        tmp_path = self.checkpoint_path.with_name(f"{self.checkpoint_path.name}.tmp")
+        tmp_path.write_text(json.dumps(checkpoint.to_json()), encoding="utf-8")
+        tmp_path.replace(self.checkpoint_path)
+
+    def verify(self, *, full: bool = False) -> LedgerCheckpoint:
+        """Verify entries past the checkpoint (or all with ``full=True``)."""
+
+        checkpoint = LedgerCheckpoint() if full else self.load_checkpoint()
+        checkpoint = self.verify_from(checkpoint)
+        self._save_checkpoint(checkpoint)
+        return checkpoint
+
+    def verify_from(self, checkpoint: LedgerCheckpoint) -> LedgerCheckpoint:
+        """Verify entries after *checkpoint* without touching the stored one."""
+
+        if not self.path.exists():
+            if checkpoint.offset:
+                raise LedgerVerificationError(self.path, 0, "ledger file is missing")
+            return checkpoint
+        size = self.path.stat().st_size
+        if size < checkpoint.offset:
+            raise LedgerVerificationError(
+                self.path, checkpoint.offset, "lies beyond the end (ledger truncated)"
+            )
+        offset = checkpoint.offset
+        previous = checkpoint.digest
+        entries = checkpoint.entries
+        with self.path.open("rb") as handle:
+            if offset:
+                handle.seek(offset - 1)
+                if handle.read(1) != b"\n":
+                    raise LedgerVerificationError(
+                        self.path, offset, "does not start on a line boundary"
+                    )
+            buffer = b""
+            while chunk := handle.read(_READ_CHUNK_SIZE):
+                buffer += chunk
+                *lines, buffer = buffer.split(b"\n")
+                for line in lines:
+                    line_length = len(line) + 1
+                    if line.strip():
+                        previous = self._check_line(line, offset, previous)
+                        entries += 1
+                    offset += line_length
+        return LedgerCheckpoint(offset=offset, digest=previous, entries=entries)
+
+    def _check_line(self, line: bytes, offset: int, previous: str) -> str:
+        try:
+            entry, digest = verify_entry_line(line)
+        except (TypeError, ValueError) as exc:
+            raise LedgerVerificationError(self.path, offset, str(exc)) from exc
+        if self.chained and entry.get("prev_sha256") != previous:
+            raise LedgerVerificationError(
+                self.path, offset, "does not link to the previous entry"
+            )
+        return digest
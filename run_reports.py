@@ -1,23 +1,35 @@
 from __future__ import annotations
 
+import bisect
 import json
+from collections.abc import Mapping
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, cast
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping, MutableMapping
+    from collections.abc import Iterable, MutableMapping, Sequence
 
 __all__ = [
+    "CATALOG_FILENAME",
+    "DEFAULT_CATALOG_FIELDS",
     "REPORTS_DIR_NAME",
     "TIMESTAMP_FILENAME_FORMAT",
+    "RunReportCatalog",
+    "RunReportEntry",
     "ensure_reports_dir",
     "isoformat_timestamp",
+    "latest_run_report",
+    "run_report_catalog",
+    "run_reports_between",
     "write_run_report",
 ]
 
 REPORTS_DIR_NAME = "reports"
 TIMESTAMP_FILENAME_FORMAT = "%Y%m%d_%H%M%S"
+CATALOG_FILENAME = "_catalog.jsonl"
+DEFAULT_CATALOG_FIELDS: tuple[str, ...] = ("status", "summary")
 
 
 def _to_path(base_dir: Path | str | None) -> Path:
@@ -52,6 +64,294 @@ def _ensure_mapping(
     return {str(key): value for key, value in payload.items()}
 
 
+@dataclass(slots=True, frozen=True)
+class RunReportEntry:
+    """Catalog row for one report written by ``write_run_report``.
+
+    ``path`` is relative to the reports directory, so the catalog survives
+    the directory being moved.
+    """
+
+    tool: str
+    generated_at: str
+    path: str
+    size: int
+    summary: Mapping[str, object] = field(default_factory=dict)
+
+    def to_json(self) -> dict[str, object]:
+        return {
+            "tool": self.tool,
+            "generated_at": self.generated_at,
+            "path": self.path,
+            "size": self.size,
+            "summary": dict(self.summary),
+        }
+
+    @classmethod
+    def from_json(cls, payload: Mapping[str, object]) -> RunReportEntry:
+        tool = payload.get("tool")
+        generated_at = payload.get("generated_at")
+        path = payload.get("path")
+        size = payload.get("size")
+        if not (
+            isinstance(tool, str)
+            and isinstance(generated_at, str)
+            and isinstance(path, str)
+            and isinstance(size, int)
+        ):
+            msg = "run report catalog entry requires tool, generated_at, path, size"
+            raise TypeError(msg)
+        summary = payload.get("summary")
+        return cls(
+            tool=tool,
+            generated_at=generated_at,
+            path=path,
+            size=size,
+            summary=(
+                dict(cast("Mapping[str, object]", summary))
+                if isinstance(summary, Mapping)
+                else {}
+            ),
+        )
+
+
+_UNKNOWN_MOMENT = datetime.min.replace(tzinfo=UTC)
+
+
+def _utc_moment(moment: datetime) -> datetime:
+    """Normalise *moment* to UTC; naive values are taken as local time."""
+
+    return moment.astimezone(UTC)
+
+
+def _catalog_key(entry: RunReportEntry) -> datetime:
+    """Sort key for *entry*; unparseable timestamps sort first."""
+
+    try:
+        return _utc_moment(datetime.fromisoformat(entry.generated_at))
+    except ValueError:
+        return _UNKNOWN_MOMENT
+
+
+class RunReportCatalog:
+    """Append-only index of the reports in one reports directory.
+
+    ``write_run_report`` appends one JSON line per report to
+    ``CATALOG_FILENAME``; queries read only that file (and only the bytes
+    appended since the last query), never the directory listing. Entries
+    for the same ``path`` replace earlier ones.
+    """
+
+    def __init__(self, reports_dir: Path) -> None:
+        self.reports_dir = reports_dir
+        self._offset = 0
+        self._inode: int | None = None
+        self._by_path: dict[str, RunReportEntry] = {}
+        self._sorted: list[RunReportEntry] | None = None
+        self._keys: list[datetime] = []
+        self._by_tool: dict[str, list[RunReportEntry]] = {}
+        self._tool_keys: dict[str, list[datetime]] = {}
+
+    def __len__(self) -> int:
+        self.refresh()
+        return len(self._by_path)
+
+    @property
+    def path(self) -> Path:
+        return self.reports_dir / CATALOG_FILENAME
+
+    def record(self, entry: RunReportEntry) -> None:
+        """Append *entry* to the catalog file in a single write."""
+
+        line = json.dumps(entry.to_json(), separators=(",", ":"), default=str)
+        self.reports_dir.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a", encoding="utf-8") as handle:
+            handle.write(line + "\n")
+
+    def refresh(self) -> None:
+        """Load catalog lines appended since the last refresh."""
+
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            if self._by_path:
+                self._reset(None)
+            return
+        if stat.st_ino != self._inode or stat.st_size < self._offset:
+            self._reset(stat.st_ino)
+        if stat.st_size == self._offset:
+            return
+        with self.path.open("rb") as handle:
+            handle.seek(self._offset)
+            chunk = handle.read()
+        end = chunk.rfind(b"\n") + 1
+        for line in chunk[:end].splitlines():
+            if not line.strip():
+                continue
+            payload: object = json.loads(line)
+            if not isinstance(payload, Mapping):
+                msg = f"{self.path}: catalog lines must be JSON objects"
+                raise TypeError(msg)
+            entry = RunReportEntry.from_json(cast("Mapping[str, object]", payload))
+            self._by_path.pop(entry.path, None)
+            self._by_path[entry.path] = entry
+            self._sorted = None
+        self._offset += end
+
+    def _reset(self, inode: int | None) -> None:
+        self._inode = inode
+        self._offset = 0
+        self._by_path.clear()
+        self._sorted = None
+
+    def _ordered(self) -> list[RunReportEntry]:
+        self.refresh()
+        if self._sorted is None:
+            ordered = sorted(self._by_path.values(), key=_catalog_key)
+            by_tool: dict[str, list[RunReportEntry]] = {}
+            for entry in ordered:
+                by_tool.setdefault(entry.tool, []).append(entry)
+            self._sorted = ordered
+            self._keys = [_catalog_key(entry) for entry in ordered]
+            self._by_tool = by_tool
+            self._tool_keys = {
+                tool: [_catalog_key(entry) for entry in entries]
+                for tool, entries in by_tool.items()
+            }
+        return self._sorted
+
+    def entries(self, tool_slug: str | None = None) -> list[RunReportEntry]:
+        """Return catalogued reports oldest first, optionally for one tool."""
+
+        ordered = self._ordered()
+        if tool_slug is None:
+            return list(ordered)
+        return list(self._by_tool.get(tool_slug, ()))
+
+    def tools(self) -> list[str]:
+        self._ordered()
+        return sorted(self._by_tool)
+
+    def latest(self, tool_slug: str) -> RunReportEntry | None:
+        self._ordered()
+        entries = self._by_tool.get(tool_slug)
+        return entries[-1] if entries else None
+
+    def latest_per_tool(self) -> dict[str, RunReportEntry]:
+        self._ordered()
+        return {tool: entries[-1] for tool, entries in sorted(self._by_tool.items())}
+
+    def between(
+        self,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        *,
+        tool_slug: str | None = None,
+    ) -> list[RunReportEntry]:
+        """Return reports generated in ``[start, end)``, oldest first.
+
+        Bounds and stored timestamps are compared in UTC; naive values are
+        taken as local time.
+        """
+
+        ordered = self._ordered()
+        if tool_slug is not None:
+            ordered = self._by_tool.get(tool_slug, [])
+            keys = self._tool_keys.get(tool_slug, [])
+        else:
+            keys = self._keys
+        low = bisect.bisect_left(keys, _utc_moment(start)) if start else 0
+        high = bisect.bisect_left(keys, _utc_moment(end)) if end else None
+        return ordered[low:high]
+
+    def resolve(self, entry: RunReportEntry) -> Path:
+        return self.reports_dir / entry.path
+
+    def rebuild(self, *, fields: Sequence[str] = DEFAULT_CATALOG_FIELDS) -> int:
+        """Re-create the catalog from the report files already on disk.
+
+        This is the one operation that lists the directory; use it once to
+        index reports written before the catalog existed.
+        """
+
+        lines: list[str] = []
+        for report in sorted(self.reports_dir.glob("*.json")):
+            try:
+                data: object = json.loads(report.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                continue
+            if not isinstance(data, Mapping):
+                continue
+            entry = _entry_for(
+                report,
+                cast("Mapping[str, object]", data),
+                reports_dir=self.reports_dir,
+                size=report.stat().st_size,
+                fields=fields,
+            )
+            if entry is not None:
+                lines.append(json.dumps(entry.to_json(), separators=(",", ":")))
+        tmp_path = self.path.with_name(f"{self.path.name}.tmp")
+        tmp_path.write_text("".join(f"{line}\n" for line in lines), encoding="utf-8")
+        tmp_path.replace(self.path)
+        self._reset(None)
+        return len(lines)
+
+
+def _entry_for(
+    report_path: Path,
+    data: Mapping[str, object],
+    *,
+    reports_dir: Path,
+    size: int,
+    fields: Iterable[str],
+) -> RunReportEntry | None:
+    tool = data.get("tool")
+    generated_at = data.get("generated_at")
+    if not isinstance(tool, str) or not isinstance(generated_at, str):
+        return None
+    return RunReportEntry(
+        tool=tool,
+        generated_at=generated_at,
+        path=report_path.relative_to(reports_dir).as_posix(),
+        size=size,
+        summary={key: data[key] for key in fields if key in data},
+    )
+
+
+def run_report_catalog(
+    base_dir: Path | str | None = None,
+    *,
+    reports_name: str = REPORTS_DIR_NAME,
+) -> RunReportCatalog:
+    return RunReportCatalog(_to_path(base_dir) / reports_name)
+
+
+def latest_run_report(
+    tool_slug: str,
+    *,
+    base_dir: Path | str | None = None,
+    reports_name: str = REPORTS_DIR_NAME,
+) -> Path | None:
+    """Return the newest catalogued report for *tool_slug*, if any."""
+
+    catalog = run_report_catalog(base_dir, reports_name=reports_name)
+    entry = catalog.latest(tool_slug)
+    return catalog.resolve(entry) if entry is not None else None
+
+
+def run_reports_between(
+    start: datetime | None = None,
+    end: datetime | None = None,
+    *,
+    tool_slug: str | None = None,
+    base_dir: Path | str | None = None,
+    reports_name: str = REPORTS_DIR_NAME,
+) -> list[RunReportEntry]:
+    catalog = run_report_catalog(base_dir, reports_name=reports_name)
+    return catalog.between(start, end, tool_slug=tool_slug)
+
+
 def write_run_report(  # noqa: PLR0913 - explicit keyword options aid callsites
     tool_slug: str,
     payload: Mapping[str, object] | MutableMapping[str, object],
@@ -60,6 +360,7 @@ def write_run_report(  # noqa: PLR0913 - explicit keyword options aid callsites
     filename: str | None = None,
     timestamp: datetime | None = None,
     reports_name: str = REPORTS_DIR_NAME,
+    catalog_fields: Sequence[str] = DEFAULT_CATALOG_FIELDS,
 ) -> Path:
     moment = timestamp or datetime.now(UTC)
     reports_dir = ensure_reports_dir(base_dir, reports_name=reports_name)
@@ -70,9 +371,22 @@ def write_run_report(  # noqa: PLR0913 - explicit keyword options aid callsites
     data = _ensure_mapping(payload)
     data.setdefault("tool", tool_slug)
     data.setdefault("generated_at", isoformat_timestamp(moment))
+    if not isinstance(data["tool"], str) or not isinstance(data["generated_at"], str):
+        msg = "Run report 'tool' and 'generated_at' must be strings"
+        raise TypeError(msg)
 
     report_path.write_text(
         json.dumps(data, indent=2, sort_keys=False),
         encoding="utf-8",
     )
+    # Derive the row exactly as ``rebuild`` will, so a rebuilt catalog matches.
+    entry = _entry_for(
+        report_path,
+        data,
+        reports_dir=reports_dir,
+        size=report_path.stat().st_size,
+        fields=catalog_fields,
+    )
+    if entry is not None:
+        RunReportCatalog(reports_dir).record(entry)
     return report_path
@@ -0,0 +1,197 @@
+"""SQLite-backed kanban board mirroring the JSON board API."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from collections.abc import Iterable, Mapping
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Self, cast
+
+from x_make_common_x.json_board import BoardState, CardRecord
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+__all__ = ["SqliteBoardState"]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cards (
+    card_id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    status TEXT NOT NULL,
+    description TEXT,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    created_ts REAL NOT NULL,
+    updated_ts REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS cards_status_idx ON cards (status, updated_ts);
+CREATE INDEX IF NOT EXISTS cards_created_idx ON cards (created_ts);
+CREATE INDEX IF NOT EXISTS cards_updated_idx ON cards (updated_ts);
+"""
+_COLUMNS = "card_id, title, status, description, created_at, updated_at"
+_INSERT_COLUMNS = (
+    "cards (card_id, title, status, description, created_at, updated_at, "
+    "created_ts, updated_ts) VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+)
+_INSERT_SQL = f"INSERT INTO {_INSERT_COLUMNS}"
+_UPSERT_SQL = f"INSERT OR REPLACE INTO {_INSERT_COLUMNS}"
+
+_Row = tuple[str, str, str, str | None, str, str]
+
+
+def _row_values(record: CardRecord) -> tuple[object, ...]:
+    return (
+        record.card_id,
+        record.title,
+        record.status,
+        record.description,
+        record.created_at.isoformat(),
+        record.updated_at.isoformat(),
+        record.created_at.timestamp(),
+        record.updated_at.timestamp(),
+    )
+
+
+def _record_from_row(row: _Row) -> CardRecord:
+    card_id, title, status, description, created_at, updated_at = row
+    return CardRecord(
+        card_id=card_id,
+        title=title,
+        status=status,
+        description=description,
+        created_at=datetime.fromisoformat(created_at),
+        updated_at=datetime.fromisoformat(updated_at),
+    )
+
+
+class SqliteBoardState:
+    """Board whose cards live in an indexed SQLite table.
+
+    Mutations touch a single row and commit immediately; listing by status or
+    update window is answered from the table indexes.
+    """
+
+    def __init__(self, path: Path | str) -> None:
+        self.path = Path(path)
+        if str(path) != ":memory:":
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path))
+        self._conn.executescript(_SCHEMA)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __len__(self) -> int:
+        row = self._conn.execute("SELECT COUNT(*) FROM cards").fetchone()
+        return cast("tuple[int]", row)[0]
+
+    def get(self, card_id: str) -> CardRecord | None:
+        row = self._conn.execute(
+            f"SELECT {_COLUMNS} FROM cards WHERE card_id = ?",  # noqa: S608 - constant columns
+            (card_id,),
+        ).fetchone()
+        return None if row is None else _record_from_row(cast("_Row", row))
+
+    def add(self, record: CardRecord) -> None:
+        now = datetime.now(UTC)
+        record.created_at = now
+        record.updated_at = now
+        try:
+            with self._conn:
+                self._conn.execute(_INSERT_SQL, _row_values(record))
+        except sqlite3.IntegrityError as exc:
+            msg = f"card already exists: {record.card_id}"
+            raise ValueError(msg) from exc
+
+    def update(self, record: CardRecord) -> None:
+        key = record.card_id
+        with self._conn:
+            row = self._conn.execute(
+                "SELECT created_at FROM cards WHERE card_id = ?", (key,)
+            ).fetchone()
+            if row is None:
+                msg = f"card not found: {key}"
+                raise ValueError(msg)
+            record.created_at = datetime.fromisoformat(cast("tuple[str]", row)[0])
+            record.updated_at = datetime.now(UTC)
+            self._conn.execute(_UPSERT_SQL, _row_values(record))
+
+    def remove(self, card_id: str) -> CardRecord:
+        with self._conn:
+            record = self.get(card_id)
+            if record is None:
+                msg = f"card not found: {card_id}"
+                raise ValueError(msg)
+            self._conn.execute("DELETE FROM cards WHERE card_id = ?", (card_id,))
+        return record
+
+    def list_cards(
+        self,
+        *,
+        status: str | None = None,
+        updated_after: datetime | None = None,
+        updated_before: datetime | None = None,
+    ) -> list[CardRecord]:
+        """Return cards ordered by ``updated_at``, optionally filtered via indexes."""
+
+        clauses: list[str] = []
+        params: list[object] = []
+        if status is not None:
+            clauses.append("status = ?")
+            params.append(status)
+        if updated_after is not None:
+            clauses.append("updated_ts >= ?")
+            params.append(updated_after.timestamp())
+        if updated_before is not None:
+            clauses.append("updated_ts < ?")
+            params.append(updated_before.timestamp())
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = self._conn.execute(
+            f"SELECT {_COLUMNS} FROM cards{where} ORDER BY updated_ts",  # noqa: S608 - constant clauses
+            params,
+        ).fetchall()
+        return [_record_from_row(cast("_Row", row)) for row in rows]
+
+    def to_json(self) -> list[dict[str, object]]:
+        return [card.to_json() for card in self.list_cards()]
+
+    def to_board_state(self) -> BoardState:
+        return BoardState(cards={card.card_id: card for card in self.list_cards()})
+
+    def import_records(self, records: Iterable[Mapping[str, object]]) -> int:
+        """Insert or replace cards from JSON board records in one transaction."""
+
+        rows = [_row_values(CardRecord.from_json(entry)) for entry in records]
+        with self._conn:
+            self._conn.executemany(_UPSERT_SQL, rows)
+        return len(rows)
+
+    def import_json(self, path: Path | str) -> int:
+        payload_obj: object = json.loads(Path(path).read_text(encoding="utf-8"))
+        if not isinstance(payload_obj, list):
+            msg = "Board JSON must be a list of card objects"
+            raise TypeError(msg)
+        entries = [
+            cast("Mapping[str, object]", entry)
+            for entry in cast("list[object]", payload_obj)
+            if isinstance(entry, Mapping)
+        ]
+        return self.import_records(entries)
+
+    def export_json(self, path: Path | str) -> None:
+        serialized = json.dumps(self.to_json(), indent=2, sort_keys=False)
+        Path(path).write_text(serialized, encoding="utf-8")
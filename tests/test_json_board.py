@@ -2,14 +2,31 @@
 
 from __future__ import annotations
 
-from datetime import UTC, datetime
+import json
+from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING
 
 import pytest
 
-from x_make_common_x.json_board import BoardState, CardRecord, load_board, save_board
+from x_make_common_x.board_query import BoardQueryIndex, board_query_index
+from x_make_common_x.board_search import BoardSearchIndex
+from x_make_common_x.board_sync import (
+    BoardDiff,
+    BoardDiffConflictError,
+    apply_diff,
+    diff_boards,
+)
+from x_make_common_x.json_board import (
+    BoardState,
+    CardRecord,
+    board_from_records,
+    load_board,
+    save_board,
+)
+from x_make_common_x.sqlite_board import SqliteBoardState
 
 if TYPE_CHECKING:  # pragma: no cover - type hints only
+    from collections.abc import Sequence
     from pathlib import Path
 
 
@@ -46,3 +63,242 @@ def test_load_board_rejects_invalid_json(tmp_path: Path) -> None:
     path.write_text("{}", encoding="utf-8")
     with pytest.raises(TypeError, match="must be a list"):
         load_board(path)
+
+
+def test_board_bulk_operations_report_outcomes() -> None:
+    board = BoardState()
+    inserted = board.add_many(
+        CardRecord(card_id=f"bulk-{index}", title=f"Card {index}", status="Backlog")
+        for index in range(3)
+    )
+    assert set(inserted.values()) == {"inserted"}
+    stamps = {card.updated_at for card in board.list_cards()}
+    assert len(stamps) == 1
+
+    with pytest.raises(ValueError, match="already exists"):
+        board.add_many([CardRecord(card_id="bulk-0", title="Dup", status="Backlog")])
+    assert len(board.list_cards()) == len(inserted)
+
+    outcomes = board.upsert_many(
+        [
+            CardRecord(card_id="bulk-0", title="Card 0", status="Backlog"),
+            CardRecord(card_id="bulk-1", title="Card 1", status="Done"),
+            CardRecord(card_id="bulk-9", title="Card 9", status="Backlog"),
+        ]
+    )
+    assert outcomes == {
+        "bulk-0": "unchanged",
+        "bulk-1": "updated",
+        "bulk-9": "inserted",
+    }
+    assert board.cards["bulk-1"].status == "Done"
+
+    removed = board.remove_many(["bulk-0", "missing"])
+    assert removed == {"bulk-0": "removed", "missing": "missing"}
+    assert "bulk-0" not in board.cards
+
+
+def test_board_diff_round_trips_between_states(tmp_path: Path) -> None:
+    local = BoardState()
+    local.add_many(
+        [
+            CardRecord(card_id="sync-1", title="Keep", status="Backlog"),
+            CardRecord(card_id="sync-2", title="Change", status="Backlog"),
+            CardRecord(card_id="sync-3", title="Drop", status="Backlog"),
+        ]
+    )
+    remote = board_from_records(local.to_json())
+    remote.update(CardRecord(card_id="sync-2", title="Change", status="Done"))
+    remote.remove("sync-3")
+    remote.add(CardRecord(card_id="sync-4", title="New", status="Backlog"))
+    save_board(tmp_path / "remote.json", remote)
+
+    diff = diff_boards(local, tmp_path / "remote.json")
+    assert [card.card_id for card in diff.added] == ["sync-4"]
+    assert [card.card_id for card in diff.changed] == ["sync-2"]
+    assert diff.removed == ("sync-3",)
+
+    patch = BoardDiff.from_json(json.loads(json.dumps(diff.to_json())))
+    apply_diff(local, patch)
+    assert local.to_json() == remote.to_json()
+    assert diff_boards(local, remote).is_empty()
+
+
+def test_apply_diff_rejects_diverged_board() -> None:
+    source = BoardState()
+    source.add_many(
+        [
+            CardRecord(card_id="div-1", title="Shared", status="Backlog"),
+            CardRecord(card_id="div-2", title="Edited", status="Backlog"),
+        ]
+    )
+    target = board_from_records(source.to_json())
+    target.update(CardRecord(card_id="div-2", title="Edited", status="Done"))
+    target.remove("div-1")
+    target.add(CardRecord(card_id="div-3", title="Fresh", status="Backlog"))
+    diff = diff_boards(source, target)
+
+    diverged = board_from_records(source.to_json())
+    diverged.remove("div-2")
+    diverged.add(CardRecord(card_id="div-3", title="Elsewhere", status="Review"))
+    before = diverged.to_json()
+    with pytest.raises(BoardDiffConflictError) as caught:
+        apply_diff(diverged, diff)
+    assert caught.value.conflicts == (
+        "added card already exists: div-3",
+        "changed card not found: div-2",
+    )
+    assert diverged.to_json() == before
+
+    patched = apply_diff(board_from_records(source.to_json()), diff)
+    assert patched.to_json() == target.to_json()
+    assert all(patched.cards[key] is not target.cards[key] for key in patched.cards)
+    patched.cards["div-2"].status = "Archived"
+    assert target.cards["div-2"].status == "Done"
+
+
+def test_sqlite_board_mirrors_json_board(tmp_path: Path) -> None:
+    with SqliteBoardState(tmp_path / "board.sqlite3") as board:
+        board.add(CardRecord(card_id="sql-1", title="Index", status="Backlog"))
+        board.add(CardRecord(card_id="sql-2", title="Query", status="Backlog"))
+        with pytest.raises(ValueError, match="already exists"):
+            board.add(CardRecord(card_id="sql-1", title="Dup", status="Backlog"))
+        board.update(CardRecord(card_id="sql-2", title="Query", status="Done"))
+        assert [card.card_id for card in board.list_cards(status="Done")] == ["sql-2"]
+        assert board.remove("sql-1").title == "Index"
+
+        board.export_json(tmp_path / "board.json")
+        assert load_board(tmp_path / "board.json").to_json() == board.to_json()
+
+    with SqliteBoardState(tmp_path / "copy.sqlite3") as copy:
+        assert copy.import_json(tmp_path / "board.json") == 1
+        assert copy.get("sql-2") is not None
+        assert len(copy) == 1
+
+
+def test_board_search_index_follows_mutations() -> None:
+    board = BoardState()
+    board.add(
+        CardRecord(
+            card_id="fts-1",
+            title="Schema validation",
+            status="Backlog",
+            description="Validate ledger payloads",
+        )
+    )
+    index = BoardSearchIndex(board)
+    board.add(
+        CardRecord(
+            card_id="fts-2",
+            title="Ledger rotation",
+            status="Backlog",
+            description="Rotate segments",
+        )
+    )
+
+    hits = index.search("ledger")
+    assert [hit.card_id for hit in hits] == ["fts-2", "fts-1"]
+    assert [hit.card_id for hit in index.search("valid", prefix=True)] == ["fts-1"]
+    assert index.search("ledger cache") == []
+    assert [hit.card_id for hit in index.search("ledger rotat", prefix=True)] == [
+        "fts-2"
+    ]
+
+    board.update(CardRecord(card_id="fts-1", title="Schema cache", status="Done"))
+    assert [hit.card_id for hit in index.search("ledger")] == ["fts-2"]
+    board.remove("fts-2")
+    assert index.search("ledger") == []
+    assert len(index) == 1
+
+
+def test_board_query_pages_with_cursor_and_filters() -> None:
+    base = datetime(2025, 1, 1, tzinfo=UTC)
+    board = BoardState()
+    for index in range(7):
+        stamp = base + timedelta(hours=index)
+        board.restore(
+            CardRecord(
+                card_id=f"q-{index}",
+                title=f"Card {index}",
+                status="Done" if index % 2 else "Backlog",
+                created_at=stamp,
+                updated_at=stamp,
+            )
+        )
+    query_index = board_query_index(board)
+    assert board_query_index(board) is query_index
+
+    first = query_index.query(limit=3)
+    assert [card.card_id for card in first.cards] == ["q-0", "q-1", "q-2"]
+    second = query_index.query(limit=3, cursor=first.next_cursor)
+    assert [card.card_id for card in second.cards] == ["q-3", "q-4", "q-5"]
+    third = query_index.query(limit=3, cursor=second.next_cursor)
+    assert [card.card_id for card in third.cards] == ["q-6"]
+    assert third.next_cursor is None
+
+    done = query_index.query(status="Done", descending=True)
+    assert [card.card_id for card in done.cards] == ["q-5", "q-3", "q-1"]
+    window = query_index.query(
+        since=base + timedelta(hours=2), until=base + timedelta(hours=4)
+    )
+    assert [card.card_id for card in window.cards] == ["q-2", "q-3"]
+    assert [card.card_id for card in query_index.query(text="CARD 6").cards] == ["q-6"]
+
+    board.update(CardRecord(card_id="q-0", title="Card 0", status="Done"))
+    latest = query_index.query(status="Done", descending=True, limit=1)
+    assert [card.card_id for card in latest.cards] == ["q-0"]
+
+
+class _BatchCounter:
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    def card_stored(self, record: CardRecord) -> None:
+        self.calls.append(f"stored:{record.card_id}")
+
+    def card_removed(self, record: CardRecord) -> None:
+        self.calls.append(f"removed:{record.card_id}")
+
+    def cards_stored(self, records: Sequence[CardRecord]) -> None:
+        self.calls.append(f"stored*{len(records)}")
+
+    def cards_removed(self, records: Sequence[CardRecord]) -> None:
+        self.calls.append(f"removed*{len(records)}")
+
+
+def test_board_query_index_tracks_bulk_operations() -> None:
+    board = BoardState()
+    query_index = board_query_index(board)
+    counter = _BatchCounter()
+    board.observers.append(counter)
+    board.add_many(
+        CardRecord(card_id=f"b-{index:02}", title=f"Card {index}", status="Backlog")
+        for index in range(40)
+    )
+    board.upsert_many(
+        [
+            *(
+                CardRecord(
+                    card_id=f"b-{index:02}", title=f"Card {index}", status="Done"
+                )
+                for index in range(0, 40, 2)
+            ),
+            CardRecord(card_id="b-01", title="Card 1", status="Backlog"),
+            CardRecord(card_id="b-99", title="Card 99", status="Review"),
+        ]
+    )
+    board.remove_many(f"b-{index:02}" for index in range(1, 40, 2))
+    assert counter.calls == ["stored*40", "stored*21", "removed*20"]
+
+    fresh = BoardQueryIndex(board_from_records(board.to_json()))
+    for status in (None, "Backlog", "Done", "Review"):
+        for descending in (False, True):
+            expected = fresh.query(status=status, descending=descending, limit=100)
+            actual = query_index.query(status=status, descending=descending, limit=100)
+            assert [card.card_id for card in actual.cards] == [
+                card.card_id for card in expected.cards
+            ]
+    assert query_index.query(status="Backlog").cards == ()
+
+    board.remove_many(list(board.cards))
+    assert query_index.query().cards == ()
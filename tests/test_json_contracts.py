@@ -1,19 +1,43 @@
+# ruff: noqa: S101
+
 from __future__ import annotations
 
+import json
+import os
+import subprocess
+import sys
 import typing
-from typing import TYPE_CHECKING, ParamSpec, TypeVar, cast
+from decimal import Decimal
+from fractions import Fraction
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, ParamSpec, TypeVar, cast
 
 import pytest
-from jsonschema.exceptions import ValidationError
+from jsonschema.exceptions import SchemaError, ValidationError
+from referencing.exceptions import Unresolvable
 
-from x_make_common_x.json_contracts import validate_payload, validate_schema
+from x_make_common_x.contract_check import main as contract_check_main
+from x_make_common_x.json_contracts import (
+    SchemaRegistry,
+    ValidationMemo,
+    ValidatorCache,
+    compile_contract,
+    compile_validator,
+    schema_fingerprint,
+    validate_jsonl,
+    validate_many,
+    validate_payload,
+    validate_schema,
+)
 
 ValidationErrorType: type[Exception] = ValidationError
+SchemaErrorType: type[Exception] = SchemaError
 
 _P = ParamSpec("_P")
 _T = TypeVar("_T")
 if TYPE_CHECKING:
     from collections.abc import Callable
+    from pathlib import Path
 else:
     Callable = typing.Callable
 
@@ -64,3 +88,242 @@ def test_validate_payload_success(sample_schema: dict[str, object]) -> None:
 def test_validate_payload_raises_on_failure(sample_schema: dict[str, object]) -> None:
     with pytest.raises(ValidationErrorType):
         validate_payload({"details": {}}, sample_schema)
+
+
+def test_validator_cache_reuses_compiled_validators(
+    sample_schema: dict[str, object],
+) -> None:
+    reordered = dict(reversed(list(sample_schema.items())))
+    assert schema_fingerprint(reordered) == schema_fingerprint(sample_schema)
+
+    cache = ValidatorCache(maxsize=2)
+    first = cache.get(sample_schema, check_schema=True)
+    assert cache.get(reordered) is first
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    cache.get({"type": "string"})
+    cache.get({"type": "integer"})
+    assert len(cache) == 2  # noqa: PLR2004
+    assert cache.get(sample_schema) is not first
+
+    with pytest.raises(SchemaErrorType):
+        cache.get({"type": 12}, check_schema=True)
+
+    nested: dict[str, Any] = {"properties": {"n": {"type": "integer"}}}
+    isolated = cache.get(nested)
+    nested["properties"]["n"]["type"] = "string"
+    assert next(isolated.iter_errors({"n": 1}), None) is None
+    assert cache.get(nested) is not isolated
+    assert cache.fingerprint(nested) == schema_fingerprint(nested)
+
+
+def test_validate_many_streams_violations(sample_schema: dict[str, object]) -> None:
+    payloads = [
+        {"status": "success"} if index % 7 else {"status": "bogus", "extra": 1}
+        for index in range(50)
+    ]
+    serial = list(validate_many(payloads, sample_schema, chunk_size=8))
+    assert [index for index, _violations in serial] == list(range(0, 50, 7))
+    assert {len(violations) for _index, violations in serial} == {2}
+    assert serial[0][1][0].path in {("status",), ()}
+
+    parallel = list(
+        validate_many(iter(payloads), sample_schema, workers=2, chunk_size=8)
+    )
+    assert parallel == serial
+
+    (first,) = validate_many(payloads[1:], sample_schema, fail_fast=True)
+    assert first[0] == 6  # noqa: PLR2004
+    assert len(first[1]) == 1
+
+
+def test_validate_jsonl_reports_line_numbers_and_cli_exit(
+    sample_schema: dict[str, object],
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    lines = [json.dumps({"status": "success"}).encode("utf-8") + b"\n"] * 5
+    lines[2] = b'{"status": "bogus"}\n'
+    lines[4] = b"{not json\n"
+    results = list(validate_jsonl(lines, sample_schema, chunk_size=2))
+    assert [number for number, _violations in results] == [3, 5]
+    assert results[1][1][0].validator == "json"
+
+    schema_path = tmp_path / "schema.json"
+    schema_path.write_text(json.dumps(sample_schema), encoding="utf-8")
+    data_path = tmp_path / "data.jsonl"
+    data_path.write_bytes(b"".join(lines))
+    assert (
+        contract_check_main([str(schema_path), str(data_path), "--workers", "1"]) == 1
+    )
+    captured = capsys.readouterr()
+    assert captured.out.startswith("line 3: status: ")
+    assert "line 5: <root>: invalid JSON" in captured.out
+    assert "checked 5 lines" in captured.err
+
+    data_path.write_bytes(lines[0] * 3)
+    assert contract_check_main([str(schema_path), str(data_path)]) == 0
+
+    data_path.write_bytes(b"".join(lines) * 200)
+    assert (
+        contract_check_main(
+            [str(schema_path), str(data_path), "--fail-fast", "--workers", "1"]
+        )
+        == 1
+    )
+    assert "checked 3 lines" in capsys.readouterr().err
+
+    schema_path.write_text('{"type": 12}', encoding="utf-8")
+    assert contract_check_main([str(schema_path), str(data_path)]) == 2  # noqa: PLR2004
+    assert "invalid schema" in capsys.readouterr().err
+
+
+def test_importing_package_does_not_import_jsonschema() -> None:
+    probe = (
+        "import sys, x_make_common_x; "
+        "sys.exit(any(name.startswith('jsonschema') for name in sys.modules))"
+    )
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    completed = subprocess.run(  # noqa: S603 - fixed interpreter and argument list
+        [sys.executable, "-c", probe], env=env, check=False
+    )
+    assert completed.returncode == 0
+
+
+def test_compiled_contract_matches_full_validator() -> None:
+    schema: dict[str, object] = {
+        "type": "object",
+        "required": ["stage", "status"],
+        "properties": {
+            "stage": {"type": "string", "minLength": 1, "maxLength": 5},
+            "status": {"enum": ["ok", None, 1, True]},
+            "count": {"type": "integer", "minimum": 0, "exclusiveMaximum": 10},
+            "tags": {"type": "array", "items": {"type": "string"}, "maxItems": 2},
+            "meta": {"additionalProperties": {"type": "boolean"}},
+        },
+        "additionalProperties": False,
+    }
+    contract = compile_contract(schema, check_schema=True)
+    full = compile_validator(schema)
+    assert contract.specialized
+    values: list[object] = ["", "abc", "abcdef", 0, 1, 1.0, 2.5, 10, True, None]
+    values += [["a"], ["a", 1], ["a", "b", "c"], {"x": True}, {"x": 1}]
+    keys = ["stage", "status", "count", "tags", "meta", "other"]
+    for index, value in enumerate(values):
+        for offset in range(len(keys)):
+            payload = {
+                key: values[(index + i) % len(values)]
+                for i, key in enumerate(keys[offset:])
+            }
+            payload[keys[offset - 1]] = value
+            expected = next(full.iter_errors(payload), None) is None
+            assert contract.is_valid(payload) is expected
+
+    with pytest.raises(ValidationErrorType) as compiled_error:
+        contract.validate({"stage": "build", "status": 2})
+    with pytest.raises(ValidationErrorType) as full_error:
+        validate_payload({"stage": "build", "status": 2}, schema)
+    assert str(compiled_error.value) == str(full_error.value)
+
+    fallback = compile_contract({"type": "string", "pattern": "^a"})
+    assert not fallback.specialized
+    assert fallback.source is None
+    assert fallback.is_valid("abc")
+    assert not fallback.is_valid("b")
+
+
+def test_compiled_contract_bounds_follow_full_validator() -> None:
+    schema = json.loads('{"type": "number", "minimum": 5, "maximum": Infinity}')
+    contract = compile_contract(schema)
+    full = compile_validator(schema)
+    assert contract.specialized
+    for value in (4, 5, 1e300, Decimal(1), Decimal(7), Fraction(11, 2), True):
+        expected = next(full.iter_errors(value), None) is None
+        assert contract.is_valid(value) is expected
+
+
+def test_schema_registry_resolves_refs_offline(tmp_path: Path) -> None:
+    stage: dict[str, Any] = {
+        "$id": "https://schemas.x-make.local/stage.json",
+        "type": "object",
+        "properties": {"name": {"type": "string"}},
+        "required": ["name"],
+    }
+    run: dict[str, Any] = {
+        "$id": "https://schemas.x-make.local/run.json",
+        "type": "object",
+        "properties": {"stages": {"type": "array", "items": {"$ref": "stage.json"}}},
+    }
+    broken: dict[str, Any] = {
+        "$id": "https://schemas.x-make.local/broken.json",
+        "$ref": "missing.json",
+    }
+    for name, schema in {"stage": stage, "run": run, "broken": broken}.items():
+        (tmp_path / f"{name}.json").write_text(json.dumps(schema), encoding="utf-8")
+
+    registry = SchemaRegistry.from_directory(tmp_path)
+    for path in tmp_path.iterdir():
+        path.unlink()
+    assert registry.ids == (broken["$id"], run["$id"], stage["$id"])
+
+    validator = registry.validator(run["$id"])
+    assert registry.validator(run["$id"]) is validator
+    registry.validate({"stages": [{"name": "build"}]}, run["$id"])
+    with pytest.raises(ValidationErrorType):
+        registry.validate({"stages": [{"name": 3}]}, run["$id"])
+    with pytest.raises(Unresolvable):
+        registry.validate({}, broken["$id"])
+
+
+def test_validation_memo_reuses_outcomes(sample_schema: dict[str, object]) -> None:
+    now = [0.0]
+    memo = ValidationMemo(maxsize=2, ttl_seconds=10.0, clock=lambda: now[0])
+    valid = {"status": "success", "details": {"a": 1}}
+    invalid = {"status": "unknown"}
+
+    validate_payload(valid, sample_schema, memo=memo)
+    validate_payload(dict(reversed(list(valid.items()))), sample_schema, memo=memo)
+    assert (memo.hits, memo.misses) == (1, 1)
+
+    for _attempt in range(2):
+        with pytest.raises(ValidationErrorType, match="unknown"):
+            memo.validate(invalid, sample_schema)
+    (violation,) = memo.violations(invalid, sample_schema)
+    assert violation.path == ("status",)
+    assert violation.validator == "enum"
+    assert memo.hits == 3  # noqa: PLR2004
+
+    now[0] = 11.0
+    memo.validate(valid, sample_schema)
+    assert memo.misses == 3  # noqa: PLR2004
+    memo.validate({"status": "failure"}, sample_schema)
+    memo.validate({"status": "success"}, sample_schema)
+    assert len(memo) == 2  # noqa: PLR2004
+
+
+def test_validation_memo_raises_fresh_errors(sample_schema: dict[str, object]) -> None:
+    memo = ValidationMemo()
+    fingerprint = schema_fingerprint(sample_schema)
+    raised: list[BaseException] = []
+    for _attempt in range(2):
+        with pytest.raises(ValidationErrorType) as caught:
+            validate_payload(
+                {"status": "unknown"}, sample_schema, memo=memo, fingerprint=fingerprint
+            )
+        raised.append(caught.value)
+    assert raised[0] is not raised[1]
+    assert str(raised[0]) == str(raised[1])
+    assert (memo.hits, memo.misses) == (1, 1)
+
+
+def test_validation_memo_distinguishes_container_types() -> None:
+    memo = ValidationMemo()
+    array_schema: dict[str, object] = {"type": "array"}
+    object_schema: dict[str, object] = {"type": "object"}
+    validate_payload([1, 2], array_schema, memo=memo)
+    with pytest.raises(ValidationErrorType):
+        validate_payload((1, 2), array_schema, memo=memo)
+    validate_payload({"a": 1}, object_schema, memo=memo)
+    with pytest.raises(ValidationErrorType):
+        validate_payload(MappingProxyType({"a": 1}), object_schema, memo=memo)
+    assert memo.violations((1, 2), array_schema)
@@ -0,0 +1,581 @@
+# ruff: noqa: S101
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import json
+import os
+import subprocess
+import sys
+import time
+from datetime import datetime
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
+import pytest
+
+from x_make_common_x.ledger import (
+    GENESIS_DIGEST,
+    BufferedLedgerWriter,
+    LedgerEvent,
+    LedgerFlushPolicy,
+    LedgerWriter,
+    _encode_entry,
+    append_event,
+)
+from x_make_common_x.ledger_async import AsyncLedgerWriter
+from x_make_common_x.ledger_bench import _two_pass_encode, run_encode_benchmark
+from x_make_common_x.ledger_compression import (
+    CompressedLedgerReader,
+    compress_ledger,
+    compressed_path,
+)
+from x_make_common_x.ledger_follow import LedgerCursor, LedgerFollower
+from x_make_common_x.ledger_index import EventTypeIndex, SparseLedgerIndex
+from x_make_common_x.ledger_merkle import (
+    LedgerInclusionProof,
+    LedgerMerkleLog,
+    verify_consistency,
+    verify_inclusion,
+)
+from x_make_common_x.ledger_reader import LedgerReader, verify_ledger
+from x_make_common_x.ledger_segments import (
+    LedgerManifest,
+    LedgerRotationPolicy,
+    SegmentedLedgerReader,
+    SegmentedLedgerWriter,
+    compress_sealed_segments,
+)
+from x_make_common_x.ledger_stress import run_append_stress
+from x_make_common_x.ledger_verify import LedgerVerificationError, LedgerVerifier
+
+if TYPE_CHECKING:  # pragma: no cover - type hints only
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    from x_make_common_x.ledger import LedgerWriteObserver
+    from x_make_common_x.ledger_reader import LedgerRecord
+
+
+def _read_lines(path: Path) -> list[dict[str, object]]:
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_buffered_writer_matches_plain_writer(tmp_path: Path) -> None:
+    event = LedgerEvent("stage", {"id": 1}, emitted_at="2025-01-01T00:00:00+00:00")
+    plain_digest = LedgerWriter(tmp_path / "plain.jsonl").append(event)
+
+    policy = LedgerFlushPolicy(max_events=3, max_delay_ms=None)
+    with BufferedLedgerWriter(tmp_path / "buffered.jsonl", policy=policy) as writer:
+        assert writer.append(event) == plain_digest
+        writer.append(event)
+        assert writer.pending == 2  # noqa: PLR2004
+        assert not (tmp_path / "buffered.jsonl").read_bytes()
+        writer.append(event)
+        assert writer.pending == 0
+        writer.append(event)
+    assert writer.closed
+
+    lines = _read_lines(tmp_path / "buffered.jsonl")
+    assert len(lines) == 4  # noqa: PLR2004
+    assert lines[0] == _read_lines(tmp_path / "plain.jsonl")[0]
+
+
+def test_idle_buffered_writer_flushes_after_max_delay(tmp_path: Path) -> None:
+    path = tmp_path / "idle.jsonl"
+    policy = LedgerFlushPolicy(max_events=100, max_delay_ms=20.0)
+    with BufferedLedgerWriter(path, policy=policy) as writer:
+        writer.append(LedgerEvent("stage", {"id": 1}))
+        deadline = time.monotonic() + 5.0
+        while writer.pending and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert writer.pending == 0
+        assert len(_read_lines(path)) == 1
+        writer.append(LedgerEvent("stage", {"id": 2}))
+    assert len(_read_lines(path)) == 2  # noqa: PLR2004
+
+
+def test_single_pass_encoding_keeps_digests_and_is_canonical() -> None:
+    events = [
+        LedgerEvent("stage", {"b": [1, 2.5, None], "a": "caf\u00e9 \u2713"}, "t0"),
+        LedgerEvent("stage", MappingProxyType({"nested": {"z": 1, "y": True}}), "t1"),
+    ]
+    for previous in (None, GENESIS_DIGEST):
+        for event in events:
+            line, digest = _encode_entry(event, previous)
+            legacy_line, legacy_digest = _two_pass_encode(event, previous)
+            assert digest == legacy_digest
+            assert json.loads(line) == json.loads(legacy_line)
+            canonical = json.dumps(
+                json.loads(line), sort_keys=True, separators=(",", ":")
+            )
+            assert line == canonical.encode("utf-8") + b"\n"
+    (result,) = run_encode_benchmark(events=20, payload_sizes=(128,))
+    assert result.digests_match
+
+
+def test_chained_ledger_verifies_incrementally(tmp_path: Path) -> None:
+    path = tmp_path / "chained.jsonl"
+    writer = LedgerWriter(path, chained=True)
+    first = writer.append(LedgerEvent("stage", {"step": 1}))
+    writer.append(LedgerEvent("stage", {"step": 2}))
+    assert _read_lines(path)[0]["prev_sha256"] == GENESIS_DIGEST
+    assert _read_lines(path)[1]["prev_sha256"] == first
+
+    verifier = LedgerVerifier(path)
+    checkpoint = verifier.verify()
+    assert checkpoint.entries == 2  # noqa: PLR2004
+    assert checkpoint.offset == path.stat().st_size
+
+    with BufferedLedgerWriter(path, chained=True) as resumed:
+        last = resumed.append(LedgerEvent("stage", {"step": 3}))
+    assert verifier.verify().digest == last
+
+    lines = path.read_text(encoding="utf-8").splitlines(keepends=True)
+    path.write_text(lines[0] + lines[2], encoding="utf-8")
+    with pytest.raises(LedgerVerificationError, match="previous entry"):
+        verifier.verify(full=True)
+
+
+def test_reader_streams_and_parallel_audit_finds_tampering(tmp_path: Path) -> None:
+    path = tmp_path / "audit.jsonl"
+    with BufferedLedgerWriter(path, chained=True) as writer:
+        for index in range(40):
+            writer.append(LedgerEvent("tick", {"index": index}))
+    with path.open("a", encoding="utf-8") as handle:
+        handle.write('{"partial": ')
+
+    records = list(LedgerReader(path, verify=True))
+    assert [record.event.payload["index"] for record in records] == list(range(40))
+    assert records[1].prev_sha256 == records[0].sha256
+
+    clean = verify_ledger(path, workers=2, chained=True, chunk_size=512)
+    assert clean.ok
+    assert clean.entries == 40  # noqa: PLR2004
+
+    lines = path.read_text(encoding="utf-8").splitlines(keepends=True)
+    tampered = lines[25].replace('"index":25', '"index":99')
+    path.write_text("".join([*lines[:10], *lines[11:25], tampered]), encoding="utf-8")
+    audit = verify_ledger(path, workers=2, chained=True, chunk_size=512)
+    reasons = [reason for _offset, reason in audit.failures]
+    assert reasons == ["does not link to the previous entry", "checksum mismatch"]
+
+
+def _stamped(index: int) -> LedgerEvent:
+    return LedgerEvent("tick", {"index": index}, f"2025-01-01T00:{index:02d}:00+00:00")
+
+
+def test_segmented_writer_rotates_and_reader_skips_segments(tmp_path: Path) -> None:
+    rotation = LedgerRotationPolicy(max_bytes=400)
+    with SegmentedLedgerWriter(tmp_path, rotation=rotation, chained=True) as writer:
+        for index in range(6):
+            writer.append(_stamped(index))
+    with SegmentedLedgerWriter(tmp_path, rotation=rotation, chained=True) as writer:
+        for index in range(6, 12):
+            writer.append(_stamped(index))
+
+    manifest = LedgerManifest.load(tmp_path)
+    assert len(manifest.segments) > 2  # noqa: PLR2004
+    assert sum(segment.events for segment in manifest.segments) == 12  # noqa: PLR2004
+    assert all(segment.sealed for segment in manifest.segments[:-1])
+
+    reader = SegmentedLedgerReader(tmp_path, verify=True)
+    records = list(reader.iter_records())
+    assert [record.event.payload["index"] for record in records] == list(range(12))
+    for previous, record in itertools.pairwise(records):
+        assert record.prev_sha256 == previous.sha256
+
+    since = datetime.fromisoformat("2025-01-01T00:09:00+00:00")
+    window = [event.payload["index"] for event in reader.iter_events(since=since)]
+    assert window == [9, 10, 11]
+    assert len(reader.segments(since=since)) < len(manifest.segments)
+
+
+def test_segmented_reader_keeps_open_segment_for_since_queries(
+    tmp_path: Path,
+) -> None:
+    policy = LedgerFlushPolicy(max_events=1, max_delay_ms=None)
+    since = datetime.fromisoformat("2025-01-01T00:10:00+00:00")
+    with SegmentedLedgerWriter(tmp_path, policy=policy) as writer:
+        writer.append(_stamped(0))
+        writer.flush()
+        writer.append(_stamped(30))
+        reader = SegmentedLedgerReader(tmp_path)
+        window = [event.payload["index"] for event in reader.iter_events(since=since)]
+        assert window == [30]
+
+
+def test_sparse_index_seeks_and_stays_consistent(tmp_path: Path) -> None:
+    path = tmp_path / "indexed.jsonl"
+    index = SparseLedgerIndex(path, interval=4)
+    policy = LedgerFlushPolicy(max_events=5, max_delay_ms=None)
+    with BufferedLedgerWriter(path, policy=policy, observers=[index]) as writer:
+        for minute in range(10):
+            writer.append(_stamped(minute))
+    assert [point.sequence for point in index.points] == [0, 4, 8]
+
+    LedgerWriter(path).append(_stamped(10))
+    reopened = SparseLedgerIndex(path, interval=4)
+    assert reopened.entries == 11  # noqa: PLR2004
+    assert [point.sequence for point in reopened.points] == [0, 4, 8]
+
+    by_sequence = [r.event.payload["index"] for r in reopened.iter_from_sequence(6)]
+    assert by_sequence == [6, 7, 8, 9, 10]
+    moment = datetime.fromisoformat("2025-01-01T00:09:00+00:00")
+    by_time = [r.event.payload["index"] for r in reopened.iter_from_time(moment)]
+    assert by_time == [9, 10]
+
+    (tmp_path / "indexed.jsonl.idx").write_text("garbage\n", encoding="utf-8")
+    rebuilt = SparseLedgerIndex(path, interval=4)
+    assert rebuilt.points == reopened.points
+
+
+def test_event_type_index_serves_selective_reads(tmp_path: Path) -> None:
+    kinds = ("start", "tick", "tick", "stop")
+
+    def _type_index(path: Path) -> list[EventTypeIndex]:
+        return [EventTypeIndex(path)]
+
+    rotation = LedgerRotationPolicy(max_bytes=600)
+    with SegmentedLedgerWriter(
+        tmp_path, rotation=rotation, observer_factory=_type_index
+    ) as writer:
+        for index in range(12):
+            writer.append(LedgerEvent(kinds[index % 4], {"index": index}))
+
+    manifest = LedgerManifest.load(tmp_path)
+    first_segment = tmp_path / manifest.segments[0].name
+    assert EventTypeIndex.sidecar_path(first_segment).exists()
+    type_index = EventTypeIndex(first_segment)
+    assert type_index.event_types == ("start", "stop", "tick")
+
+    reader = SegmentedLedgerReader(tmp_path)
+    selected = [e.payload["index"] for e in reader.iter_events(types=["start", "stop"])]
+    assert selected == [0, 3, 4, 7, 8, 11]
+
+    plain = tmp_path / "plain.jsonl"
+    LedgerWriter(plain).append(LedgerEvent("stop", {"index": 0}))
+    assert [e.event_type for e in LedgerReader(plain).iter_events(types=["stop"])] == [
+        "stop"
+    ]
+
+
+def test_event_type_index_ignores_overlapping_batches(tmp_path: Path) -> None:
+    path = tmp_path / "typed.jsonl"
+    writer = LedgerWriter(path)
+    writer.append(LedgerEvent("stop", {"index": 0}))
+    long_lived = EventTypeIndex(path)
+    writer.append(LedgerEvent("stop", {"index": 1}))
+
+    sidecar = EventTypeIndex.sidecar_path(path)
+    before = sidecar.read_bytes()
+    assert len(list(LedgerReader(path).iter_events(types=["stop"]))) == 2  # noqa: PLR2004
+    assert sidecar.read_bytes() == before
+
+    long_lived.refresh()
+    EventTypeIndex(path).refresh()
+    sidecar.write_bytes(sidecar.read_bytes() * 2)
+    assert EventTypeIndex(path).count("stop") == 2  # noqa: PLR2004
+    assert len(list(LedgerReader(path).iter_events(types=["stop"]))) == 2  # noqa: PLR2004
+
+
+def test_single_event_appends_keep_type_sidecar_current(tmp_path: Path) -> None:
+    path = tmp_path / "typed.jsonl"
+    append_event(path, "start", {"index": 0})
+    EventTypeIndex(path)
+    sidecar = EventTypeIndex.sidecar_path(path)
+    for index in range(1, 4):
+        append_event(path, "stop" if index % 2 else "start", {"index": index})
+    LedgerWriter(path, chained=True).append(LedgerEvent("stop", {"index": 4}))
+
+    # Trust the sidecar without reading the ledger: it must already be current.
+    size = path.stat().st_size
+    trusted = EventTypeIndex(path, persist=False, ledger_size=size)
+    assert trusted.end_offset == size
+    assert trusted.count("start") == 2  # noqa: PLR2004
+    assert trusted.count("stop") == 3  # noqa: PLR2004
+    before = sidecar.read_bytes()
+    assert EventTypeIndex(path).count("stop") == 3  # noqa: PLR2004
+    assert sidecar.read_bytes() == before
+
+    # A sidecar ahead of the ledger is left for the next open to rebuild.
+    sidecar.write_text('{"end":999999,"offsets":{}}\n', encoding="utf-8")
+    append_event(path, "start", {"index": 5})
+    assert EventTypeIndex(path).count("start") == 3  # noqa: PLR2004
+
+
+def test_concurrent_appends_never_interleave(tmp_path: Path) -> None:
+    result = run_append_stress(
+        tmp_path / "stress.jsonl", writers=4, events_per_writer=40, oversize_every=8
+    )
+    assert result.ok, result.to_payload()
+    assert result.entries == 160  # noqa: PLR2004
+
+
+def test_chained_writers_share_one_chain(tmp_path: Path) -> None:
+    path = tmp_path / "shared.jsonl"
+    first = LedgerWriter(path, chained=True)
+    second = LedgerWriter(path, chained=True)
+    first.append(LedgerEvent("a", {}))
+    second.append(LedgerEvent("b", {}))
+    first.append(LedgerEvent("c", {}))
+    assert verify_ledger(path, chained=True).ok
+
+
+def test_follower_resumes_from_cursor_and_crosses_segments(tmp_path: Path) -> None:
+    path = tmp_path / "live.jsonl"
+    writer = LedgerWriter(path)
+    for index in range(3):
+        writer.append(_stamped(index))
+    with LedgerFollower(path, poll_interval=0.01) as follower:
+        seen = [record.event.payload["index"] for record in follower.poll()]
+        assert seen == [0, 1, 2]
+        with path.open("a", encoding="utf-8") as handle:
+            handle.write('{"partial": ')
+        assert follower.poll() == []
+        follower.cursor.save(tmp_path / "cursor.json")
+
+    cursor = LedgerCursor.load(tmp_path / "cursor.json")
+    assert cursor.offset == len(path.read_bytes()) - len('{"partial": ')
+
+    directory = tmp_path / "segments"
+    rotation = LedgerRotationPolicy(max_bytes=300)
+    with SegmentedLedgerWriter(directory, rotation=rotation) as segmented:
+        segmented.append(_stamped(0))
+        segmented.flush()
+        follower = LedgerFollower(directory, poll_interval=0.01)
+        first = next(follower.follow(idle_timeout=1.0))
+        assert first.event.payload["index"] == 0
+        resume = follower.cursor
+        for index in range(1, 8):
+            segmented.append(_stamped(index))
+    assert len(LedgerManifest.load(directory).segments) > 1
+    with LedgerFollower(directory, cursor=resume, poll_interval=0.01) as follower:
+        events = list(follower.follow_events(idle_timeout=0.05))
+    assert [event.payload["index"] for event in events] == list(range(1, 8))
+
+
+@pytest.mark.parametrize("codec", ["zlib", "lzma"])
+def test_compressed_ledger_seeks_without_full_decompression(
+    tmp_path: Path, codec: str
+) -> None:
+    path = tmp_path / "ledger.jsonl"
+    writer = LedgerWriter(path, chained=True)
+    for index in range(40):
+        writer.append(_stamped(index))
+    packed = compress_ledger(path, codec=codec, block_size=512)  # type: ignore[arg-type]
+    assert packed == compressed_path(path)
+    assert packed.stat().st_size < path.stat().st_size
+
+    original = list(LedgerReader(path))
+    reader = CompressedLedgerReader(packed, verify=True)
+    assert len(reader.blocks) > 1
+    assert list(reader) == original
+    middle = original[25].offset
+    assert list(reader.iter_records(middle)) == original[25:]
+    assert [record.offset for record in reader.iter_from_sequence(33)] == [
+        record.offset for record in original[33:]
+    ]
+    picks = [original[3].offset, original[30].offset]
+    assert list(reader.iter_records_at(picks)) == [original[3], original[30]]
+
+
+def test_sealed_segments_compress_in_place(tmp_path: Path) -> None:
+    rotation = LedgerRotationPolicy(max_bytes=400)
+    with SegmentedLedgerWriter(tmp_path, rotation=rotation, chained=True) as writer:
+        for index in range(12):
+            writer.append(_stamped(index))
+        compressed = compress_sealed_segments(tmp_path)
+        writer.append(_stamped(12))
+
+    manifest = LedgerManifest.load(tmp_path)
+    assert compressed == [segment.name for segment in manifest.segments[:-2]]
+    assert not (tmp_path / compressed[0]).exists()
+    records = list(SegmentedLedgerReader(tmp_path, verify=True).iter_records())
+    assert [record.event.payload["index"] for record in records] == list(range(13))
+    with LedgerFollower(tmp_path, poll_interval=0.01) as follower:
+        assert len(follower.poll()) == 13  # noqa: PLR2004
+
+
+def test_compressed_segments_keep_type_index(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    kinds = ("start", "tick", "stop")
+
+    def _sidecars(path: Path) -> list[LedgerWriteObserver]:
+        return [EventTypeIndex(path), SparseLedgerIndex(path, interval=2)]
+
+    rotation = LedgerRotationPolicy(max_bytes=600)
+    with SegmentedLedgerWriter(
+        tmp_path, rotation=rotation, observer_factory=_sidecars
+    ) as writer:
+        for index in range(12):
+            writer.append(LedgerEvent(kinds[index % 3], {"index": index}))
+        compressed = compress_sealed_segments(tmp_path)
+    assert compressed
+
+    first = tmp_path / compressed[0]
+    assert not SparseLedgerIndex.sidecar_path(first).exists()
+    assert not EventTypeIndex.sidecar_path(first).exists()
+    assert EventTypeIndex.sidecar_path(compressed_path(first)).exists()
+
+    def _no_scan(*_args: object, **_kwargs: object) -> Iterator[LedgerRecord]:
+        msg = "typed read scanned the compressed segment"
+        raise AssertionError(msg)
+
+    with monkeypatch.context() as patched:
+        patched.setattr(CompressedLedgerReader, "iter_records", _no_scan)
+        reader = CompressedLedgerReader(compressed_path(first))
+        stops = [e.payload["index"] for e in reader.iter_events(types=["stop"])]
+    assert stops
+    assert stops == [2, 5, 8, 11][: len(stops)]
+    selected = SegmentedLedgerReader(tmp_path).iter_events(types=["stop"])
+    assert [e.payload["index"] for e in selected] == [2, 5, 8, 11]
+
+
+def test_merkle_log_proves_inclusion_and_consistency(tmp_path: Path) -> None:
+    path = tmp_path / "ledger.jsonl"
+    merkle = LedgerMerkleLog(path, interval=8)
+    with BufferedLedgerWriter(path, observers=[merkle]) as writer:
+        digests = [writer.append(_stamped(index)) for index in range(21)]
+    assert [checkpoint.size for checkpoint in merkle.checkpoints] == [8, 16]
+    head = merkle.checkpoint()
+
+    reopened = LedgerMerkleLog(path, interval=8)
+    assert reopened.size == len(digests)
+    assert reopened.root() == head.root
+    assert reopened.checkpoints[-1] == head
+
+    for index in (0, 7, 13, 20):
+        proof = reopened.inclusion_proof(index)
+        assert proof.leaf == digests[index]
+        assert len(proof.path) <= 5  # noqa: PLR2004
+        restored = LedgerInclusionProof.from_json(
+            json.loads(json.dumps(proof.to_json()))
+        )
+        assert verify_inclusion(restored, head.root)
+    forged = LedgerInclusionProof(3, 21, digests[4], reopened.inclusion_proof(3).path)
+    assert not verify_inclusion(forged, head.root)
+
+    old = reopened.checkpoints[0]
+    consistency = reopened.consistency_proof(old.size)
+    assert verify_consistency(consistency, old.root, head.root)
+    assert not verify_consistency(consistency, reopened.root(9), head.root)
+
+
+def test_merkle_log_reopens_from_persisted_nodes(tmp_path: Path) -> None:
+    path = tmp_path / "ledger.jsonl"
+    merkle = LedgerMerkleLog(path, interval=8)
+    with BufferedLedgerWriter(path, observers=[merkle]) as writer:
+        for index in range(13):
+            writer.append(_stamped(index))
+    head = merkle.checkpoint()
+    nodes = merkle.nodes_path.read_bytes()
+    # 13 leaves complete 13 - popcount(13) interior nodes of 32 bytes each.
+    assert len(nodes) == (13 - 3) * 32
+
+    # Reopening reads the right edge from .nodes rather than re-hashing leaves.
+    merkle.nodes_path.write_bytes(nodes[:-32] + bytes(32))
+    assert LedgerMerkleLog(path, interval=8).root() != head.root
+    merkle.nodes_path.unlink()
+    restored = LedgerMerkleLog(path, interval=8)
+    assert restored.root() == head.root
+    assert merkle.nodes_path.read_bytes() == nodes
+
+    with BufferedLedgerWriter(path) as writer:
+        for index in range(13, 21):
+            writer.append(_stamped(index))
+    caught_up = LedgerMerkleLog(path, interval=8)
+    assert caught_up.size == 21  # noqa: PLR2004
+    assert caught_up.root(13) == head.root
+    merkle.rebuild()
+    assert caught_up.root() == merkle.root()
+    assert verify_consistency(
+        caught_up.consistency_proof(13), head.root, caught_up.root()
+    )
+
+
+class _FlushCounter:
+    def __init__(self) -> None:
+        self.entries = 0
+        self.flushes = 0
+
+    def entry_appended(self, offset: int, line: bytes, event: LedgerEvent) -> None:
+        del offset, line, event
+        self.entries += 1
+
+    def flushed(self) -> None:
+        self.flushes += 1
+
+
+def test_importing_package_defers_async_writer() -> None:
+    probe = (
+        "import sys, x_make_common_x; "
+        "assert 'x_make_common_x.ledger_async' not in sys.modules; "
+        "assert 'asyncio' not in sys.modules; "
+        "assert x_make_common_x.AsyncLedgerWriter.__name__ == 'AsyncLedgerWriter'"
+    )
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    completed = subprocess.run(  # noqa: S603 - fixed interpreter and argument list
+        [sys.executable, "-c", probe], env=env, check=False
+    )
+    assert completed.returncode == 0
+
+
+def test_async_writer_batches_concurrent_appends(tmp_path: Path) -> None:
+    path = tmp_path / "async.jsonl"
+    counter = _FlushCounter()
+    policy = LedgerFlushPolicy(max_events=32)
+
+    async def produce() -> list[str]:
+        async with AsyncLedgerWriter(
+            path, policy=policy, chained=True, max_queue=8, observers=[counter]
+        ) as writer:
+            return await asyncio.gather(
+                *(writer.append(_stamped(index % 60)) for index in range(200))
+            )
+
+    digests = asyncio.run(produce())
+    assert len(set(digests)) == 200  # noqa: PLR2004
+    assert [record.sha256 for record in LedgerReader(path)] == digests
+    assert verify_ledger(path, workers=1, chained=True).ok
+    assert counter.entries == 200  # noqa: PLR2004
+    assert counter.flushes < 200  # noqa: PLR2004
+
+
+def test_async_writer_starts_once_for_concurrent_first_appends(
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / "async-start.jsonl"
+
+    async def produce() -> tuple[list[str], asyncio.Task[None] | None]:
+        writer = AsyncLedgerWriter(path, chained=True)
+        digests = await asyncio.gather(*(writer.append(_stamped(i)) for i in range(5)))
+        worker = writer._worker  # noqa: SLF001 - asserting a single worker task
+        await writer.close()
+        return digests, worker
+
+    digests, worker = asyncio.run(produce())
+    assert worker is not None
+    assert worker.done()
+    assert [record.sha256 for record in LedgerReader(path)] == digests
+    assert verify_ledger(path, workers=1, chained=True).ok
+
+
+def test_async_writer_rejects_only_the_unencodable_event(tmp_path: Path) -> None:
+    path = tmp_path / "async-bad.jsonl"
+
+    async def produce() -> tuple[str | BaseException, ...]:
+        async with AsyncLedgerWriter(path, chained=True) as writer:
+            return await asyncio.gather(
+                writer.append(_stamped(0)),
+                writer.append(LedgerEvent("tick", {"bad": object()})),
+                writer.append(_stamped(2)),
+                return_exceptions=True,
+            )
+
+    first, bad, last = asyncio.run(produce())
+    assert isinstance(bad, TypeError)
+    assert [record.sha256 for record in LedgerReader(path)] == [first, last]
+    assert verify_ledger(path, workers=1, chained=True).ok
@@ -0,0 +1,126 @@
+# ruff: noqa: S101
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta, timezone
+from typing import TYPE_CHECKING
+
+import pytest
+
+from x_make_common_x.run_reports import (
+    CATALOG_FILENAME,
+    RunReportCatalog,
+    latest_run_report,
+    run_report_catalog,
+    run_reports_between,
+    write_run_report,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_catalog_tracks_writes_without_listing(tmp_path: Path) -> None:
+    base = datetime(2025, 1, 1, tzinfo=UTC)
+    for index in range(6):
+        tool = "alpha" if index % 2 else "beta"
+        write_run_report(
+            tool,
+            {"status": "ok" if index != 4 else "failed", "details": [index]},  # noqa: PLR2004
+            base_dir=tmp_path,
+            timestamp=base + timedelta(hours=index),
+        )
+
+    catalog = run_report_catalog(tmp_path)
+    assert len(catalog) == 6  # noqa: PLR2004
+    latest = catalog.latest_per_tool()
+    assert sorted(latest) == ["alpha", "beta"]
+    assert latest["beta"].summary == {"status": "failed"}
+    assert latest["beta"].path == "beta_run_20250101_040000.json"
+    assert latest["beta"].size == catalog.resolve(latest["beta"]).stat().st_size
+    assert latest_run_report("alpha", base_dir=tmp_path) == (
+        tmp_path / "reports" / "alpha_run_20250101_050000.json"
+    )
+    assert latest_run_report("gamma", base_dir=tmp_path) is None
+
+    window = run_reports_between(
+        base + timedelta(hours=1), base + timedelta(hours=4), base_dir=tmp_path
+    )
+    assert [entry.generated_at[11:13] for entry in window] == ["01", "02", "03"]
+    alpha = catalog.between(base + timedelta(hours=2), tool_slug="alpha")
+    assert [entry.generated_at[11:13] for entry in alpha] == ["03", "05"]
+
+    # Reports the catalog did not see are invisible until an explicit rebuild.
+    stray = tmp_path / "reports" / "gamma_run_20250102_000000.json"
+    stray.write_text('{"tool": "gamma", "generated_at": "2025-01-02T00:00:00Z"}')
+    assert catalog.latest("gamma") is None
+    assert catalog.rebuild() == 7  # noqa: PLR2004
+    assert catalog.latest("gamma") is not None
+
+    # Appends from another writer are picked up incrementally.
+    write_run_report("gamma", {}, base_dir=tmp_path, timestamp=base + timedelta(days=2))
+    assert catalog.latest_per_tool()["gamma"].generated_at == "2025-01-03T00:00:00Z"
+    assert (tmp_path / "reports" / CATALOG_FILENAME).exists()
+    assert len(RunReportCatalog(tmp_path / "reports")) == 8  # noqa: PLR2004
+
+
+def test_catalog_orders_by_utc_instant_and_indexes_payload_time(
+    tmp_path: Path,
+) -> None:
+    plus_two = timezone(timedelta(hours=2))
+    # 10:00+02:00 is 08:00Z, earlier than 09:00Z despite sorting later as text.
+    write_run_report(
+        "alpha",
+        {},
+        base_dir=tmp_path,
+        timestamp=datetime(2025, 1, 1, 10, tzinfo=plus_two),
+    )
+    write_run_report(
+        "alpha", {}, base_dir=tmp_path, timestamp=datetime(2025, 1, 1, 9, tzinfo=UTC)
+    )
+    write_run_report(
+        "beta",
+        {"generated_at": "2025-01-01T12:00:00Z"},
+        base_dir=tmp_path,
+        timestamp=datetime(2025, 1, 1, 1, tzinfo=UTC),
+    )
+
+    catalog = run_report_catalog(tmp_path)
+    latest = catalog.latest_per_tool()
+    assert latest["alpha"].generated_at == "2025-01-01T09:00:00Z"
+    assert latest["beta"].generated_at == "2025-01-01T12:00:00Z"
+    window = catalog.between(
+        datetime(2025, 1, 1, 8, 30, tzinfo=UTC),
+        datetime(2025, 1, 1, 13, tzinfo=plus_two),
+    )
+    assert [entry.generated_at for entry in window] == ["2025-01-01T09:00:00Z"]
+
+
+def test_rebuilt_catalog_matches_written_catalog(tmp_path: Path) -> None:
+    base = datetime(2025, 1, 1, tzinfo=UTC)
+    write_run_report("alpha", {"status": "ok"}, base_dir=tmp_path, timestamp=base)
+    # The payload's own tool field is what rebuild reads back from disk.
+    write_run_report(
+        "alpha",
+        {"tool": "alpha-nightly", "status": "failed"},
+        base_dir=tmp_path,
+        timestamp=base + timedelta(hours=1),
+    )
+    write_run_report(
+        "beta",
+        {"generated_at": "2025-01-01T12:00:00+02:00"},
+        base_dir=tmp_path,
+        timestamp=base + timedelta(hours=2),
+    )
+
+    written = run_report_catalog(tmp_path)
+    before = [entry.to_json() for entry in written.entries()]
+    assert written.tools() == ["alpha", "alpha-nightly", "beta"]
+    assert written.rebuild() == len(before)
+    assert [entry.to_json() for entry in written.entries()] == before
+    reloaded = RunReportCatalog(tmp_path / "reports")
+    assert [entry.to_json() for entry in reloaded.entries()] == before
+
+    with pytest.raises(TypeError, match="must be strings"):
+        write_run_report("gamma", {"tool": 7}, base_dir=tmp_path)
+    assert written.latest("gamma") is None